@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Aggregate cube benchmark: rollup lookups vs GROUP BY over the SQLite export.
+
+Builds an `AggregateCube` from the records and times the dashboard's
+questions (doctors per country/state/specialty/status, and coverage per
+country) as cube lookups and as the queries over an `export_sqlite()`
+database they replace, checking both give the same counts. Then updates
+the cube for a later run with ``--churn`` of the records changed (through
+the change-feed hook) and checks it equals a cube rebuilt from scratch.
+
+Usage:
+    python benchmarks/bench_aggregates.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.bench_snapshot_diff import next_run
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+from src.normalizers import diff
+from src.normalizers.aggregates import ALL, AggregateCube
+from src.normalizers.normalize import normalize_batch
+
+SQL_BY_SPECIALTY = """
+    SELECT count(*) FROM doctor_specialty_codes s JOIN doctors d ON d.id = s.doctor_id
+    WHERE s.code = ? AND s.state_region = ? AND d.source_country = ? AND d.status = ?
+"""
+SQL_BY_STATE = """
+    SELECT count(*) FROM doctors
+    WHERE source_country = ? AND coalesce(state_region, '') = ? AND status = ?
+"""
+SQL_COVERAGE = """
+    SELECT source_country, count(*), sum(status = 'ACTIVE') FROM doctors GROUP BY source_country
+"""
+
+
+def timed(fn, queries):
+    """Per-query latencies (µs) and results."""
+    times, results = [], []
+    for args in queries:
+        start = time.perf_counter()
+        results.append(fn(*args))
+        times.append((time.perf_counter() - start) * 1e6)
+    return times, results
+
+
+def pct(times, p):
+    return statistics.quantiles(times, n=100)[p - 1] if len(times) > 1 else times[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    parser.add_argument("--churn", type=float, default=0.01)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    previous = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+    current = next_run(previous, args.churn)
+
+    print(f"\n=== Aggregate cube ({len(current):,} records, {args.churn:.1%} churn) ===\n")
+    start = time.perf_counter()
+    cube = AggregateCube().update(previous)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    rows = len(cube.cube())
+    rollup = time.perf_counter() - start
+    print(f"  build from records    {build:>7.3f}s  + rollups {rollup:.3f}s ({rows:,} rows)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+        db = export.export_sqlite(previous, "aggregates.db")
+        conn = sqlite3.connect(db)
+
+        rng = random.Random(3)
+        keys = [k for k in cube.cube() if ALL not in k]
+        picks = [rng.choice(keys) for _ in range(args.queries)]
+        by_specialty = [(c, s, code, t) for c, s, code, t in picks if code != "UNMAPPED"]
+        by_state = [(c, s, t) for c, s, _, t in picks]
+
+        print(f"\n  {'query':<36}{'cube p50':>10}{'p99':>10}{'SQLite p50':>12}{'p99':>10}")
+        checks = []
+        for label, cube_fn, cube_args, sql, sql_args in (
+            ("country × state × specialty × status",
+             cube.count, by_specialty, SQL_BY_SPECIALTY,
+             [(code, s, c, t) for c, s, code, t in by_specialty]),
+            ("country × state × status",
+             lambda c, s, t: cube.count(c, s, ALL, t), by_state, SQL_BY_STATE, by_state),
+        ):
+            cube_times, cube_results = timed(cube_fn, cube_args)
+            sql_times, sql_results = timed(
+                lambda *a: conn.execute(sql, a).fetchone()[0], sql_args
+            )
+            checks.append(cube_results == sql_results)
+            print(f"  {label:<36}{pct(cube_times, 50):>8.1f}µs{pct(cube_times, 99):>8.1f}µs"
+                  f"{pct(sql_times, 50):>10.0f}µs{pct(sql_times, 99):>8.0f}µs")
+
+        cube_times, (coverage,) = timed(lambda: cube.coverage({}), [()])
+        sql_times, (grouped,) = timed(lambda: conn.execute(SQL_COVERAGE).fetchall(), [()])
+        checks.append(sorted(grouped) == [
+            (r["country"], r["collected"], r["active"]) for r in coverage
+        ])
+        print(f"  {'coverage per country':<36}{cube_times[0]:>8.1f}µs{'':>10}"
+              f"{sql_times[0] / 1e3:>10.1f}ms  (full GROUP BY scan)")
+        conn.close()
+    print(f"\n  cube counts == SQLite counts: {all(checks)}\n")
+
+    # The change feed's merge join hands the cube only the changed records
+    pairs = []
+    for _ in diff.diff_sorted(
+        diff.sort_by_key(previous), diff.sort_by_key(current),
+        lambda old, new: pairs.append((old, new)),
+    ):
+        pass
+    apply = diff._cube_updater(cube)
+    start = time.perf_counter()
+    for old, new in pairs:
+        apply(old, new)
+    cube.cube()
+    update = time.perf_counter() - start
+    start = time.perf_counter()
+    rebuilt = AggregateCube().update(current)
+    rebuilt.cube()
+    rebuild = time.perf_counter() - start
+    print(f"  update from {len(pairs):,} changes {update:>7.3f}s vs rebuild {rebuild:.3f}s "
+          f"(with rollups); equal: {cube.cube() == rebuilt.cube()}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Entity resolution benchmark: blocking-based clustering time vs dataset size.
+
+Generates physicians from a large synthetic name space and re-lists a share
+of them in a second registry with realistic variations (accents dropped,
+surnames swapped, Portuguese/Spanish spellings). Reports time per record at
+each size, plus precision/recall of the clusters against the injected
+duplicates.
+
+Usage:
+    python benchmarks/bench_entities.py --sizes 100000,250000,500000,1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SPECIALTIES
+from src.collectors.compact import CompactRecord
+from src.normalizers.entities import resolve_entities
+
+SYLLABLES = ["ma", "ri", "so", "za", "al", "ve", "lo", "pe", "ga", "ro", "nu", "de",
+             "ca", "ta", "li", "mi", "ne", "be", "go", "fe", "xa", "que", "llo", "ña"]
+ENDINGS = ["", "s", "z", "es", "ez", "a", "o", "ira", "eira", "ales"]
+# (es, pt) spellings for the re-listed copies
+VARIANTS = [("z", "s"), ("ñ", "nh"), ("ll", "lh"), ("í", "i"), ("á", "a")]
+
+
+def _word(rng: random.Random) -> str:
+    return ("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+            + rng.choice(ENDINGS)).title()
+
+
+def make_population(n: int, relist_rate: float = 0.05, seed: int = 7):
+    """(records, true pairs) with ~relist_rate of people in both registries."""
+    rng = random.Random(seed)
+    firsts = [_word(rng) for _ in range(2_000)]
+    surnames = [_word(rng) for _ in range(20_000)]
+    records, truth = [], set()
+
+    for i in range(n):
+        name = [rng.choice(firsts)] + rng.sample(surnames, rng.randint(1, 2))
+        specialties = tuple(rng.sample(SPECIALTIES, rng.choice([0, 1, 1, 2])))
+        records.append(CompactRecord(
+            id=f"br-{i}", source_country="BR", source_registry="CFM",
+            license_number=f"CRM-SP {i}", full_name=" ".join(name), specialties=specialties,
+        ))
+        if rng.random() < relist_rate:
+            copy = [name[0]] + name[:0:-1]  # surnames in the other order
+            text = " ".join(copy)
+            for es, pt in VARIANTS:
+                text = text.replace(pt, es) if rng.random() < 0.5 else text
+            records.append(CompactRecord(
+                id=f"ar-{i}", source_country="AR", source_registry="REFEPS",
+                license_number=f"M.N. {i}", full_name=text, specialties=specialties,
+            ))
+            truth.add((f"BR:CRM-SP {i}", f"AR:M.N. {i}"))
+    rng.shuffle(records)
+    return records, truth
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100000,250000,500000,1000000")
+    args = parser.parse_args()
+
+    print("\n=== Entity resolution (blocking) ===\n")
+    for n in (int(s) for s in args.sizes.split(",")):
+        records, truth = make_population(n)
+        gc.collect()
+        start = time.perf_counter()
+        clusters = resolve_entities(records)
+        elapsed = time.perf_counter() - start
+
+        found = set()
+        for c in clusters:
+            keys = sorted(c.dedup_keys, key=lambda k: not k.startswith("BR:"))
+            found.update((a, b) for a in keys if a.startswith("BR:")
+                         for b in keys if b.startswith("AR:"))
+        hits = len(found & truth)
+        precision = hits / len(found) if found else 1.0
+        recall = hits / len(truth) if truth else 1.0
+        print(
+            f"  {len(records):>9,} records  {elapsed:>7.2f}s  "
+            f"{elapsed / len(records) * 1e6:>5.1f} µs/record  {len(clusters):>7,} clusters  "
+            f"precision {precision:.3f}  recall {recall:.3f}"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
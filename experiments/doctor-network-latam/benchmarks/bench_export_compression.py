@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Export compression benchmark: records/sec, peak memory and file size per format/codec.
+
+Runs `export_json()`, `export_jsonl()` and `export_csv()` uncompressed,
+gzip and (when ``zstandard`` is installed) zstd, against the previous
+exporters: a pretty JSON document built in memory, and ``model_dump()`` +
+``DictWriter`` per CSV row. Peak memory is the allocation high-water mark
+while exporting (tracemalloc) on top of the records already in memory; for
+the streaming exporters it stays flat as ``--records`` grows.
+
+Usage:
+    python benchmarks/bench_export_compression.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+from src.normalizers.normalize import normalize_batch
+from src.utils.compression import available_compressions
+
+LIST_COLUMNS = (
+    "specialties", "hospital_affiliations", "insurance_networks", "education", "languages",
+)
+
+
+def legacy_json(records, filename: str) -> Path:
+    path = export.EXPORTS_DIR / filename
+    data = [r.model_dump() for r in records]
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+    return path
+
+
+def legacy_csv(records, filename: str) -> Path:
+    path = export.EXPORTS_DIR / filename
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=export.CSV_FIELDS)
+        writer.writeheader()
+        for r in records:
+            row = r.model_dump()
+            for key in LIST_COLUMNS:
+                if isinstance(row.get(key), list):
+                    row[key] = "; ".join(row[key])
+            writer.writerow({k: row.get(k, "") for k in export.CSV_FIELDS})
+    return path
+
+
+def measure(label: str, write, records, baseline_size: int = 0) -> int:
+    gc.collect()
+    start = time.perf_counter()
+    path = write(records)
+    elapsed = time.perf_counter() - start
+    size = path.stat().st_size
+
+    gc.collect()
+    tracemalloc.start()
+    write(records)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ratio = f"({size / baseline_size:>6.1%})" if baseline_size else ""
+    print(
+        f"  {label:<24} {len(records) / elapsed:>10,.0f} records/s  "
+        f"peak {peak / 1e6:>8.1f} MB  file {size / 1e6:>7.1f} MB {ratio}"
+    )
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    records = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+
+    codecs = [None, *available_compressions()]
+    print(f"\n=== Export compression ({len(records):,} records; codecs: "
+          f"{', '.join(available_compressions())}) ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+
+        print("\n  JSON (file size vs the previous pretty document)")
+        base = measure("previous (pretty)", lambda r: legacy_json(r, "legacy.json"), records)
+        for codec in codecs:
+            measure(f"json {codec or 'plain'}",
+                    lambda r: export.export_json(r, "out.json", compression=codec), records, base)
+        for codec in codecs:
+            measure(f"jsonl {codec or 'plain'}",
+                    lambda r: export.export_jsonl(r, "out.jsonl", compression=codec), records, base)
+
+        print("\n  CSV (file size vs the previous DictWriter output)")
+        base = measure("previous (DictWriter)", lambda r: legacy_csv(r, "legacy.csv"), records)
+        for codec in codecs:
+            measure(f"csv {codec or 'plain'}",
+                    lambda r: export.export_csv(r, "out.csv", compression=codec), records, base)
+    print()
+
+
+if __name__ == "__main__":
+    main()
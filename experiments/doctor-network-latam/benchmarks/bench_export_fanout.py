@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Export fan-out benchmark: json + csv + sqlite one after the other vs in one pass.
+
+Times each exporter on its own (`export_json()`, `export_csv()`,
+`export_sqlite()`), their sum, and `fan_out()` writing all three from one
+pass with a thread per sink. The fan-out saves the repeated record → dict
+conversions; the JSON and CSV encoders hold the GIL, so even with a core
+per sink they take turns, and only SQLite's statement execution and the
+file writes overlap them. Prints the machine's CPU count next to the
+results.
+
+Usage:
+    python benchmarks/bench_export_fanout.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+from src.exporters.fanout import fan_out, make_sinks
+from src.normalizers.normalize import normalize_batch
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    records = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+
+    print(f"\n=== Export fan-out ({len(records):,} records, {os.cpu_count()} CPUs) ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+        single = {
+            "json": timed(export.export_json, records, "single.json"),
+            "csv": timed(export.export_csv, records, "single.csv"),
+            "sqlite": timed(export.export_sqlite, records),
+        }
+        for name, seconds in single.items():
+            print(f"  {name:<26} {seconds:>7.2f}s  {len(records) / seconds:>10,.0f} records/s")
+        sequential = sum(single.values())
+        print(f"  {'sequential (sum)':<26} {sequential:>7.2f}s")
+
+        fanned = timed(fan_out, records, make_sinks(["json", "csv", "sqlite"]))
+        slowest = max(single.values())
+        print(
+            f"  {'fan-out, one pass':<26} {fanned:>7.2f}s  "
+            f"{sequential / fanned:.2f}x vs sequential, {fanned / slowest:.2f}x the slowest sink"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+External dedup benchmark: in-memory `normalize_batch` vs spill-to-disk dedup.
+
+Checks that every memory budget returns the same records as
+`normalize_batch()`, then reports time and peak traced memory of producing
+the unique stream (the external path is consumed without materializing it,
+as a streaming writer would).
+
+Usage:
+    python benchmarks/bench_external_dedup.py --records 1000000 --budgets 64,256
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.normalizers.external import iter_normalized_external, normalize_batch_external
+from src.normalizers.normalize import normalize_batch
+
+
+def consume(iterator) -> int:
+    count = 0
+    for _ in iterator:
+        count += 1
+    return count
+
+
+def measure(label: str, fn, records) -> None:
+    gc.collect()
+    start = time.perf_counter()
+    fn(records)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    fn(records)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:<22} {elapsed:>7.2f}s  {len(records) / elapsed:>10,.0f} records/s  "
+        f"peak {peak / 1e6:>8.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--budgets", default="16,64,256", help="Memory budgets in MB (comma-separated)")
+    args = parser.parse_args()
+
+    budgets = [float(b) for b in args.budgets.split(",")]
+    records = [CompactRecord.from_dict(r) for r in make_raw_records(args.records)]
+    print(f"\n=== External dedup ({args.records:,} records) ===\n")
+
+    expected = normalize_batch(records)
+    for mb in budgets:
+        if normalize_batch_external(records, memory_budget_mb=mb) != expected:
+            raise SystemExit(f"External dedup ({mb:g} MB) differs from normalize_batch()")
+    print(f"  outputs identical ({len(expected):,} unique records)\n")
+    del expected
+
+    measure("in-memory dict", normalize_batch, records)
+    for mb in budgets:
+        measure(
+            f"external {mb:g} MB",
+            lambda rs: consume(iter_normalized_external(rs, memory_budget_mb=mb)),
+            records,
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
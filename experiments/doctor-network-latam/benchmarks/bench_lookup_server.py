@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Lookup server load test: p50/p99 latency of id, license and name-prefix lookups.
+
+Loads a snapshot into a `LookupService` and times, first in process
+(index only, uncached), then over HTTP against a `LookupServer` on
+localhost: for each ``--clients`` count, that many threads, each on a
+keep-alive connection, send a mix of lookups where ``--hot`` of them
+repeat a small hot set (served from the LRU cache). Halfway through the
+last run the snapshot is reloaded and hot-swapped; every request must
+still succeed. The clients run in the same process as the server, so on
+few cores they compete with it for the CPU. ``--snapshot`` load-tests a
+real normalized snapshot instead of synthetic records.
+
+Usage:
+    python benchmarks/bench_lookup_server.py --records 580000 --clients 1,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.normalizers.normalize import normalize_batch
+from src.service.lookup import LookupServer, LookupService
+from src.utils.serialize import write_records
+
+
+def percentiles(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3
+    print(f"  {label:<28} {len(latencies):>7,} queries  p50 {p50:>7.3f} ms  "
+          f"p99 {p99:>7.3f} ms")
+
+
+def make_queries(records, n: int, hot: float, seed: int = 7) -> list[tuple[str, str]]:
+    """(kind, path) lookups; ``hot`` of them drawn from 200 recurring ones."""
+    rng = random.Random(seed)
+
+    def query(r) -> tuple[str, str]:
+        kind = rng.choice(("id", "license", "name"))
+        if kind == "id":
+            return kind, f"/doctors/{r.id}"
+        if kind == "license":
+            return kind, f"/license/{quote(r.license_number, safe='')}?country={r.source_country}"
+        # Typeahead input: a prefix of the first and last name words ("mari sant")
+        words = r.full_name.split()
+        return kind, f"/search?q={quote(words[0][:4] + ' ' + words[-1][:4])}&limit=20"
+
+    hot_set = [query(r) for r in rng.sample(records, 200)]
+    return [
+        rng.choice(hot_set) if rng.random() < hot else query(rng.choice(records))
+        for _ in range(n)
+    ]
+
+
+def client(port: int, queries, latencies: dict[str, list[float]], errors: list) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    for kind, path in queries:
+        start = time.perf_counter()
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        latencies[kind].append(time.perf_counter() - start)
+        if response.status != 200:
+            errors.append((response.status, path))
+    conn.close()
+
+
+def run_load(service, port: int, queries, clients: int, hot: float, swap: bool) -> None:
+    latencies: dict[str, list[float]] = {"id": [], "license": [], "name": []}
+    errors: list = []
+    threads = [
+        threading.Thread(target=client, args=(port, queries[i::clients], latencies, errors))
+        for i in range(clients)
+    ]
+    index = service.index
+    index.respond.cache_clear()  # each run starts cold
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    if swap:
+        while sum(map(len, latencies.values())) < len(queries) // 2:
+            time.sleep(0.01)
+        swap_start = time.perf_counter()
+        swapped = service.reload()
+        swap_time = time.perf_counter() - swap_start
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n  HTTP, {clients} keep-alive client(s), {hot:.0%} hot queries:")
+    for kind, label in (("id", "id"), ("license", "license"), ("name", "name prefix")):
+        percentiles(f"http: {label}", latencies[kind])
+    print(f"  {len(queries) / elapsed:,.0f} requests/s; "
+          f"cache hit rate {index.cache_stats()['hit_rate']:.1%}")
+    if swap:
+        print(f"  hot swap mid-run: {'ok' if swapped else 'FAILED'} in {swap_time:.2f}s "
+              f"(reload while serving)")
+    print(f"  failed requests: {len(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    parser.add_argument("--snapshot", type=Path, help="Normalized snapshot to load instead")
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--clients", default="1,8",
+                        help="Concurrent clients per run, comma-separated (default: 1,8)")
+    parser.add_argument("--hot", type=float, default=0.8,
+                        help="Share of queries repeating a hot set (default: 0.8)")
+    args = parser.parse_args()
+    args.clients = [int(c) for c in args.clients.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = args.snapshot
+        if snapshot is None:
+            raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+            snapshot = Path(tmp) / "doctors_all.json"
+            write_records(normalize_batch(CompactRecord.from_dict(r) for r in raw), snapshot)
+            del raw
+
+        start = time.perf_counter()
+        service = LookupService(snapshot)
+        load = time.perf_counter() - start
+        index = service.index
+        print(f"\n=== Lookup server ({len(index):,} records) ===\n")
+        print(f"  snapshot load + index build: {load:.2f}s\n")
+
+        # Index only, no cache or HTTP
+        rng = random.Random(3)
+        sample = rng.choices(index.records, k=min(args.queries, 5_000))
+        for label, fn in (
+            ("in process: id", lambda r: index.find_by_id(r.id)),
+            ("in process: license", lambda r: index.find_by_license(
+                r.license_number, r.source_country)),
+            ("in process: name prefix", lambda r: index.search_names(
+                r.full_name.split()[0][:4] + " " + r.full_name.split()[-1][:4])),
+        ):
+            latencies = []
+            for r in sample:
+                start = time.perf_counter()
+                fn(r)
+                latencies.append(time.perf_counter() - start)
+            percentiles(label, latencies)
+
+        queries = make_queries(index.records, args.queries, args.hot)
+        with LookupServer(service, port=0) as server:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            for clients in args.clients:
+                # Swap during the last (most loaded) run
+                run_load(service, server.server_port, queries, clients,
+                         args.hot, swap=clients == args.clients[-1])
+            server.shutdown()
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Memoization benchmark: normalize_batch with and without the normalizer caches.
+
+Reports CPU time, retained memory of the normalized output and cache hit
+rates. Uses synthetic records by default, or a country's raw files
+(e.g. a full-mode run) with --from-raw.
+
+Usage:
+    python benchmarks/bench_memoize.py --records 1000000
+    python benchmarks/bench_memoize.py --from-raw BR
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.normalizers import normalize as N
+
+CACHED = {
+    "normalize_status": N.normalize_status,
+    "_clean_specialty": N._clean_specialty,
+    "intern_value": N.intern_value,
+}
+
+# The pre-memoization behaviour: recompute every time, no interning
+UNCACHED = {
+    "normalize_status": N.normalize_status.__wrapped__,
+    "_clean_specialty": lambda s: (s.strip().title(), s.strip().title().lower()),
+    "intern_value": lambda v: v,
+}
+
+
+def run(label: str, funcs: dict, records: list) -> list:
+    for name, fn in funcs.items():
+        setattr(N, name, fn)
+    N.clear_normalization_caches()
+
+    gc.collect()
+    start = time.perf_counter()
+    N.normalize_batch(records)
+    elapsed = time.perf_counter() - start
+
+    N.clear_normalization_caches()
+    gc.collect()
+    tracemalloc.start()
+    out = N.normalize_batch(records)
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"  {label:<10} {elapsed:>7.2f}s  {len(records) / elapsed:>10,.0f} records/s  "
+        f"output {retained / 1e6:>8.1f} MB ({retained / max(len(out), 1):.0f} B/record)"
+    )
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--from-raw", metavar="CC", help="Use data/raw/<CC> instead of synthetic data")
+    args = parser.parse_args()
+
+    if args.from_raw:
+        records = list(N.iter_raw_records(args.from_raw, trusted=True, compact=True))
+    else:
+        records = [CompactRecord.from_dict(r) for r in make_raw_records(args.records)]
+    print(f"\n=== Normalizer memoization ({len(records):,} records) ===\n")
+
+    baseline = run("uncached", UNCACHED, records)
+    cached = run("cached", CACHED, records)
+    assert baseline == cached, "memoized normalizers changed the output"
+
+    print("\n  Cache hit rates:")
+    for label, s in N.normalization_cache_stats().items():
+        print(f"    {label:<10} {s['hit_rate']:>6.1%}  ({s['size']:,}/{s['maxsize']:,} entries)")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Fuzzy name search benchmark: trigram index vs exact match and linear scan.
+
+Indexes ``--names`` synthetic names (`make_names()`, a registry-sized
+vocabulary), then searches for variants of sampled names the way other
+registries write them: surname first with a comma, initials, titles,
+upper case without accents, a typo, a dropped particle or surname. Reports
+build / save / load time, query p50/p99, and recall@10 (the original name
+among the top 10) for the index vs exact ``full_name`` and search-key
+lookups, and the cost of scoring every name instead (``--scan-queries``).
+
+Usage:
+    python benchmarks/bench_name_index.py --names 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_names
+from src.normalizers.name_index import NameTrigramIndex, search_key, similarity
+
+
+def strip_accents(text: str) -> str:
+    nfkd = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in nfkd if not unicodedata.combining(c))
+
+
+def variant(name: str, rng: random.Random) -> str:
+    """How another registry might write ``name`` (one or two changes)."""
+    words = name.split()
+    for change in rng.sample(["reorder", "initial", "upper", "typo", "drop", "title"], 2):
+        if change == "reorder" and len(words) > 1:
+            words = [words[-1] + ","] + words[:-1]
+        elif change == "initial" and len(words[0]) > 2:
+            words[0] = words[0][0] + "."
+        elif change == "upper":
+            words = [strip_accents(w).upper() for w in words]
+        elif change == "typo":
+            i = max(range(len(words)), key=lambda k: len(words[k]))
+            w = words[i]
+            j = rng.randrange(1, len(w) - 1) if len(w) > 2 else 0
+            words[i] = w[:j] + rng.choice("aeiourstln") + w[j + 1:]
+        elif change == "drop" and len(words) > 2:
+            del words[rng.randrange(1, len(words))]
+        elif change == "title":
+            words.insert(0, rng.choice(["Dr.", "Dra.", "DR"]))
+    return " ".join(words)
+
+
+def percentiles(label: str, latencies: list[float], extra: str = "") -> None:
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3
+    print(f"  {label:<26} {len(latencies):>6,} queries  p50 {p50:>8.3f} ms  "
+          f"p99 {p99:>8.3f} ms{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--scan-queries", type=int, default=3,
+                        help="Queries answered by scoring every name (0 to skip)")
+    parser.add_argument("--threshold", type=float, default=0.3)
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+    print(f"\n=== Trigram name index ({len(names):,} names) ===\n")
+
+    start = time.perf_counter()
+    index = NameTrigramIndex()
+    for i, name in enumerate(names):
+        index.add(str(i), name)
+    build = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "names.db"
+        start = time.perf_counter()
+        index.save(path)
+        save = time.perf_counter() - start
+        start = time.perf_counter()
+        index = NameTrigramIndex.load(path)
+        load = time.perf_counter() - start
+        size = path.stat().st_size
+    print(f"  build {build:.1f}s, save {save:.1f}s, load {load:.1f}s; "
+          f"{len(index.postings):,} trigrams, {size / 1e6:.0f} MB on disk\n")
+
+    rng = random.Random(7)
+    targets = rng.sample(range(len(names)), args.queries)
+    queries = [variant(names[i], rng) for i in targets]
+
+    # Exact lookups, by full_name and by folded search key
+    by_name: dict[str, list[int]] = {}
+    for i, name in enumerate(names):
+        by_name.setdefault(name, []).append(i)
+    exact_hits = sum(t in by_name.get(q, ()) for q, t in zip(queries, targets))
+    key_hits = sum(search_key(q) == index.keys[t] for q, t in zip(queries, targets))
+
+    latencies, hits = [], 0
+    for query, target in zip(queries, targets):
+        start = time.perf_counter()
+        matches = index.search(query, 10, args.threshold)
+        latencies.append(time.perf_counter() - start)
+        # Names identical to the target after folding are equally right
+        hits += search_key(names[target]) in {m.search_key for m in matches}
+    percentiles("trigram index", latencies,
+                f"  recall@10 {hits / len(queries):.1%}")
+    print(f"  {'exact full_name':<26} {len(queries):>6,} queries  "
+          f"recall {exact_hits / len(queries):.1%}")
+    print(f"  {'exact search key':<26} {len(queries):>6,} queries  "
+          f"recall {key_hits / len(queries):.1%}")
+
+    if args.scan_queries:
+        keys = index.keys
+        latencies = []
+        for query in queries[:args.scan_queries]:
+            start = time.perf_counter()
+            q = search_key(query)
+            sorted((similarity(q, k) for k in keys), reverse=True)[:10]
+            latencies.append(time.perf_counter() - start)
+        percentiles("linear scan (every name)", latencies)
+
+    print("\n  examples:")
+    for query in queries[:3]:
+        top = index.search(query, 3, args.threshold)
+        print(f"    {query!r} → " + ", ".join(f"{m.search_key} ({m.score:.2f})" for m in top))
+    print()
+
+
+if __name__ == "__main__":
+    main()
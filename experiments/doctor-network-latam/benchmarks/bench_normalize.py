@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Normalization benchmark: per-record `normalize_batch` vs columnar batches.
+
+Checks that both paths return identical records, then reports records/sec.
+
+Usage:
+    python benchmarks/bench_normalize.py --records 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.normalizers.columnar import normalize_batch_columnar
+from src.normalizers.normalize import normalize_batch
+
+
+def timed(label: str, fn, records, baseline: float | None = None):
+    gc.collect()
+    start = time.perf_counter()
+    out = fn(records)
+    elapsed = time.perf_counter() - start
+    speedup = f"  {baseline / elapsed:>5.1f}x" if baseline else ""
+    print(f"  {label:<22} {elapsed:>7.2f}s  {len(records) / elapsed:>10,.0f} records/s{speedup}")
+    return out, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = [CompactRecord.from_dict(r) for r in make_raw_records(args.records)]
+    print(f"\n=== Normalization ({args.records:,} records) ===\n")
+
+    expected, base = timed("per-record", normalize_batch, records)
+    got, _ = timed("columnar", normalize_batch_columnar, records, base)
+
+    if got != expected:
+        mismatch = next(i for i, (a, b) in enumerate(zip(got, expected)) if a != b)
+        raise SystemExit(f"Columnar output differs from per-record output at {mismatch}")
+    print(f"\n  outputs identical ({len(got):,} unique records)\n")
+
+
+if __name__ == "__main__":
+    main()
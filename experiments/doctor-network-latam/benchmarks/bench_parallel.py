@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Parallel normalization benchmark: sharded multi-process scaling from 1 to N workers.
+
+Checks every worker count against `normalize_batch()` output, then reports
+records/sec and speedup over the single-process baseline.
+
+Usage:
+    python benchmarks/bench_parallel.py --records 1000000 --max-workers 8
+    python benchmarks/bench_parallel.py --columnar
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.normalizers.normalize import normalize_batch
+from src.normalizers.parallel import normalize_batch_parallel
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """1, 2, 4, ... up to and including max_workers."""
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--columnar", action="store_true", help="Columnar normalization per shard")
+    args = parser.parse_args()
+
+    records = [CompactRecord.from_dict(r) for r in make_raw_records(args.records)]
+    mode = "columnar" if args.columnar else "per-record"
+    print(
+        f"\n=== Parallel normalization ({args.records:,} records, {mode} shards, "
+        f"{os.cpu_count()} CPUs) ===\n"
+    )
+
+    expected = normalize_batch(records)
+    base = None
+    for workers in worker_counts(args.max_workers):
+        gc.collect()
+        start = time.perf_counter()
+        if workers == 1:
+            out = normalize_batch(records)
+        else:
+            out = normalize_batch_parallel(records, workers=workers, columnar=args.columnar)
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        if out != expected:
+            raise SystemExit(f"{workers}-worker output differs from normalize_batch()")
+        print(
+            f"  {workers:>3} workers  {elapsed:>7.2f}s  "
+            f"{len(records) / elapsed:>10,.0f} records/s  {base / elapsed:>5.2f}x"
+        )
+
+    print(f"\n  outputs identical ({len(expected):,} unique records)\n")
+
+
+if __name__ == "__main__":
+    main()
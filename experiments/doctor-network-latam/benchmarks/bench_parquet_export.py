@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Parquet export benchmark: write time, size on disk and pandas load time vs CSV.
+
+Exports the same records with `export_csv()` and `export_parquet()`, then
+loads each the way an analyst would: ``pd.read_csv()`` followed by
+splitting the "; "-joined list columns back into lists, against a single
+``pd.read_parquet()`` of the partitioned dataset (lists, categoricals and
+timestamps come back typed). Also times a filtered load of one country,
+which Parquet serves by skipping partitions. Needs pyarrow.
+
+Usage:
+    python benchmarks/bench_parquet_export.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+from src.exporters.parquet import export_parquet, parquet_available
+from src.normalizers.normalize import normalize_batch
+
+CSV_LIST_COLUMNS = ("specialties", "hospital_affiliations", "insurance_networks")
+
+
+def load_csv(path: Path, country: str = None):
+    import pandas as pd
+
+    df = pd.read_csv(path, keep_default_na=False)
+    if country:
+        df = df[df["source_country"] == country]
+    for column in CSV_LIST_COLUMNS:
+        df[column] = [v.split("; ") if v else [] for v in df[column]]
+    return df
+
+
+def load_parquet(path: Path, country: str = None):
+    import pandas as pd
+
+    filters = [("source_country", "==", country)] if country else None
+    return pd.read_parquet(path, filters=filters)
+
+
+def size_on_disk(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def timed(fn, *args, repeat: int = 1):
+    """Result and best time of ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    parser.add_argument("--country", default="BR", help="Country for the filtered load")
+    parser.add_argument("--repeat", type=int, default=3, help="Loads per format (best is kept)")
+    args = parser.parse_args()
+
+    if not parquet_available():
+        sys.exit("bench_parquet_export.py needs pyarrow (pip install pyarrow)")
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    records = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+
+    print(f"\n=== Parquet vs CSV ({len(records):,} records) ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+        csv_path, csv_write = timed(export.export_csv, records, "bench.csv")
+        pq_path, pq_write = timed(export_parquet, records, "bench.parquet")
+
+        n = args.repeat
+        _, csv_load = timed(load_csv, csv_path, repeat=n)
+        _, pq_load = timed(load_parquet, pq_path, repeat=n)
+        subset, csv_filtered = timed(load_csv, csv_path, args.country, repeat=n)
+        _, pq_filtered = timed(load_parquet, pq_path, args.country, repeat=n)
+
+        csv_size, pq_size = size_on_disk(csv_path), size_on_disk(pq_path)
+        print(f"  {'':<26} {'CSV':>10} {'Parquet':>10}")
+        print(f"  {'write':<26} {csv_write:>9.2f}s {pq_write:>9.2f}s")
+        print(f"  {'size on disk':<26} {csv_size / 1e6:>7.1f} MB {pq_size / 1e6:>7.1f} MB"
+              f"  ({pq_size / csv_size:.1%})")
+        print(f"  {'load (typed lists)':<26} {csv_load:>9.2f}s {pq_load:>9.2f}s"
+              f"  ({csv_load / pq_load:.1f}x faster)")
+        print(f"  {f'load {args.country} only ({len(subset):,})':<26} "
+              f"{csv_filtered:>9.2f}s {pq_filtered:>9.2f}s"
+              f"  ({csv_filtered / pq_filtered:.1f}x faster)")
+    print()
+
+
+if __name__ == "__main__":
+    main()
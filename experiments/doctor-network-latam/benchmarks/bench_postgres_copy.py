@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Postgres COPY export benchmark: rows/sec writing and verifying the chunk files.
+
+Writes the records with `export_postgres()` and parses the output back with
+`verify_copy_export()` (checksums, escapes, arrays, JSON, and a field-by-field
+comparison with the records). Needs no database; the load itself is a
+``COPY`` per chunk. Defaults to the ~900k doctors the platform ingests.
+
+Usage:
+    python benchmarks/bench_postgres_copy.py --records 900000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+from src.exporters.postgres import CHUNK_ROWS, export_postgres, verify_copy_export
+from src.normalizers.normalize import normalize_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=900_000)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    records = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+
+    print(f"\n=== Postgres COPY export ({len(records):,} records) ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+        start = time.perf_counter()
+        out = export_postgres(records, "pg", args.chunk_rows)
+        write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = verify_copy_export(out, records)
+        verify = time.perf_counter() - start
+
+        chunks = sorted(out.glob("*.copy"))
+        size = sum(p.stat().st_size for p in chunks)
+        print(f"  write   {write:>7.2f}s  {len(records) / write:>10,.0f} rows/s  "
+              f"{len(chunks)} chunks, {size / 1e6:.1f} MB")
+        print(f"  verify  {verify:>7.2f}s  {rows / verify:>10,.0f} rows/s  (parse + compare)")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: bytes per record for DoctorRecord vs CompactRecord.
+
+Usage:
+    python benchmarks/bench_record_memory.py --records 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.base import DoctorRecord
+from src.collectors.compact import CompactRecord
+
+
+def measure(label: str, build, rows: list[dict]) -> None:
+    # Time without tracing (tracemalloc slows allocation-heavy code ~5x)
+    gc.collect()
+    start = time.perf_counter()
+    objs = build(rows)
+    elapsed = time.perf_counter() - start
+    del objs
+
+    gc.collect()
+    tracemalloc.start()
+    objs = build(rows)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_record = current / len(rows)
+    rate = len(rows) / elapsed
+    print(f"  {label:<28} {per_record:>8.0f} B/record  {rate:>10,.0f} records/s")
+    del objs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rows = make_raw_records(args.records)
+    print(f"\n=== Record memory ({args.records:,} records) ===\n")
+    measure("DoctorRecord (validated)", lambda rs: [DoctorRecord(**r) for r in rs], rows)
+    measure("CompactRecord.from_dict", lambda rs: [CompactRecord.from_dict(r) for r in rs], rows)
+    print()
+
+
+if __name__ == "__main__":
+    main()
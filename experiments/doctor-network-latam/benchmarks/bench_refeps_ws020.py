@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+REFEPS collection benchmark: WS020 SOAP path vs HTML scraper on a mock service.
+
+Serves ``--records`` synthetic professionals spread over the 24
+jurisdictions from an in-process mock of SISA (``httpx.MockTransport``,
+each response delayed ``--latency-ms``): a WS020 WSDL and SOAP endpoint
+(``PAGE_SIZE`` per call) and the public HTML search (``--html-page-size``
+rows per page). Runs `ArgentinaREFEPSCollector.collect_full()` once with
+WS020 credentials and once without (the scraper), with the rate limit
+lifted, and reports requests, wall time and records/s for each, the time
+the same requests need at the registry's real rate limit, and whether both
+paths collected the same records. A last run answers one jurisdiction
+with a SOAP fault to check it is collected through the HTML fallback.
+
+Usage:
+    python benchmarks/bench_refeps_ws020.py --records 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import html
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+from lxml import etree
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SPECIALTIES, make_names
+from src.collectors import base, sisa_ws020
+from src.collectors.argentina_refeps import ArgentinaREFEPSCollector
+
+WS_URL = ArgentinaREFEPSCollector.WS_URL
+NS = "urn:sisa:ws020"
+USER, PASSWORD = "bench", "secret"
+
+WSDL = f"""<?xml version="1.0" encoding="utf-8"?>
+<definitions xmlns="http://schemas.xmlsoap.org/wsdl/"
+    xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:tns="{NS}" targetNamespace="{NS}">
+  <types>
+    <xsd:schema targetNamespace="{NS}">
+      <xsd:element name="buscarProfesionales">
+        <xsd:complexType><xsd:sequence>
+          <xsd:element name="usuario" type="xsd:string"/>
+          <xsd:element name="clave" type="xsd:string"/>
+          <xsd:element name="jurisdiccion" type="xsd:string" minOccurs="0"/>
+          <xsd:element name="apellido" type="xsd:string" minOccurs="0"/>
+          <xsd:element name="pagina" type="xsd:int"/>
+          <xsd:element name="registros" type="xsd:int"/>
+        </xsd:sequence></xsd:complexType>
+      </xsd:element>
+      <xsd:complexType name="Profesional"><xsd:sequence>
+        <xsd:element name="apellido" type="xsd:string"/>
+        <xsd:element name="nombre" type="xsd:string"/>
+        <xsd:element name="matricula" type="xsd:string"/>
+        <xsd:element name="profesion" type="xsd:string"/>
+        <xsd:element name="especialidades"><xsd:complexType><xsd:sequence>
+          <xsd:element name="especialidad" type="xsd:string"
+              minOccurs="0" maxOccurs="unbounded"/>
+        </xsd:sequence></xsd:complexType></xsd:element>
+        <xsd:element name="jurisdiccion" type="xsd:string"/>
+        <xsd:element name="estado" type="xsd:string"/>
+      </xsd:sequence></xsd:complexType>
+      <xsd:element name="buscarProfesionalesResponse">
+        <xsd:complexType><xsd:sequence>
+          <xsd:element name="total" type="xsd:int"/>
+          <xsd:element name="pagina" type="xsd:int"/>
+          <xsd:element name="profesional" type="tns:Profesional"
+              minOccurs="0" maxOccurs="unbounded"/>
+        </xsd:sequence></xsd:complexType>
+      </xsd:element>
+    </xsd:schema>
+  </types>
+  <message name="buscarProfesionalesRequest">
+    <part name="parameters" element="tns:buscarProfesionales"/>
+  </message>
+  <message name="buscarProfesionalesResponse">
+    <part name="parameters" element="tns:buscarProfesionalesResponse"/>
+  </message>
+  <portType name="WS020PortType">
+    <operation name="buscarProfesionales">
+      <input message="tns:buscarProfesionalesRequest"/>
+      <output message="tns:buscarProfesionalesResponse"/>
+    </operation>
+  </portType>
+  <binding name="WS020Binding" type="tns:WS020PortType">
+    <soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>
+    <operation name="buscarProfesionales">
+      <soap:operation soapAction="{NS}#buscarProfesionales"/>
+      <input><soap:body use="literal"/></input>
+      <output><soap:body use="literal"/></output>
+    </operation>
+  </binding>
+  <service name="WS020">
+    <port name="WS020Port" binding="tns:WS020Binding">
+      <soap:address location="{WS_URL}"/>
+    </port>
+  </service>
+</definitions>
+""".encode("utf-8")
+
+ENVELOPE = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<soap-env:Envelope xmlns:soap-env="http://schemas.xmlsoap.org/soap/envelope/">'
+    "<soap-env:Body>{}</soap-env:Body></soap-env:Envelope>"
+)
+FAULT = ENVELOPE.format(
+    "<soap-env:Fault><faultcode>soap-env:Server</faultcode>"
+    "<faultstring>{}</faultstring></soap-env:Fault>"
+)
+HTML_PAGE = (
+    "<html><body><table class=\"resultados\">"
+    "<tr><th>Nombre</th><th>Matrícula</th><th>Profesión</th><th>Jurisdicción</th></tr>"
+    "{}</table></body></html>"
+)
+
+
+class MockSisa:
+    """WS020 and the HTML search over the same professionals, pre-rendered."""
+
+    def __init__(self, n: int, html_page_size: int, latency: float, seed: int = 7):
+        rng = random.Random(seed)
+        provinces = ArgentinaREFEPSCollector.PROVINCES
+        weights = [rng.uniform(0.2, 3) for _ in provinces]
+        self.xml: dict[str, list[bytes]] = {p: [] for p in provinces}
+        self.rows: dict[str, list[bytes]] = {p: [] for p in provinces}
+        self.expected = set()
+        for i, name in enumerate(make_names(n, seed)):
+            province = rng.choices(provinces, weights)[0]
+            nombre, _, apellido = name.partition(" ")
+            matricula = f"MN {100000 + i}"
+            specialties = rng.sample(SPECIALTIES[9:], rng.choice([1, 1, 2]))
+            especialidades = "".join(
+                f"<especialidad>{html.escape(s)}</especialidad>" for s in specialties
+            )
+            self.xml[province].append((
+                f"<profesional><apellido>{html.escape(apellido)}</apellido>"
+                f"<nombre>{html.escape(nombre)}</nombre><matricula>{matricula}</matricula>"
+                f"<profesion>Médico</profesion>"
+                f"<especialidades>{especialidades}</especialidades>"
+                f"<jurisdiccion>{province}</jurisdiccion><estado>Habilitado</estado>"
+                f"</profesional>"
+            ).encode("utf-8"))
+            self.rows[province].append((
+                f"<tr><td>{html.escape(name)}</td><td>{matricula}</td>"
+                f"<td>{html.escape(', '.join(specialties))}</td><td>{province}</td></tr>"
+            ).encode("utf-8"))
+            self.expected.add((matricula, name, tuple(specialties), province))
+        self.html_page_size = html_page_size
+        self.latency = latency
+        self.failing: set[str] = set()
+        self.requests: Counter = Counter()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.latency)
+        url = urlsplit(str(request.url))
+        if request.method == "GET" and url.query == "wsdl":
+            self.requests["wsdl"] += 1
+            return httpx.Response(200, content=WSDL, headers={"Content-Type": "text/xml"})
+        if request.method == "POST":
+            self.requests["soap"] += 1
+            return self.soap(etree.fromstring(request.content))
+        self.requests["html"] += 1
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        rows = self.rows.get(query.get("jurisdiccion"), [])
+        start = (int(query.get("pagina", 1)) - 1) * self.html_page_size
+        page = b"".join(rows[start:start + self.html_page_size]).decode("utf-8")
+        return httpx.Response(200, text=HTML_PAGE.format(page))
+
+    def soap(self, envelope) -> httpx.Response:
+        fields = {etree.QName(e).localname: e.text or "" for e in envelope.iter()}
+        if (fields.get("usuario"), fields.get("clave")) != (USER, PASSWORD):
+            return self.fault("Usuario o clave incorrectos")
+        province = fields.get("jurisdiccion", "")
+        if province in self.failing:
+            return self.fault("Servicio no disponible")
+        items = self.xml.get(province, [])
+        size = int(fields["registros"])
+        start = (int(fields["pagina"]) - 1) * size
+        body = (
+            f'<ns:buscarProfesionalesResponse xmlns:ns="{NS}">'
+            f"<total>{len(items)}</total><pagina>{fields['pagina']}</pagina>"
+        ).encode("utf-8") + b"".join(items[start:start + size])
+        return httpx.Response(
+            200, content=ENVELOPE.encode("utf-8").replace(
+                b"{}", body + b"</ns:buscarProfesionalesResponse>"
+            ),
+            headers={"Content-Type": "text/xml; charset=utf-8"},
+        )
+
+    def fault(self, message: str) -> httpx.Response:
+        return httpx.Response(500, text=FAULT.format(message),
+                              headers={"Content-Type": "text/xml; charset=utf-8"})
+
+
+async def collect(mock: MockSisa, credentials: bool) -> tuple[list, float]:
+    if credentials:
+        os.environ.update({sisa_ws020.USER_ENV: USER, sisa_ws020.PASSWORD_ENV: PASSWORD})
+    else:
+        os.environ.pop(sisa_ws020.USER_ENV, None)
+        os.environ.pop(sisa_ws020.PASSWORD_ENV, None)
+    collector = ArgentinaREFEPSCollector({"rate_limit_rpm": 60, "api_url": WS_URL})
+    collector.logger.setLevel(logging.WARNING)  # no per-province progress lines
+    sisa_ws020.logger.setLevel(logging.WARNING)
+    await collector.client.client.aclose()
+    collector.client.client = httpx.AsyncClient(transport=httpx.MockTransport(mock.handle))
+    collector.client.interval = 0.0  # measure the collector, not the rate limit
+    mock.requests.clear()
+    start = time.perf_counter()
+    records = await collector.collect_full()
+    elapsed = time.perf_counter() - start
+    await collector.client.close()
+    return records, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--html-page-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0,
+                        help="Mock service response delay (default: 50)")
+    parser.add_argument("--rpm", type=int, default=60,
+                        help="Registry rate limit for the projected times (default: 60)")
+    args = parser.parse_args()
+
+    mock = MockSisa(args.records, args.html_page_size, args.latency_ms / 1e3)
+    print(f"\n=== REFEPS collection ({args.records:,} professionals, "
+          f"{args.latency_ms:.0f} ms latency) ===\n")
+    print(f"  {'path':<22}{'requests':>10}{'wall':>10}{'records/s':>12}"
+          f"{'at ' + str(args.rpm) + ' rpm':>14}  same records")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base.DATA_DIR = Path(tmp)
+        sisa_ws020.WSDL_CACHE_DIR = Path(tmp) / "cache"
+        for label, credentials in (("WS020 (SOAP)", True), ("HTML scraper", False)):
+            records, elapsed = asyncio.run(collect(mock, credentials))
+            requests = sum(mock.requests.values())
+            got = {(r.license_number, r.full_name, tuple(r.specialties), r.state_region)
+                   for r in records}
+            print(f"  {label:<22}{requests:>10,}{elapsed:>9.2f}s"
+                  f"{len(records) / elapsed:>12,.0f}"
+                  f"{requests * 60 / args.rpm / 60:>11.1f} min  {got == mock.expected}")
+
+        # One jurisdiction faults: it must come from the HTML search instead
+        failing = max(mock.xml, key=lambda p: len(mock.xml[p]))
+        mock.failing.add(failing)
+        records, _ = asyncio.run(collect(mock, True))
+        sources = Counter(r.raw_data.get("source", "html") for r in records)
+        print(f"\n  WS020 fault for {failing!r}: {len(records):,} records "
+              f"({sources['ws020']:,} WS020 + {sources['html']:,} HTML fallback), "
+              f"complete: {len(records) == args.records}\n")
+
+
+if __name__ == "__main__":
+    main()
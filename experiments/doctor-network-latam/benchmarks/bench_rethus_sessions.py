@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+RETHUS collection benchmark: ASP.NET session pool vs GET + POST per query.
+
+Answers from an in-process stand-in for the SISPRO consultation form
+(``httpx.MockTransport``, each response delayed ``--latency-ms``) that
+keeps the WebForms lifecycle: a GET opens a session (cookie) and renders
+``__VIEWSTATE`` / ``__EVENTVALIDATION`` signed for it; a POST must carry
+them from a live session, or gets HTTP 500 (bad fields) or a redirect to
+the error page (session idle longer than ``--session-ttl``); each answer
+renders fresh fields. Every ``--recycle`` seconds the application
+"recycles": all sessions and rendered fields become invalid at once.
+``--queries`` identifications (10% unregistered) are collected with
+`ColombiaRETHUSCollector.collect_full()`:
+
+  - naive:  one session, form reloaded before every query (GET + POST)
+  - pooled: ``--sessions`` sessions reusing their cached fields
+
+all at ``--rpm``. Reports requests, form loads, rejected postbacks, wall
+time, queries/s, the busiest second's request count, and whether every
+registered identification was collected correctly.
+
+Usage:
+    python benchmarks/bench_rethus_sessions.py --queries 200 --sessions 1,4,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import html
+import logging
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_names
+from src.collectors import base
+from src.collectors.colombia_rethus import ColombiaRETHUSCollector
+from src.utils import aspnet
+
+ERROR_PATH = "/THS/Cliente/Error.aspx"
+PROGRAMS = ["Medicina", "Especialización en Pediatría", "Especialización en Cardiología",
+            "Especialización en Medicina Interna", "Especialización en Anestesiología"]
+
+PAGE = """<html><body><form method="post" action="./ConsultaPublicaDeTHxIdentificacion.aspx">
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}" />
+<input type="hidden" name="__VIEWSTATEGENERATOR" id="__VIEWSTATEGENERATOR" value="5A3B1C2D" />
+<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="{validation}" />
+<select name="ctl00$cntContenido$ddlTipoIdentificacion"><option>CC</option></select>
+<input name="ctl00$cntContenido$txtNumeroIdentificacion" type="text" />
+<input type="submit" name="ctl00$cntContenido$btnConsultar" value="Consultar" />
+{results}</form></body></html>"""
+PERSON = """<table id="ctl00_cntContenido_gvDatosPersona">
+<tr><th>Tipo</th><th>Número</th><th>Nombres</th><th>Apellidos</th><th>Estado</th></tr>
+<tr><td>{doc_type}</td><td>{number}</td><td>{first}</td><td>{last}</td><td>{status}</td></tr>
+</table><table id="ctl00_cntContenido_gvDatosAcademicos">
+<tr><th>Tipo programa</th><th>Origen</th><th>Profesión u ocupación</th><th>Fecha inicio</th>
+<th>Acto administrativo</th><th>Entidad</th></tr>{programs}</table>"""
+
+
+class MockRethus:
+    """The consultation form's session / ViewState lifecycle over synthetic people."""
+
+    def __init__(
+        self, n: int, latency: float, session_ttl: float, recycle: float, seed: int = 11
+    ):
+        rng = random.Random(seed)
+        self.people: dict[tuple[str, str], dict] = {}
+        self.seeds: list[tuple[str, str]] = []
+        for i, name in enumerate(make_names(n, seed)):
+            number = str(1_000_000_000 + i * 7919)
+            if rng.random() < 0.1:
+                self.seeds.append(("CC", number))  # not registered
+                continue
+            first, _, last = name.partition(" ")
+            programs = ["Medicina"] + rng.sample(PROGRAMS[1:], rng.choice([0, 1, 1, 2]))
+            acts = [f"{rng.randint(1000, 99999)} DE {rng.randint(1990, 2025)}" for _ in programs]
+            self.people[("CC", number)] = {
+                "first": first, "last": last, "programs": programs, "acts": acts,
+                "status": rng.choice(["Registrado", "Registrado", "Inactivo"]),
+            }
+            self.seeds.append(("CC", number))
+        self.latency = latency
+        self.session_ttl = session_ttl
+        self.recycle = recycle
+        self.started_at = time.monotonic()
+        self.sessions: dict[str, tuple[int, float]] = {}  # id → (generation, last request)
+        self.counts: Counter = Counter()
+        self.started: list[float] = []
+
+    def generation(self) -> int:
+        """Recycles so far; sessions and fields of earlier ones are void."""
+        if not self.recycle:
+            return 0
+        return int((time.monotonic() - self.started_at) // self.recycle)
+
+    def sign(self, session: str, what: str) -> str:
+        return hashlib.sha256(f"{self.generation()}:{session}:{what}".encode()).hexdigest()
+
+    def page(self, session: str, results: str = "") -> httpx.Response:
+        self.counts["page"] += 1
+        nonce = str(self.counts["page"])
+        body = PAGE.format(
+            viewstate=f"{nonce}|{self.sign(session, nonce)}",
+            validation=self.sign(session, "validation"), results=results,
+        )
+        return httpx.Response(200, text=body, headers={
+            "Set-Cookie": f"ASP.NET_SessionId={session}; path=/; HttpOnly",
+        })
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.started.append(time.monotonic())
+        await asyncio.sleep(self.latency)
+        now = time.monotonic()
+        if request.url.path == ERROR_PATH:
+            return httpx.Response(200, text="<html>La sesión ha expirado</html>")
+        if request.method == "GET":
+            self.counts["get"] += 1
+            session = hashlib.sha1(str(len(self.started)).encode()).hexdigest()[:24]
+            self.sessions[session] = (self.generation(), now)
+            return self.page(session)
+
+        self.counts["post"] += 1
+        cookie = request.headers.get("Cookie", "")
+        session = cookie.partition("ASP.NET_SessionId=")[2].partition(";")[0]
+        generation, last_seen = self.sessions.get(session, (-1, 0.0))
+        if generation != self.generation() or now - last_seen > self.session_ttl:
+            self.counts["expired"] += 1
+            return httpx.Response(302, headers={"Location": ERROR_PATH})
+        form = {k: v[0] for k, v in parse_qs(request.content.decode()).items()}
+        nonce, _, mac = form.get("__VIEWSTATE", "").partition("|")
+        if (mac != self.sign(session, nonce)
+                or form.get("__EVENTVALIDATION") != self.sign(session, "validation")):
+            self.counts["invalid"] += 1
+            return httpx.Response(500, text="Validation of viewstate MAC failed.")
+        self.sessions[session] = (generation, now)
+
+        key = (form.get(ColombiaRETHUSCollector.FIELD_DOC_TYPE, ""),
+               form.get(ColombiaRETHUSCollector.FIELD_DOC_NUMBER, ""))
+        person = self.people.get(key)
+        if person is None:
+            return self.page(session, "<p>No se encontraron resultados</p>")
+        programs = "".join(
+            f"<tr><td>UNIVERSITARIO</td><td>LOCAL</td><td>{html.escape(p)}</td>"
+            f"<td>01/02/2010</td><td>{act}</td><td>SECRETARÍA DE SALUD</td></tr>"
+            for p, act in zip(person["programs"], person["acts"])
+        )
+        return self.page(session, PERSON.format(
+            doc_type=key[0], number=key[1], first=html.escape(person["first"]),
+            last=html.escape(person["last"]), status=person["status"], programs=programs,
+        ))
+
+
+async def collect(mock: MockRethus, seed_file: Path, rpm: int, sessions: int, naive: bool):
+    collector = ColombiaRETHUSCollector({
+        "rate_limit_rpm": rpm, "sessions": sessions, "seed_file": str(seed_file),
+    })
+    collector.logger.setLevel(logging.WARNING)
+    await collector.client.client.aclose()
+    collector.client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(mock.handle), follow_redirects=True
+    )
+    # Naive: fields always stale, so the form is fetched again before every query
+    collector.pool = aspnet.AspNetSessionPool(
+        collector.client, collector.SEARCH_URL, sessions,
+        max_age=0 if naive else aspnet.SESSION_MAX_AGE,
+    )
+    mock.counts.clear()
+    mock.started.clear()
+    mock.started_at = time.monotonic()
+    start = time.perf_counter()
+    records = await collector.collect_full()
+    elapsed = time.perf_counter() - start
+    await collector.client.close()
+    return records, elapsed, collector.pool.refreshes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--sessions", default="1,4,8",
+                        help="Pool sizes to run, comma-separated (default: 1,4,8)")
+    parser.add_argument("--rpm", type=int, default=600,
+                        help="Rate limit for every run (default: 600)")
+    parser.add_argument("--latency-ms", type=float, default=250.0)
+    parser.add_argument("--session-ttl", type=float, default=10.0,
+                        help="Stand-in's idle session timeout in seconds (default: 10)")
+    parser.add_argument("--recycle", type=float, default=10.0,
+                        help="Seconds between stand-in recycles, 0 for none (default: 10)")
+    args = parser.parse_args()
+
+    mock = MockRethus(args.queries, args.latency_ms / 1e3, args.session_ttl, args.recycle)
+    print(f"\n=== RETHUS collection ({len(mock.seeds):,} identifications, "
+          f"{args.latency_ms:.0f} ms latency, {args.rpm} rpm, "
+          f"{args.session_ttl:.0f}s session timeout, recycled every {args.recycle:.0f}s) ===\n")
+    print(f"  {'run':<18}{'requests':>9}{'form loads':>12}{'rejected':>10}{'wall':>9}"
+          f"{'queries/s':>11}{'max req/s':>11}  correct")
+
+    runs = [("naive GET + POST", 1, True)]
+    runs += [(f"pool of {n}", n, False) for n in map(int, args.sessions.split(","))]
+    with tempfile.TemporaryDirectory() as tmp:
+        base.DATA_DIR = Path(tmp)
+        seed_file = Path(tmp) / "CO_identifications.csv"
+        seed_file.write_text("tipo,numero\n" + "".join(f"{t},{n}\n" for t, n in mock.seeds))
+        for label, sessions, naive in runs:
+            records, elapsed, loads = asyncio.run(
+                collect(mock, seed_file, args.rpm, sessions, naive)
+            )
+            got = {r.license_number: (r.full_name, r.specialties, r.status) for r in records}
+            expected = {
+                p["acts"][0]: (f"{p['first']} {p['last']}", p["programs"], p["status"])
+                for p in mock.people.values()
+            }
+            per_second = Counter(int(t - mock.started[0]) for t in mock.started)
+            rejected = mock.counts["expired"] + mock.counts["invalid"]
+            print(f"  {label:<18}{len(mock.started):>9,}{loads:>12,}{rejected:>10,}"
+                  f"{elapsed:>8.1f}s{len(mock.seeds) / elapsed:>11.1f}"
+                  f"{max(per_second.values()):>11}  {got == expected}")
+    print(f"\n  rate limit: {args.rpm / 60:.0f} requests/s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark: records/sec and peak memory writing a JSON file.
+
+Compares the previous ``json.dumps([r.model_dump() ...], indent=2)`` path with
+`write_records()` on each available encoder backend. Defaults to the size of
+the Brazil CFM registry (~580k records).
+
+Usage:
+    python benchmarks/bench_serialize.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.utils.serialize import available_encoders, write_records
+
+
+def legacy_write(records, path: Path) -> None:
+    data = [r.model_dump() for r in records]
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def measure(label: str, write, records, path: Path) -> None:
+    gc.collect()
+    start = time.perf_counter()
+    write(records, path)
+    elapsed = time.perf_counter() - start
+    size_mb = path.stat().st_size / 1e6
+
+    gc.collect()
+    tracemalloc.start()
+    write(records, path)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"  {label:<24} {len(records) / elapsed:>10,.0f} records/s  "
+        f"peak {peak / 1e6:>8.1f} MB  file {size_mb:>7.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    args = parser.parse_args()
+
+    records = [CompactRecord.from_dict(r) for r in make_raw_records(args.records)]
+    print(f"\n=== JSON serialization ({args.records:,} records) ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.json"
+        measure("legacy (indent=2)", legacy_write, records, path)
+        for backend in available_encoders():
+            measure(
+                f"{backend} compact",
+                lambda rs, p, b=backend: write_records(rs, p, backend=b),
+                records, path,
+            )
+            measure(
+                f"{backend} pretty",
+                lambda rs, p, b=backend: write_records(rs, p, pretty=True, backend=b),
+                records, path,
+            )
+    print()
+
+
+if __name__ == "__main__":
+    main()
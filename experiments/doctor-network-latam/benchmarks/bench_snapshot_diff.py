@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Snapshot diff benchmark: change feed vs re-ingesting the full snapshot.
+
+Diffs a run against a baseline in which ``--churn`` of the records were
+removed, added, status-changed or otherwise updated (a quarter each), and
+checks that applying the feed to the previous snapshot gives the current
+one. Reports diff time, feed size vs snapshot size, and a consumer's cost
+to apply the feed vs to reload the full snapshot.
+
+Usage:
+    python benchmarks/bench_snapshot_diff.py --records 580000 --churn 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord, replace_fields
+from src.normalizers import diff
+from src.normalizers.normalize import normalize_batch
+from src.utils.json_stream import iter_json_array
+
+
+def next_run(records, churn: float, seed: int = 7):
+    """The records of a later run: ``churn`` of them removed/added/changed."""
+    rng = random.Random(seed)
+    n = max(1, int(len(records) * churn / 4))
+    current = list(records)
+    picked = rng.sample(range(len(current)), 3 * n)
+    removed = set(picked[:n])
+    for i in picked[n:2 * n]:
+        r = current[i]
+        current[i] = replace_fields(r, status="SUSPENDED" if r.status != "SUSPENDED" else "ACTIVE")
+    for i in picked[2 * n:]:
+        current[i] = replace_fields(
+            current[i], city="Santos", hospital_affiliations=("Hospital X",)
+        )
+    current = [r for i, r in enumerate(current) if i not in removed]
+    current += [
+        replace_fields(r, license_number=f"NEW-{i}") for i, r in enumerate(records[:n])
+    ]
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    parser.add_argument("--churn", type=float, default=0.01)
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    previous = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+    current = next_run(previous, args.churn)
+
+    print(f"\n=== Snapshot diff ({len(current):,} records, {args.churn:.1%} churn) ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        baseline = tmp / "baseline.json"
+        diff.snapshot_diff(previous, baseline, tmp / "initial.ndjson")
+
+        start = time.perf_counter()
+        counts = diff.snapshot_diff(current, baseline, tmp / "feed.ndjson")
+        elapsed = time.perf_counter() - start
+        feed_size = (tmp / "feed.ndjson").stat().st_size
+        snapshot_size = baseline.stat().st_size
+        print(f"  diff (merge join + new baseline) {elapsed:>7.2f}s  "
+              + ", ".join(f"{n:,} {op}" for op, n in counts.items()))
+        print(f"  feed {feed_size / 1e6:>8.2f} MB vs snapshot {snapshot_size / 1e6:>8.1f} MB "
+              f"({feed_size / snapshot_size:.2%})")
+
+        snapshot = {diff.dedup_key(r): r for r in previous}
+        start = time.perf_counter()
+        with open(tmp / "feed.ndjson", "rb") as f:
+            diff.apply_change_feed(snapshot, map(json.loads, f))
+        apply = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reloaded = {
+            diff.dedup_key(r): r for r in map(CompactRecord.from_dict, iter_json_array(baseline))
+        }
+        reload = time.perf_counter() - start
+
+        same = snapshot.keys() == reloaded.keys() and all(
+            diff._changed_fields(snapshot[k], r) == {} for k, r in reloaded.items()
+        )
+        print(f"  consumer: apply feed {apply:.3f}s vs reload snapshot {reload:.2f}s "
+              f"({reload / apply:,.0f}x); applied == current: {same}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+SQLite export benchmark: rows/sec for a fresh export and in-place refreshes.
+
+Compares the previous path (indexes created first, one ``execute()`` and
+six ``json.dumps()`` per row over ``model_dump()``, default journaling) with
+the bulk load in `export_sqlite()`, then refreshes the same database with
+nothing changed and with 1% of the records changed and 1% gone. Defaults
+to the size of the Brazil CFM registry (~580k records); the per-row
+baseline runs on a smaller sample.
+
+Usage:
+    python benchmarks/bench_sqlite_export.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord, replace_fields
+from src.exporters import export
+from src.normalizers.normalize import normalize_batch
+
+
+def legacy_export(records, path: Path) -> None:
+    conn = sqlite3.connect(str(path))
+    cursor = conn.cursor()
+    cursor.execute(f"CREATE TABLE doctors ({', '.join(export._SQLITE_COLUMNS)}, PRIMARY KEY (id))")
+    for name, column in export._SQLITE_INDEXES.items():
+        cursor.execute(f"CREATE INDEX {name} ON doctors({column})")
+    for r in records:
+        d = r.model_dump()
+        cursor.execute(
+            export._SQLITE_UPSERT,
+            (
+                d["id"], d["source_country"], d["source_registry"], d["license_number"],
+                d["full_name"],
+                json.dumps(d["specialties"]),
+                json.dumps(d["specialty_codes"]),
+                d["status"], d["state_region"], d["city"],
+                json.dumps(d["hospital_affiliations"]),
+                json.dumps(d["insurance_networks"]),
+                json.dumps(d["education"]),
+                json.dumps(d["languages"]),
+                json.dumps(d["contact"]),
+                d["collected_at"], d["source_url"],
+            ),
+        )
+    conn.commit()
+    conn.close()
+
+
+def churn(records, rate: float = 0.01, seed: int = 5):
+    """Drop ``rate`` of the records and change the status of another ``rate``."""
+    rng = random.Random(seed)
+    kept = [r for r in records if rng.random() >= rate]
+    for i in rng.sample(range(len(kept)), int(len(kept) * rate)):
+        kept[i] = replace_fields(kept[i], status="SUSPENDED" if kept[i].status != "SUSPENDED" else "ACTIVE")
+    return kept
+
+
+def timed(label: str, fn, records) -> float:
+    start = time.perf_counter()
+    fn(records)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {len(records):>9,} rows  {elapsed:>7.2f}s  {len(records) / elapsed:>10,.0f} rows/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    parser.add_argument("--baseline-records", type=int, default=50_000,
+                        help="Sample size for the per-row baseline (0 to skip)")
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    records = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+    print(f"\n=== SQLite export ({len(records):,} records) ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+        if args.baseline_records:
+            sample = records[:args.baseline_records]
+            timed("per-row (previous)", lambda rs: legacy_export(rs, Path(tmp) / "legacy.db"), sample)
+        timed("bulk load, fresh file", lambda rs: export.export_sqlite(rs, "bulk.db"), records)
+        timed("refresh, nothing changed", lambda rs: export.export_sqlite(rs, "bulk.db"), records)
+        timed("refresh, 1% changed, 1% gone",
+              lambda rs: export.export_sqlite(rs, "bulk.db"), churn(records))
+        size_mb = (Path(tmp) / "bulk.db").stat().st_size / 1e6
+        print(f"\n  database: {size_mb:,.1f} MB")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+SQLite lookup benchmark: query latency for the platform's lookups on an export.
+
+Exports synthetic records with `export_sqlite()` and times lookups by
+license, by name prefix and by specialty + region through
+`sqlite_queries`, against the scans the flat table needed before (``LIKE``
+over ``full_name`` and the JSON-encoded ``specialties`` column). Reports
+p50/p99 per lookup.
+
+Usage:
+    python benchmarks/bench_sqlite_queries.py --records 580000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.compact import CompactRecord
+from src.exporters import export, sqlite_queries as q
+from src.normalizers.normalize import normalize_batch
+
+ALL = 1 << 30  # "no limit" for the full-result variants
+
+
+def scan_names(conn, text: str, limit: int = q.DEFAULT_LIMIT):
+    like = " ".join(f"%{t}%" for t in text.split())
+    return conn.execute(
+        "SELECT * FROM doctors WHERE full_name LIKE ? LIMIT ?", (like, limit)
+    ).fetchall()
+
+
+def scan_specialty(conn, specialty: str, state_region: str, limit: int = q.DEFAULT_LIMIT):
+    return conn.execute(
+        "SELECT * FROM doctors WHERE specialties LIKE ? AND state_region = ? LIMIT ?",
+        (f"%{json.dumps(specialty)}%", state_region, limit),
+    ).fetchall()
+
+
+def percentiles(label: str, fn, queries) -> None:
+    latencies = []
+    hits = 0
+    for args in queries:
+        start = time.perf_counter()
+        hits += len(fn(*args))
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3
+    print(
+        f"  {label:<34} {len(queries):>6,} queries  p50 {p50:>8.3f} ms  "
+        f"p99 {p99:>8.3f} ms  {hits / len(queries):>5.1f} rows/query"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=580_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--scan-queries", type=int, default=20,
+                        help="Queries for the full-scan baselines (0 to skip)")
+    args = parser.parse_args()
+
+    raw = make_raw_records(args.records, duplicate_rate=0, with_raw_data=False)
+    records = normalize_batch(CompactRecord.from_dict(r) for r in raw)
+    del raw
+
+    rng = random.Random(7)
+    sample = rng.choices(records, k=args.queries)
+    by_license = [(r.license_number, r.source_country) for r in sample]
+    # Typeahead input: a prefix of every name word ("mari silv sant")
+    by_name = [(" ".join(w[:4] for w in r.full_name.split()),) for r in sample]
+    with_specialty = [r for r in sample if r.specialties and r.specialty_codes]
+    by_code = [(r.specialty_codes[0], r.state_region) for r in with_specialty]
+    by_text = [(r.specialties[0], r.state_region) for r in with_specialty]
+
+    print(f"\n=== SQLite lookups ({len(records):,} records) ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        export.EXPORTS_DIR = Path(tmp)
+        start = time.perf_counter()
+        path = export.export_sqlite(records, "lookup.db")
+        print(f"  export with search tables: {time.perf_counter() - start:.2f}s\n")
+
+        conn = q.connect(path)
+        percentiles("license", lambda lic, cc: q.find_by_license(conn, lic, cc), by_license)
+        percentiles("name prefix (FTS5)", lambda text: q.search_names(conn, text), by_name)
+        percentiles("specialty code + region",
+                    lambda code, region: q.find_by_specialty(conn, code, region), by_code)
+        percentiles("specialty text + region",
+                    lambda sp, region: q.find_by_specialty(conn, sp, region, by_code=False), by_text)
+        percentiles("specialty text + region, all rows",
+                    lambda sp, region: q.find_by_specialty(conn, sp, region, ALL, by_code=False),
+                    by_text[:args.scan_queries or len(by_text)])
+        if args.scan_queries:
+            print()
+            n = args.scan_queries
+            percentiles("name LIKE scan (previous)", lambda text: scan_names(conn, text), by_name[:n])
+            percentiles("specialties LIKE scan (previous)",
+                        lambda sp, region: scan_specialty(conn, sp, region), by_text[:n])
+            percentiles("... all rows (previous)",
+                        lambda sp, region: scan_specialty(conn, sp, region, ALL), by_text[:n])
+        conn.close()
+    print()
+
+
+if __name__ == "__main__":
+    main()
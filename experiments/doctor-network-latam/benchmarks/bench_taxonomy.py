@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Specialty taxonomy benchmark: per-synonym loop vs Aho-Corasick vs memoized codes.
+
+Matches free-text specialty strings (case, accent and spacing variants of
+the synonyms in config/specialties.json, some combined) against the taxonomy
+and reports strings/sec and how many strings got at least one code.
+
+Usage:
+    python benchmarks/bench_taxonomy.py --strings 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SPECIALTIES
+from src.normalizers.taxonomy import default_taxonomy, fold, specialty_codes_for
+
+ACCENTS = {"a": "á", "e": "é", "i": "í", "o": "ó", "u": "ú"}
+
+
+def _variant(rng: random.Random, text: str) -> str:
+    if rng.random() < 0.3:
+        i = rng.randrange(len(text))
+        text = text[:i] + ACCENTS.get(text[i], text[i]) + text[i + 1:]
+    text = rng.choice([str.title, str.upper, str.lower, str.capitalize])(text)
+    return rng.choice(["", " "]) + text + rng.choice(["", " ", ".", "  "])
+
+
+def make_strings(n: int, seed: int = 3) -> list[tuple[str, str]]:
+    """(country, specialty) pairs; ~80% BR like the registries."""
+    rng = random.Random(seed)
+    taxonomy = default_taxonomy()
+    pools = {c: list(taxonomy.synonyms_for(c)) + SPECIALTIES for c in ("BR", "AR")}
+    joiners = {"BR": [" e ", ", ", " / "], "AR": [" y ", ", ", " / "]}
+    out = []
+    for _ in range(n):
+        country = "BR" if rng.random() < 0.8 else "AR"
+        text = _variant(rng, rng.choice(pools[country]))
+        if rng.random() < 0.15:
+            text += rng.choice(joiners[country]) + _variant(rng, rng.choice(pools[country]))
+        out.append((country, text))
+    return out
+
+
+def naive_codes(synonyms: dict[str, list[tuple[str, str]]], country: str, text: str) -> list[str]:
+    """The slow way: fold, then test every synonym of the country."""
+    padded = f" {fold(text)} "
+    codes = []
+    for synonym, code in synonyms[country]:
+        if synonym in padded and code not in codes:
+            codes.append(code)
+    return codes
+
+
+def timed(label: str, fn, items, baseline: float | None = None) -> float:
+    start = time.perf_counter()
+    matched = sum(1 for country, text in items if fn(country, text))
+    elapsed = time.perf_counter() - start
+    speedup = f"  {baseline / elapsed:>6.1f}x" if baseline else ""
+    print(
+        f"  {label:<24} {elapsed:>7.2f}s  {len(items) / elapsed:>11,.0f} strings/s  "
+        f"{matched / len(items):>6.1%} matched{speedup}"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--strings", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    taxonomy = default_taxonomy()
+    items = make_strings(args.strings)
+    distinct = len(set(items))
+    print(f"\n=== Specialty taxonomy ({args.strings:,} strings, {distinct:,} distinct) ===\n")
+
+    synonyms = {
+        c: [(f" {fold(s)} ", code) for s, code in taxonomy.synonyms_for(c).items()]
+        for c in ("BR", "AR")
+    }
+    matchers = {c: taxonomy.matcher(c) for c in ("BR", "AR")}
+
+    base = timed("per-synonym loop", lambda c, t: naive_codes(synonyms, c, t), items)
+    timed("Aho-Corasick", lambda c, t: matchers[c].match(t), items, base)
+    specialty_codes_for.cache_clear()
+    timed("Aho-Corasick, memoized", specialty_codes_for, items, base)
+    print()
+
+
+if __name__ == "__main__":
+    main()
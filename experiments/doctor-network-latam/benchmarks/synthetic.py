@@ -0,0 +1,136 @@
+"""Synthetic raw doctor records shaped like real collector output."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from itertools import accumulate
+from datetime import datetime, timezone
+from typing import Any
+
+UFS = ["SP", "RJ", "MG", "RS", "PR", "BA", "SC", "PE", "CE", "GO", "DF", "PA"]
+PROVINCES = ["Buenos Aires", "CABA", "Córdoba", "Santa Fe", "Mendoza", "Tucumán"]
+FIRST_NAMES = [
+    "Maria", "José", "Ana", "João", "Juan", "Carlos", "Luciana", "Fernanda",
+    "Pedro", "Paula", "Ricardo", "Camila", "Jorge", "Marta", "Diego", "Sofía",
+]
+SURNAMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "García", "Rodríguez", "López",
+    "Martínez", "González", "Pereira", "Costa", "Fernández", "Gómez", "Almeida",
+]
+SPECIALTIES = [
+    "Cardiologia", "cardiologia ", "Clínica Médica", "Pediatria", "Ortopedia",
+    "Ginecologia e Obstetrícia", "Dermatologia", "Psiquiatria", "Anestesiologia",
+    "Cardiología", "Medicina Interna", "Pediatría", "Cirugía General",
+]
+STATUSES = {
+    "BR": ["Ativo", "ATIVO", "Regular", "Inativo", "Cancelado", "Suspenso"],
+    "AR": ["Habilitado", "habilitado", "Inhabilitado", "Suspendido"],
+}
+
+
+def make_raw_records(
+    n: int, seed: int = 42, duplicate_rate: float = 0.05, with_raw_data: bool = True
+) -> list[dict[str, Any]]:
+    """Generate ``n`` raw-file rows (~80% BR / 20% AR) with some duplicates."""
+    rng = random.Random(seed)
+    collected_at = datetime.now(timezone.utc).isoformat()
+    rows: list[dict[str, Any]] = []
+
+    for i in range(n):
+        license_seq = rng.randrange(i) if i and rng.random() < duplicate_rate else i
+        name = " ".join(
+            [rng.choice(FIRST_NAMES)]
+            + rng.sample(SURNAMES, rng.randint(1, 3))
+        )
+        if rng.random() < 0.1:
+            name = rng.choice(["Dr. ", "dra ", "DR "]) + name.upper()
+        specialties = rng.sample(SPECIALTIES, rng.choice([0, 1, 1, 1, 2, 3]))
+
+        if rng.random() < 0.8:
+            uf = UFS[license_seq % len(UFS)]
+            crm = str(100000 + license_seq)
+            status = rng.choice(STATUSES["BR"])
+            row = {
+                "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "source_country": "BR",
+                "source_registry": "CFM",
+                "license_number": f"CRM-{uf}  {crm}",
+                "full_name": f"  {name} ",
+                "specialties": specialties,
+                "status": status,
+                "state_region": uf,
+                "source_url": "https://portal.cfm.org.br/busca-medicos/",
+                "collected_at": collected_at,
+            }
+            raw = {"name_raw": name, "crm_raw": crm, "specialty_raw": ", ".join(specialties),
+                   "status_raw": status, "uf": uf}
+        else:
+            province = PROVINCES[license_seq % len(PROVINCES)]
+            matricula = f"M.N. {50000 + license_seq}"
+            status = rng.choice(STATUSES["AR"])
+            row = {
+                "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "source_country": "AR",
+                "source_registry": "REFEPS",
+                "license_number": matricula,
+                "full_name": name,
+                "specialties": specialties,
+                "status": status,
+                "state_region": province,
+                "source_url": "https://sisa.msal.gov.ar/sisadoc/docs/050102/refeps_buscador_publico_profesionales.jsp",
+                "collected_at": collected_at,
+            }
+            raw = {"name_raw": name, "matricula_raw": matricula,
+                   "profesion_raw": ", ".join(specialties), "jurisdiccion_raw": province}
+
+        if with_raw_data:
+            row["raw_data"] = raw
+        rows.append(row)
+
+    return rows
+
+
+GIVEN_NAMES = FIRST_NAMES + [
+    "Antônio", "Francisco", "Luis", "Miguel", "Rafael", "Gabriel", "Lucas", "Mateus",
+    "Andrés", "Santiago", "Sebastián", "Martín", "Alejandro", "Fernando", "Eduardo",
+    "Beatriz", "Isabel", "Lucía", "Valentina", "Gabriela", "Daniela", "Juliana",
+    "Patrícia", "Cecilia", "Adriana", "Mariana", "Verónica", "Rosa", "Teresa", "Inés",
+]
+PARTICLES = ["da", "de", "do", "dos", "das", "del", "de la"]
+_ONSETS = ["b", "c", "d", "f", "g", "l", "m", "n", "p", "r", "s", "t", "v", "z",
+           "br", "ch", "gu", "lh", "nh", "qu", "rr", "tr"]
+_VOWELS = ["a", "e", "i", "o", "u", "á", "é", "ó"]
+_ENDINGS = ["ez", "es", "os", "a", "o", "eira", "ado", "ino", "ães", "ela", "ón", "al"]
+
+
+def make_names(n: int, seed: int = 42, vocabulary: int = 30_000) -> list[str]:
+    """
+    ``n`` full names with a registry-sized surname vocabulary.
+
+    `make_raw_records()` draws from a few dozen name words, so every name
+    has thousands of exact twins; fuzzy search needs realistic variety.
+    Surnames are ``vocabulary`` made-up words plus the real ones, drawn with
+    a Zipf-like skew (a few are very common); a quarter of names carry a
+    particle ("da", "de la") and some a second given name.
+    """
+    rng = random.Random(seed)
+    words = set(SURNAMES)
+    while len(words) < vocabulary:
+        syllables = "".join(
+            rng.choice(_ONSETS) + rng.choice(_VOWELS) for _ in range(rng.randint(1, 2))
+        )
+        words.add((syllables + rng.choice(_ENDINGS)).capitalize())
+    surnames = SURNAMES + sorted(words - set(SURNAMES))
+    cum_weights = list(accumulate(1 / (rank + 10) for rank in range(len(surnames))))
+
+    names = []
+    for _ in range(n):
+        given = [rng.choice(GIVEN_NAMES)]
+        if rng.random() < 0.3:
+            given.append(rng.choice(GIVEN_NAMES))
+        family = rng.choices(surnames, cum_weights=cum_weights, k=rng.randint(1, 3))
+        if rng.random() < 0.25:
+            family.insert(0, rng.choice(PARTICLES))
+        names.append(" ".join(given + family))
+    return names
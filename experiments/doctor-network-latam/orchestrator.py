@@ -19,6 +19,7 @@ import asyncio
 import json
 import sys
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
 # Add project root to path
@@ -33,9 +34,22 @@ from src.collectors.chile_rnpi import ChileRNPICollector
 from src.collectors.paraguay_dgcpe import ParaguayDGCPECollector
 from src.collectors.uruguay_cmu import UruguayCMUCollector
 from src.collectors.bolivia_sirepro import BoliviaSiREPROCollector
+from src.normalizers.aggregates import AggregateCube
+from src.normalizers.columnar import normalize_batch_columnar
+from src.normalizers.diff import run_snapshot_diff
+from src.normalizers.entities import run_entity_resolution
+from src.normalizers.external import normalize_batch_external
+from src.normalizers.incremental import run_incremental_normalization
+from src.normalizers.name_index import run_name_index
 from src.normalizers.normalize import run_normalization
-from src.exporters.export import export_json, export_csv, export_sqlite
+from src.normalizers.parallel import normalize_batch_parallel
+from src.exporters.fanout import EXPORT_FORMATS, fan_out, make_sinks
+from src.exporters.parquet import parquet_available
+from src.service.lookup import DEFAULT_PORT, serve
+from src.utils.compression import check_compression
+from src.utils.json_stream import iter_json_array
 from src.utils.logger import get_logger
+from src.utils.serialize import write_records
 
 logger = get_logger("orchestrator")
 
@@ -115,8 +129,7 @@ def show_status():
                 total_records = 0
                 for f in files:
                     try:
-                        data = json.loads(f.read_text(encoding="utf-8"))
-                        total_records += len(data)
+                        total_records += sum(1 for _ in iter_json_array(f))
                     except Exception:
                         pass
                 print(f"  {country_dir.name}: {len(files)} files, {total_records} records")
@@ -129,13 +142,22 @@ def show_status():
         print("\nNormalized:")
         for f in sorted(norm_dir.glob("*.json")):
             try:
-                data = json.loads(f.read_text(encoding="utf-8"))
-                print(f"  {f.name}: {len(data)} records")
+                count = sum(1 for _ in iter_json_array(f))
+                print(f"  {f.name}: {count} records")
             except Exception:
                 pass
     else:
         print("\n  No normalized data yet.")
 
+    # Coverage, from the cube kept by --change-feed
+    cube_path = norm_dir / "changes" / "cube_all.json"
+    if cube_path.exists():
+        print("\nCoverage (collected / estimated_doctors):")
+        for row in AggregateCube.load(cube_path).coverage():
+            pct = f"{row['coverage']:.1%}" if row["coverage"] is not None else "n/a"
+            print(f"  {row['country']}: {row['collected']} / {row['estimated_doctors']} ({pct}), "
+                  f"{row['active']} active")
+
     # Exports
     export_dir = data_dir / "exports"
     if export_dir.exists():
@@ -167,18 +189,92 @@ def main():
         "--export",
         type=str,
         default="json",
-        help="Export formats: json, csv, sqlite (comma-separated)",
+        help="Export formats: json, jsonl, csv, sqlite, parquet, postgres, cube "
+        "(comma-separated; written in one pass, one thread each; parquet needs pyarrow; "
+        "postgres writes COPY chunks + DDL; cube writes rollup counts)",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd"],
+        help="Compress json/jsonl/csv exports while writing (.gz / .zst; zstd needs zstandard)",
+    )
+    parser.add_argument(
+        "--sqlite-db",
+        metavar="NAME",
+        help="Keep this long-lived SQLite database in data/exports/ up to date instead of "
+        "writing a new timestamped file: changed rows are upserted, missing ones "
+        "soft-deleted, and each run is logged in export_runs",
     )
     parser.add_argument(
         "--normalize-only",
         action="store_true",
         help="Skip collection, just normalize existing raw data",
     )
+    parser.add_argument(
+        "--trust-raw",
+        action="store_true",
+        help="Skip schema validation of raw files (only for files written by our collectors)",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Normalize column-wise over record batches (same output, faster on large runs)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Normalize in N processes, sharded by dedup key (same output; default: 1)",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MB",
+        help="Dedup within MB of working memory, spilling sorted runs to disk (same output)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only normalize raw files not seen before, merging into data/normalized/store.db",
+    )
+    parser.add_argument(
+        "--resolve-entities",
+        action="store_true",
+        help="Link the same physician across registries (writes entities_<country>.json)",
+    )
+    parser.add_argument(
+        "--name-index",
+        action="store_true",
+        help="Build the trigram index for fuzzy name search (writes names_<country>.db)",
+    )
+    parser.add_argument(
+        "--change-feed",
+        action="store_true",
+        help="Write an NDJSON feed of records added, removed and changed since the previous "
+        "run (data/normalized/changes/)",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON exports and run reports (default: compact, one record per line)",
+    )
     parser.add_argument(
         "--status",
         action="store_true",
         help="Show current data collection status",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve read-only lookups (id, license, name prefix) over HTTP from the normalized "
+        "snapshot in memory, reloading it when it changes",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port for --serve (default: {DEFAULT_PORT}, on localhost)",
+    )
 
     args = parser.parse_args()
 
@@ -186,6 +282,14 @@ def main():
         show_status()
         return
 
+    if args.serve:
+        suffix = "all" if args.country.lower() == "all" else args.country.strip().upper()
+        snapshot = PROJECT_ROOT / "data" / "normalized" / f"doctors_{suffix}.json"
+        if not snapshot.exists():
+            parser.error(f"--serve needs a normalized snapshot ({snapshot}); run --normalize-only")
+        serve(snapshot, port=args.port)
+        return
+
     # Parse countries
     if args.country.lower() == "all":
         countries = ALL_COUNTRIES
@@ -194,6 +298,27 @@ def main():
 
     # Parse export formats
     export_formats = [f.strip().lower() for f in args.export.split(",")]
+    unknown = [f for f in export_formats if f not in EXPORT_FORMATS]
+    if unknown:
+        parser.error(
+            f"unknown --export format(s): {', '.join(unknown)} "
+            f"(choose from {', '.join(EXPORT_FORMATS)})"
+        )
+    try:
+        check_compression(args.compress)
+    except ValueError as e:
+        parser.error(str(e))
+    if "parquet" in export_formats and not parquet_available():
+        parser.error("--export parquet needs the pyarrow package (pip install pyarrow)")
+
+    # Normalizer options: --workers and --columnar combine, the others don't
+    if args.memory_budget and (args.workers > 1 or args.columnar):
+        parser.error("--memory-budget can't be combined with --workers or --columnar")
+    if args.incremental and (args.memory_budget or args.workers > 1 or args.columnar):
+        parser.error(
+            "--incremental folds each new raw file into the store on its own; "
+            "it can't be combined with --memory-budget, --workers or --columnar"
+        )
 
     # Run collection (unless normalize-only)
     if not args.normalize_only:
@@ -219,26 +344,43 @@ def main():
         report_dir = PROJECT_ROOT / "logs"
         report_dir.mkdir(parents=True, exist_ok=True)
         report_file = report_dir / f"run_report_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.json"
-        report_file.write_text(
-            json.dumps([r.model_dump() for r in results], indent=2),
-            encoding="utf-8",
-        )
+        write_records(results, report_file, pretty=args.pretty)
 
     # Normalize
     country_filter = countries[0] if len(countries) == 1 else None
-    normalized = run_normalization(country_filter)
+    if args.memory_budget:
+        normalizer = partial(normalize_batch_external, memory_budget_mb=args.memory_budget)
+    elif args.workers > 1:
+        normalizer = partial(
+            normalize_batch_parallel, workers=args.workers, columnar=args.columnar
+        )
+    elif args.columnar:
+        normalizer = normalize_batch_columnar
+    else:
+        normalizer = None
+    if args.incremental:
+        normalized = run_incremental_normalization(country_filter, trusted=args.trust_raw)
+    else:
+        normalized = run_normalization(
+            country_filter, trusted=args.trust_raw, normalizer=normalizer
+        )
 
     if not normalized:
         logger.warning("No records to export after normalization")
         return
 
-    # Export
-    if "json" in export_formats:
-        export_json(normalized)
-    if "csv" in export_formats:
-        export_csv(normalized)
-    if "sqlite" in export_formats:
-        export_sqlite(normalized)
+    if args.resolve_entities:
+        run_entity_resolution(normalized, country_filter)
+    if args.name_index:
+        run_name_index(normalized, country_filter)
+    if args.change_feed:
+        run_snapshot_diff(normalized, country_filter)
+
+    # Export: one pass over the records feeds every requested format
+    sinks = make_sinks(
+        export_formats, pretty=args.pretty, sqlite_db=args.sqlite_db, compression=args.compress
+    )
+    fan_out(normalized, sinks)
 
     print(f"\nDone. {len(normalized)} records normalized and exported.")
 
@@ -13,6 +13,8 @@ HL7 FHIR-based interoperability.
 Strategy:
   - Sample mode: Query a few common surnames to get ~10 records
   - Full mode: Iterate through provinces + pagination
+  - Each query goes to WS020 (`sisa_ws020`, 500 records per call) when
+    credentials are set, and to the HTML search if that is unavailable or fails
 """
 
 from __future__ import annotations
@@ -20,6 +22,7 @@ from __future__ import annotations
 from bs4 import BeautifulSoup
 
 from .base import BaseCollector, DoctorRecord
+from .sisa_ws020 import Ws020Client, Ws020Error
 
 
 class ArgentinaREFEPSCollector(BaseCollector):
@@ -40,6 +43,22 @@ class ArgentinaREFEPSCollector(BaseCollector):
     # Common Argentine surnames for sample collection
     SAMPLE_SURNAMES = ["García", "Rodríguez", "López", "Martínez", "González"]
 
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.ws = Ws020Client.from_config(self.client, config.get("api_url") or self.WS_URL)
+
+    async def _ws_search(self, **query) -> list[DoctorRecord] | None:
+        """WS020 results, or None when the HTML search has to answer instead."""
+        if self.ws is None:
+            return None
+        try:
+            return await self.ws.search(**query)
+        except Ws020Error as e:
+            self.logger.warning(f"WS020 query {query} failed, falling back to HTML: {e}")
+            if not self.ws.connected:
+                self.ws = None  # no WSDL: don't retry it for every query
+            return None
+
     async def collect_sample(self) -> list[DoctorRecord]:
         """Fetch a sample by querying common surnames."""
         records: list[DoctorRecord] = []
@@ -73,7 +92,10 @@ class ArgentinaREFEPSCollector(BaseCollector):
     async def _search_by_surname(
         self, surname: str, max_results: int = 50
     ) -> list[DoctorRecord]:
-        """Query REFEPS public search by surname."""
+        """Query REFEPS by surname."""
+        records = await self._ws_search(apellido=surname, limit=max_results)
+        if records is not None:
+            return records
         try:
             response = await self.client.get(
                 self.SEARCH_URL,
@@ -86,7 +108,10 @@ class ArgentinaREFEPSCollector(BaseCollector):
 
     async def _search_by_province(self, province: str) -> list[DoctorRecord]:
         """Query REFEPS for all professionals in a province."""
-        records: list[DoctorRecord] = []
+        records = await self._ws_search(jurisdiccion=province)
+        if records is not None:
+            return records
+        records = []
         page = 1
 
         while True:
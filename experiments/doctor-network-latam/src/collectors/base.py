@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import re
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from ..utils.http_client import RateLimitedClient
 from ..utils.logger import get_logger
+from ..utils.raw_store import RawStore
+from ..utils.serialize import write_records
 
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
+# ---------------------------------------------------------------------------
+# Stable record IDs
+#
+# A record's id is derived from its registry identity, so the same physician
+# gets the same primary key on every run and exporters can upsert by id.
+# ---------------------------------------------------------------------------
+RECORD_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "doctor-network-latam")
+_NAMESPACE_BYTES = RECORD_ID_NAMESPACE.bytes
+_LICENSE_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def stable_record_id(country: str, registry: str, license_number: str) -> str:
+    """
+    uuid5 of (country, registry, whitespace-normalized license).
+
+    Same string as ``str(uuid.uuid5(RECORD_ID_NAMESPACE, name))``, built
+    without the intermediate UUID object (this runs once per record).
+    """
+    license_key = _LICENSE_WHITESPACE_RE.sub(" ", license_number.strip())
+    name = f"{country}:{registry}:{license_key}".encode("utf-8")
+    digest = bytearray(hashlib.sha1(_NAMESPACE_BYTES + name).digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = digest.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 # ---------------------------------------------------------------------------
 # Common schema — every doctor record normalizes to this
 # ---------------------------------------------------------------------------
@@ -44,6 +74,19 @@ class DoctorRecord(BaseModel):
     )
     source_url: str = ""
 
+    @model_validator(mode="before")
+    @classmethod
+    def _default_stable_id(cls, data: Any) -> Any:
+        """Derive ``id`` from the registry identity when none is given."""
+        if isinstance(data, dict) and "id" not in data:
+            try:
+                data = {**data, "id": stable_record_id(
+                    data["source_country"], data["source_registry"], data["license_number"]
+                )}
+            except (KeyError, AttributeError):
+                pass  # required-field errors are reported by validation
+        return data
+
 
 class CollectorResult(BaseModel):
     """Summary of a collector run."""
@@ -79,6 +122,7 @@ class BaseCollector(ABC):
         )
         self.raw_dir = DATA_DIR / "raw" / self.country_code
         self.raw_dir.mkdir(parents=True, exist_ok=True)
+        self.raw_store = RawStore.for_country(self.country_code)
 
     @abstractmethod
     async def collect_sample(self) -> list[DoctorRecord]:
@@ -125,11 +169,19 @@ class BaseCollector(ABC):
         return result
 
     def _save_raw(self, records: list[DoctorRecord], mode: str):
-        """Persist raw records to disk as JSON."""
+        """
+        Persist raw records to disk as JSON.
+
+        `raw_data` payloads go to the country's side store (keyed by record
+        id) and are left out of the record file itself.
+        """
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         filename = f"{self.country_code}_{mode}_{timestamp}.json"
         filepath = self.raw_dir / filename
 
-        data = [r.model_dump() for r in records]
-        filepath.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-        self.logger.info(f"Saved {len(records)} raw records to {filepath}")
+        payloads = self.raw_store.put_many((r.id, r.raw_data) for r in records)
+        write_records(records, filepath, exclude={"raw_data"})
+        self.logger.info(
+            f"Saved {len(records)} raw records to {filepath} "
+            f"({payloads} raw payloads to {self.raw_store.data_path})"
+        )
@@ -9,11 +9,35 @@ Estimated records: ~120,000
 Priority: P1
 
 Governed by Law 1164 of 2007. Includes sanctions from ethics tribunals.
+
+Strategy:
+  - The public consultation is an ASP.NET WebForms page searched by
+    identification document, so queries come from a seed list of
+    (document type, number) pairs (``seed_file`` in the config, default
+    ``data/seeds/CO_identifications.csv``)
+  - Queries run through an `AspNetSessionPool`: ``sessions`` concurrent
+    sessions, each reusing its cached ``__VIEWSTATE`` / ``__EVENTVALIDATION``
+    (one POST per query; the form is reloaded only when they go stale)
+  - Sample mode: the first 10 seeds
+  - Full mode: every seed
+
+The license is the registration's administrative act (``Acto
+administrativo`` of the first academic program), not the identification
+document: that is a national ID, so records only keep its SHA-256.
 """
 
 from __future__ import annotations
 
-from .base import BaseCollector, DoctorRecord
+import csv
+import hashlib
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from ..utils.aspnet import POOL_SIZE, AspNetSession, AspNetSessionPool
+from .base import DATA_DIR, BaseCollector, DoctorRecord
+
+SEED_FILE = DATA_DIR / "seeds" / "CO_identifications.csv"
 
 
 class ColombiaRETHUSCollector(BaseCollector):
@@ -22,12 +46,100 @@ class ColombiaRETHUSCollector(BaseCollector):
 
     SEARCH_URL = "https://web.sispro.gov.co/THS/Cliente/ConsultasPublicas/ConsultaPublicaDeTHxIdentificacion.aspx"
 
+    # Form controls — names need live validation against the page
+    FIELD_DOC_TYPE = "ctl00$cntContenido$ddlTipoIdentificacion"
+    FIELD_DOC_NUMBER = "ctl00$cntContenido$txtNumeroIdentificacion"
+    FIELD_SUBMIT = "ctl00$cntContenido$btnConsultar"
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.seed_file = Path(config.get("seed_file") or SEED_FILE)
+        self.pool = AspNetSessionPool(
+            self.client, self.SEARCH_URL, config.get("sessions", POOL_SIZE)
+        )
+
     async def collect_sample(self) -> list[DoctorRecord]:
-        self.logger.info("[CO] RETHUS collector — sample mode (stub)")
-        # TODO: Implement SISPRO public search scraping
-        # The ASPX form requires __VIEWSTATE handling
-        return []
+        """Look up the first few seed identifications."""
+        return await self._lookup_all(self._load_seeds()[:10])
 
     async def collect_full(self) -> list[DoctorRecord]:
-        self.logger.info("[CO] RETHUS collector — full mode (stub)")
-        return []
+        """Look up every seed identification."""
+        seeds = self._load_seeds()
+        records = await self._lookup_all(seeds)
+        self.logger.info(
+            f"  {len(records)} records from {len(seeds)} identifications "
+            f"({self.pool.refreshes} form loads)"
+        )
+        return records
+
+    def _load_seeds(self) -> list[tuple[str, str]]:
+        """(document type, number) pairs to query, e.g. ("CC", "1020304050")."""
+        if not self.seed_file.exists():
+            self.logger.warning(
+                f"RETHUS is searched by identification; no seeds at {self.seed_file}"
+            )
+            return []
+        with open(self.seed_file, newline="", encoding="utf-8") as f:
+            return [
+                (row[0].strip(), row[1].strip())
+                for row in csv.reader(f)
+                if len(row) >= 2 and row[1].strip().isdigit()  # skips a header row
+            ]
+
+    async def _lookup_all(self, seeds: list[tuple[str, str]]) -> list[DoctorRecord]:
+        results = await self.pool.map(self._lookup, seeds)
+        return [record for found in results if found for record in found]
+
+    async def _lookup(self, session: AspNetSession, seed: tuple[str, str]) -> list[DoctorRecord]:
+        """Query one identification on ``session``."""
+        doc_type, number = seed
+        page = await session.submit({
+            self.FIELD_DOC_TYPE: doc_type,
+            self.FIELD_DOC_NUMBER: number,
+            self.FIELD_SUBMIT: "Consultar",
+        })
+        return self._parse_results(page, doc_type, number)
+
+    def _parse_results(self, html: str, doc_type: str, number: str) -> list[DoctorRecord]:
+        """Parse a consultation result page: the person, then their programs."""
+        soup = BeautifulSoup(html, "lxml")
+
+        # Selectors need live validation: SISPRO renders two GridViews
+        person = soup.select_one("table[id$=gvDatosPersona] tr:nth-of-type(2)")
+        if person is None:
+            return []  # no one registered with this identification
+        cells = [td.get_text(strip=True) for td in person.select("td")]
+        if len(cells) < 5:
+            return []
+        first_names, last_names, status = cells[2], cells[3], cells[4]
+
+        # Columns: program type, origin, profession, start date, act, entity
+        programs = []
+        for row in soup.select("table[id$=gvDatosAcademicos] tr"):
+            tds = [td.get_text(strip=True) for td in row.select("td")]
+            if len(tds) >= 3:
+                programs.append(tds)
+
+        name = f"{first_names} {last_names}".strip()
+        if not name:
+            return []
+        id_hash = hashlib.sha256(f"{doc_type}:{number}".encode("utf-8")).hexdigest()
+        act = next((p[4] for p in programs if len(p) > 4 and p[4]), "")
+        if not act:
+            self.logger.debug(f"No registration act for {id_hash[:12]}; keyed by ID hash")
+        return [DoctorRecord(
+            source_country="CO",
+            source_registry="RETHUS",
+            license_number=act or f"ID-{id_hash[:16]}",
+            full_name=name,
+            specialties=[p[2] for p in programs if p[2]],
+            status=status or "UNKNOWN",
+            source_url=self.SEARCH_URL,
+            raw_data={
+                "identificacion_sha256": id_hash,
+                "nombres": first_names,
+                "apellidos": last_names,
+                "estado": status,
+                "programas": programs,
+            },
+        )]
@@ -0,0 +1,245 @@
+"""
+Compact in-memory doctor records for the collection → normalize → export path.
+
+`DoctorRecord` is the validated API-boundary model; at a million records its
+per-instance `__dict__`, fields-set bookkeeping and nine freshly allocated
+containers dominate RSS. `CompactRecord` is a named tuple of the same fields
+that stores lists as tuples (so every empty list is the shared `()`
+singleton), shares one read-only empty mapping for `contact`/`raw_data`, and
+interns the low-cardinality code fields.
+
+It quacks like `DoctorRecord` where the pipeline needs it (attribute access,
+`model_dump()`); convert with `to_model()` only at API boundaries.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Union
+
+from .base import DoctorRecord, stable_record_id
+
+FIELDS: tuple[str, ...] = tuple(DoctorRecord.model_fields)
+
+LIST_FIELDS = frozenset({
+    "specialties", "specialty_codes", "hospital_affiliations",
+    "insurance_networks", "education", "languages",
+})
+DICT_FIELDS = frozenset({"contact", "raw_data"})
+INTERNED_FIELDS = frozenset({"source_country", "source_registry", "status"})
+# Fields that differ between runs without the record changing: change
+# detection (snapshot diffs, SQLite upserts) doesn't compare them
+IGNORED_FIELDS = frozenset({"collected_at", "raw_data"})
+
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+_IDENTITY_FIELDS_ORDER = ("source_country", "source_registry", "license_number")
+_IDENTITY_FIELDS = frozenset(_IDENTITY_FIELDS_ORDER)
+
+_MISSING = object()
+_REQUIRED = object()
+_PLAIN, _LIST, _DICT, _INTERN = range(4)
+
+
+def _field_spec(name: str, field) -> tuple[str, int, Any, Any]:
+    """(name, kind, static default, default factory) for one model field."""
+    if name in LIST_FIELDS:
+        kind = _LIST
+    elif name in DICT_FIELDS:
+        kind = _DICT
+    elif name in INTERNED_FIELDS:
+        kind = _INTERN
+    else:
+        kind = _PLAIN
+
+    if field.is_required():
+        return name, kind, _REQUIRED, None
+    if kind in (_LIST, _DICT):
+        # Shared empties instead of a fresh container per record
+        return name, kind, () if kind == _LIST else EMPTY_MAPPING, None
+    return name, kind, field.default, field.default_factory
+
+
+_SPEC = tuple(_field_spec(n, f) for n, f in DoctorRecord.model_fields.items())
+
+
+def _compact_value(name: str, value: Any) -> Any:
+    if name in LIST_FIELDS:
+        return tuple(value) if value else ()
+    if name in DICT_FIELDS:
+        return dict(value) if value else EMPTY_MAPPING
+    if name in INTERNED_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class CompactRecord(namedtuple("_CompactRecordFields", FIELDS)):
+    """
+    Immutable, tuple-backed twin of `DoctorRecord`.
+
+    Being a tuple subclass keeps instances small (no `__dict__`) and lets
+    batches be rebuilt with the C-level tuple constructor (`from_values`).
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, **fields: Any):
+        if "id" not in fields and _IDENTITY_FIELDS <= fields.keys():
+            fields["id"] = stable_record_id(*(fields[n] for n in _IDENTITY_FIELDS_ORDER))
+        get = fields.get
+        values = []
+        for name, kind, default, factory in _SPEC:
+            value = get(name, _MISSING)
+            if value is _MISSING:
+                if default is _REQUIRED:
+                    raise TypeError(f"CompactRecord missing required field: {name}")
+                value = factory() if factory is not None else default
+            elif kind == _LIST:
+                value = tuple(value) if value else ()
+            elif kind == _DICT:
+                value = dict(value) if value else EMPTY_MAPPING
+            elif kind == _INTERN and type(value) is str:
+                value = sys.intern(value)
+            values.append(value)
+        return tuple.__new__(cls, values)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactRecord(id={self.id!r}, source_country={self.source_country!r}, "
+            f"license_number={self.license_number!r}, full_name={self.full_name!r})"
+        )
+
+    def __reduce__(self):
+        # Mapping proxies don't pickle; ship plain dicts and re-compact on load
+        state = tuple(
+            dict(v) if n in DICT_FIELDS else v for n, v in zip(FIELDS, self)
+        )
+        return (_from_state, (state,))
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CompactRecord":
+        """Build from a trusted dict (e.g. a raw file row) without validation."""
+        return cls(**data)
+
+    @classmethod
+    def from_model(cls, record: DoctorRecord) -> "CompactRecord":
+        return cls(**{n: getattr(record, n) for n in FIELDS})
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "CompactRecord":
+        """
+        Build from field values in `FIELDS` order that are already compact
+        (tuples for lists, shared empties) — no defaults, no conversion.
+        """
+        return tuple.__new__(cls, values)
+
+    def replace(self, **changes: Any) -> "CompactRecord":
+        """Return a copy with some fields changed (unchanged fields are shared)."""
+        for name in changes:
+            changes[name] = _compact_value(name, changes[name])
+        return tuple.__new__(
+            CompactRecord, [changes[n] if n in changes else v for n, v in zip(FIELDS, self)]
+        )
+
+    # -- boundary conversion ------------------------------------------------
+
+    def model_dump(self) -> dict[str, Any]:
+        """Same shape as `DoctorRecord.model_dump()` (lists and plain dicts)."""
+        out = dict(zip(FIELDS, self))
+        for name in LIST_FIELDS:
+            out[name] = list(out[name])
+        for name in DICT_FIELDS:
+            out[name] = dict(out[name])
+        return out
+
+    def as_json_obj(self, exclude: frozenset[str] = frozenset()) -> dict[str, Any]:
+        """Shallow field dict for the JSON encoders (no container copies)."""
+        if not exclude:
+            return dict(zip(FIELDS, self))
+        return {n: v for n, v in zip(FIELDS, self) if n not in exclude}
+
+    def to_model(self) -> DoctorRecord:
+        """Materialize a full pydantic model (API boundary only)."""
+        return DoctorRecord.model_validate(self.model_dump())
+
+
+def _from_state(state: tuple) -> CompactRecord:
+    return tuple.__new__(
+        CompactRecord, [_compact_value(n, v) for n, v in zip(FIELDS, state)]
+    )
+
+
+# Field positions of the mapping fields (see to_plain / from_plain)
+_DICT_SLOTS = tuple(i for i, n in enumerate(FIELDS) if n in DICT_FIELDS)
+
+
+def to_plain(record: CompactRecord) -> tuple:
+    """
+    Field values as a plain, cheaply picklable tuple.
+
+    Pickling a `CompactRecord` goes through `__reduce__` per record; plain
+    tuples of strings pickle in C. The shared empty mapping (which doesn't
+    pickle) travels as None.
+    """
+    values = list(record)
+    for i in _DICT_SLOTS:
+        if values[i] is EMPTY_MAPPING:
+            values[i] = None
+    return tuple(values)
+
+
+def from_plain(values: Iterable[Any]) -> CompactRecord:
+    """Inverse of `to_plain()`."""
+    values = list(values)
+    for i in _DICT_SLOTS:
+        if values[i] is None:
+            values[i] = EMPTY_MAPPING
+    return tuple.__new__(CompactRecord, values)
+
+
+RecordLike = Union[DoctorRecord, CompactRecord]
+
+
+class RecordBatch:
+    """
+    Column-oriented batch of records: one list per field, in `FIELDS` order.
+
+    Used by the columnar normalizer, which transforms whole columns at once
+    and only rebuilds per-record objects at the end.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: dict[str, list[Any]]):
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[RecordLike]) -> "RecordBatch":
+        rows = [to_compact(r) for r in records]
+        if not rows:
+            return cls({n: [] for n in FIELDS})
+        return cls({n: list(col) for n, col in zip(FIELDS, zip(*rows))})
+
+    def __len__(self) -> int:
+        return len(self.columns[FIELDS[0]])
+
+    def to_records(self) -> list[CompactRecord]:
+        make = CompactRecord.from_values
+        return [make(values) for values in zip(*(self.columns[n] for n in FIELDS))]
+
+
+def to_compact(record: RecordLike) -> CompactRecord:
+    if isinstance(record, CompactRecord):
+        return record
+    return CompactRecord.from_model(record)
+
+
+def replace_fields(record: RecordLike, **changes: Any) -> RecordLike:
+    """Copy a record of either kind with some fields changed."""
+    if isinstance(record, CompactRecord):
+        return record.replace(**changes)
+    return record.model_copy(update=changes)
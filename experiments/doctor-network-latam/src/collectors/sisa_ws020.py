@@ -0,0 +1,307 @@
+"""
+SISA WS020 client: REFEPS professionals as structured XML.
+
+The WS020 web service answers the same queries as the public REFEPS search
+(by jurisdiction, by surname) with SOAP XML, ``PAGE_SIZE`` professionals
+per call instead of one HTML results page. `Ws020Client`:
+
+  - fetches the WSDL through the collector's rate-limited session, caches
+    it under ``data/cache/`` and has zeep parse it once per process
+    (`load_wsdl()`); envelopes come from `zeep.Client.create_message()` and
+    the SOAPAction from the WSDL's port, so zeep never opens a connection
+    of its own (SOAP 1.1, which is what WS020 publishes)
+  - posts every envelope on the collector's keep-alive httpx session
+  - reads each ``<profesional>`` element with lxml straight into a
+    `DoctorRecord`, skipping zeep's response deserialization (an object
+    tree per row that would only be copied again)
+  - requests a query's remaining pages concurrently once the first page
+    gives the total: the rate limiter still spaces the requests, but their
+    round trips overlap
+
+Credentials come from ``SISA_WS_USER`` / ``SISA_WS_PASSWORD``. Without
+them, or without zeep, `Ws020Client.from_config()` returns None and the
+collector scrapes the HTML search. Failed calls raise `Ws020Error`.
+
+Needs live validation: the operation and field names used here
+(``OPERATION``, ``REQUEST_FIELDS``, ``RESPONSE_FIELDS``,
+``PROFESIONAL_FIELDS``) are assumptions that have only been exercised
+against the mock service in ``benchmarks/bench_refeps_ws020.py``, not
+against SISA itself. `connect()` checks them against the WSDL it loads
+and raises `Ws020Error` naming whatever is missing, so a mismatch falls
+back to the HTML search instead of sending requests SISA won't answer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import httpx
+from lxml import etree
+from tenacity import RetryError
+
+from ..utils.http_client import RateLimitedClient
+from ..utils.logger import get_logger
+from .base import DATA_DIR, DoctorRecord
+
+try:
+    import zeep
+except ImportError:  # pragma: no cover - depends on environment
+    zeep = None
+
+logger = get_logger("collector.AR.ws020")
+
+# Unverified against the live WSDL (see the module docstring)
+OPERATION = "buscarProfesionales"
+REQUEST_FIELDS = ("usuario", "clave", "jurisdiccion", "apellido", "pagina", "registros")
+RESPONSE_FIELDS = ("total", "profesional")
+PROFESIONAL_FIELDS = ("apellido", "nombre", "matricula")
+PAGE_SIZE = 500
+USER_ENV = "SISA_WS_USER"
+PASSWORD_ENV = "SISA_WS_PASSWORD"
+WSDL_CACHE_DIR = DATA_DIR / "cache"
+WSDL_MAX_AGE = 24 * 3600  # seconds before the cached WSDL is fetched again
+
+# Responses are trusted to be data, never to pull in entities or URLs
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+
+
+class Ws020Error(Exception):
+    """A WS020 call failed: transport error, SOAP fault or unexpected response."""
+
+
+@lru_cache(maxsize=4)
+def load_wsdl(path: str, version: int) -> "zeep.Client":
+    """Parse a cached WSDL; once per file ``version`` (its mtime)."""
+    return zeep.Client(path)
+
+
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+class Ws020Client:
+    """WS020 queries over a collector's `RateLimitedClient`."""
+
+    def __init__(
+        self,
+        http: RateLimitedClient,
+        url: str,
+        user: str,
+        password: str,
+        source_url: str = "",
+        page_size: int = PAGE_SIZE,
+    ):
+        self.http = http
+        self.url = url
+        self.user = user
+        self.password = password
+        self.source_url = source_url or url
+        self.page_size = page_size
+        self._client: Optional["zeep.Client"] = None
+        self._service = None
+        self._endpoint = url
+        self._headers: dict[str, str] = {}
+
+    @classmethod
+    def from_config(
+        cls, http: RateLimitedClient, url: str, source_url: str = ""
+    ) -> Optional["Ws020Client"]:
+        """A client if zeep and credentials are available, else None."""
+        if zeep is None:
+            logger.info("zeep is not installed; using the REFEPS HTML search")
+            return None
+        user, password = os.environ.get(USER_ENV), os.environ.get(PASSWORD_ENV)
+        if not user or not password:
+            logger.info(f"{USER_ENV} / {PASSWORD_ENV} not set; using the REFEPS HTML search")
+            return None
+        return cls(http, url, user, password, source_url)
+
+    # -- WSDL ----------------------------------------------------------------
+
+    @property
+    def connected(self) -> bool:
+        """Whether the WSDL has been loaded."""
+        return self._client is not None
+
+    @property
+    def wsdl_path(self) -> Path:
+        digest = hashlib.sha1(self.url.encode("utf-8")).hexdigest()[:12]
+        return WSDL_CACHE_DIR / f"ws020_{digest}.wsdl"
+
+    async def connect(self) -> None:
+        """Load the parsed WSDL, fetching it first if the cached copy is missing or old."""
+        if self._client is not None:
+            return
+        path = self.wsdl_path
+        try:
+            stale = time.time() - path.stat().st_mtime > WSDL_MAX_AGE
+        except FileNotFoundError:
+            stale = True
+        try:
+            if stale:
+                response = await self.http.get(f"{self.url}?wsdl")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_bytes(response.content)
+                tmp.replace(path)
+            client = load_wsdl(str(path), path.stat().st_mtime_ns)
+            service, port = self._find_port(client)
+            operation = port.binding.get(OPERATION)
+        except (httpx.HTTPError, RetryError, OSError, ValueError, zeep.exceptions.Error) as e:
+            raise Ws020Error(f"WSDL unavailable: {e}") from e
+        missing = self._missing_names(operation)
+        if missing:
+            raise Ws020Error(
+                f"WSDL of {self.url} does not match the names this client assumes; "
+                f"missing: {', '.join(missing)}"
+            )
+        self._client = client
+        self._service = client.bind(service.name, port.name)
+        self._endpoint = port.binding_options.get("address") or self.url
+        self._headers = {
+            "Content-Type": "text/xml; charset=utf-8",
+            "SOAPAction": f'"{operation.soapaction or ""}"',
+        }
+
+    @staticmethod
+    def _find_port(client: "zeep.Client"):
+        """(service, port) of the WSDL whose binding has the operation."""
+        for service in client.wsdl.services.values():
+            for port in service.ports.values():
+                try:
+                    port.binding.get(OPERATION)
+                except ValueError:
+                    continue
+                return service, port
+        raise ValueError(f"No port offers {OPERATION}")
+
+    @staticmethod
+    def _missing_names(operation) -> list[str]:
+        """Assumed request/response element names the WSDL's operation lacks."""
+
+        def names(element) -> dict:
+            try:
+                return dict(element.type.elements)
+            except AttributeError:  # not a complex type
+                return {}
+
+        request = names(operation.input.body)
+        response = names(operation.output.body)
+        missing = [f"request {n}" for n in REQUEST_FIELDS if n not in request]
+        missing += [f"response {n}" for n in RESPONSE_FIELDS if n not in response]
+        if "profesional" in response:
+            profesional = names(response["profesional"])
+            missing += [f"profesional {n}" for n in PROFESIONAL_FIELDS if n not in profesional]
+        return missing
+
+    # -- queries -------------------------------------------------------------
+
+    async def search(
+        self,
+        jurisdiccion: str = "",
+        apellido: str = "",
+        limit: Optional[int] = None,
+    ) -> list[DoctorRecord]:
+        """Every professional matching the query (or the first ``limit``)."""
+        await self.connect()
+        size = min(limit, self.page_size) if limit else self.page_size
+        params = {"jurisdiccion": jurisdiccion, "apellido": apellido, "registros": size}
+        total, records = await self._page(params, 1)
+        if limit:
+            total = min(total, limit)
+        pages = -(-total // size)
+        if pages > 1:
+            results = await asyncio.gather(
+                *(self._page(params, page) for page in range(2, pages + 1)),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result if isinstance(result, Ws020Error) else Ws020Error(str(result))
+                records.extend(result[1])
+        return records[:limit] if limit else records
+
+    def create_envelope(self, params: dict, page: int):
+        """SOAP envelope (lxml element) of one page of a query."""
+        return self._client.create_message(
+            self._service, OPERATION,
+            usuario=self.user, clave=self.password, pagina=page, **params,
+        )
+
+    async def _page(self, params: dict, page: int) -> tuple[int, list[DoctorRecord]]:
+        """(total matches, records) of one page."""
+        envelope = self.create_envelope(params, page)
+        try:
+            response = await self.http.post(
+                self._endpoint, content=etree.tostring(envelope, encoding="utf-8"),
+                headers=self._headers,
+            )
+        except httpx.HTTPStatusError as e:
+            # SOAP 1.1 faults come back as HTTP 500 with the fault as the body
+            if e.response.status_code != 500:
+                raise Ws020Error(str(e)) from e
+            response = e.response
+        except (httpx.HTTPError, RetryError) as e:
+            raise Ws020Error(str(e)) from e
+        return self.parse_response(response.content)
+
+    # -- responses -----------------------------------------------------------
+
+    def parse_response(self, body: bytes) -> tuple[int, list[DoctorRecord]]:
+        try:
+            root = etree.fromstring(body, _PARSER)
+        except etree.XMLSyntaxError as e:
+            raise Ws020Error(f"Malformed response: {e}") from e
+        fault = next(root.iter("{*}Fault"), None)
+        if fault is not None:
+            message = next(fault.iter("faultstring", "{*}Text"), None)
+            raise Ws020Error(f"SOAP fault: {message.text if message is not None else 'unknown'}")
+        total = next(root.iter("{*}total"), None)
+        if total is None:
+            raise Ws020Error("Response has no <total>")
+        records: list[DoctorRecord] = []
+        for element in root.iter("{*}profesional"):
+            try:
+                record = self._to_record(element)
+            except ValueError as e:
+                logger.debug(f"Failed to map profesional: {e}")
+                continue
+            if record:
+                records.append(record)
+        return int(total.text or 0), records
+
+    def _to_record(self, element) -> Optional[DoctorRecord]:
+        """One ``<profesional>`` element as a `DoctorRecord`."""
+        fields: dict[str, str] = {}
+        specialties: list[str] = []
+        for child in element:
+            tag = _local(child.tag)
+            if tag == "especialidades":
+                specialties = [s.text.strip() for s in child if s.text and s.text.strip()]
+            else:
+                fields[tag] = (child.text or "").strip()
+        name = " ".join(filter(None, (fields.get("nombre"), fields.get("apellido"))))
+        matricula = fields.get("matricula", "")
+        if not name or not matricula:
+            return None
+        raw = {"source": "ws020", **fields, "especialidades": specialties}
+        if not specialties:
+            # Same as the HTML search, which only shows the profession column
+            specialties = [s.strip() for s in fields.get("profesion", "").split(",") if s.strip()]
+        return DoctorRecord(
+            source_country="AR",
+            source_registry="REFEPS",
+            license_number=matricula,
+            full_name=name,
+            specialties=specialties,
+            state_region=fields.get("jurisdiccion") or None,
+            status=fields.get("estado") or "UNKNOWN",
+            source_url=self.source_url,
+            raw_data=raw,
+        )
@@ -0,0 +1,52 @@
+"""
+Aggregate cube export: doctor counts by country × state × specialty × status.
+
+`CubeSink` fills an `AggregateCube` from the batches of the export fan-out,
+so the rollups come out of the same pass as the other formats, and writes
+it as one JSON file. ``cube`` holds a row per rollup
+(``[country, state, specialty, status, doctors]``, ``"*"`` = all), so a
+dashboard looks counts up instead of scanning records; ``doctors`` and
+``specialties`` hold the base counts `AggregateCube.load()` reads back.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..collectors.compact import RecordLike
+from ..normalizers.aggregates import AggregateCube
+from ..utils.logger import get_logger
+from . import export as _export
+from .export import ExportSink, RecordObj, _timestamp, run_sink
+
+logger = get_logger("exporter.cube")
+
+
+class CubeSink(ExportSink):
+    """Aggregate cube of the exported records, as JSON."""
+
+    name = "cube"
+
+    def open(self) -> None:
+        self.cube = AggregateCube()
+
+    def write(self, batch: list[RecordObj]) -> None:
+        add = self.cube.add_values
+        for obj in batch:
+            add(obj["source_country"], obj["state_region"], obj["status"], obj["specialty_codes"])
+        self.count += len(batch)
+
+    def close(self) -> Path:
+        self.cube.save(self.filepath)
+        logger.info(
+            f"Exported aggregate cube of {self.count} records to {self.filepath} "
+            f"({len(self.cube.cube())} rollup rows)"
+        )
+        return self.filepath
+
+
+def export_cube(records: Iterable[RecordLike], filename: Optional[str] = None) -> Path:
+    """Export the aggregate cube of ``records``."""
+    filename = filename or f"doctors_cube_{_timestamp()}.json"
+    return run_sink(CubeSink(_export.EXPORTS_DIR / filename), records)
@@ -1,22 +1,40 @@
 """
 Export normalized doctor records to various formats:
   - JSON (default)
+  - JSON Lines (one record per line, for streaming consumers)
   - CSV (for analysis in spreadsheets)
   - SQLite (for local querying)
-  - Prisma-compatible JSON (for future platform integration)
+  - Parquet (for analytics; see `parquet.py`)
+  - Postgres COPY files + DDL and Prisma model (for platform ingestion;
+    see `postgres.py`)
+
+Each format is an `ExportSink` that is fed batches of `record_to_obj()`
+dicts, so the same batches can be streamed to several formats at once
+(see `fanout.py`). `export_json()` and friends run a single sink.
+
+File sinks write through `open_output()` in bounded chunks and can compress
+on the fly (gzip, or zstd when installed), so memory stays flat however
+many records are exported.
 """
 
 from __future__ import annotations
 
 import csv
+import io
 import json
 import sqlite3
+import time
+from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional
 
-from ..collectors.base import DoctorRecord
+from ..collectors.compact import IGNORED_FIELDS, RecordLike
+from ..utils.compression import check_compression, compressed_path, open_output
+from ..utils.json_stream import batched
 from ..utils.logger import get_logger
+from ..utils.serialize import JsonArrayWriter, get_encoder, record_to_obj
 
 logger = get_logger("exporter")
 
@@ -24,51 +42,377 @@ EXPORTS_DIR = Path(__file__).resolve().parents[2] / "data" / "exports"
 EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def export_json(records: list[DoctorRecord], filename: Optional[str] = None) -> Path:
-    """Export to JSON."""
+# Records per batch handed to a sink
+EXPORT_BATCH_SIZE = 5_000
+
+RecordObj = dict[str, Any]
+
+
+class ExportSink(ABC):
+    """
+    Streaming writer for one export format.
+
+    Called as ``open()``, any number of ``write(batch)``, then ``close()``
+    (or ``abort()`` on failure), all from one thread.
+    """
+
+    name: str
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.count = 0
+
+    @abstractmethod
+    def open(self) -> None: ...
+
+    @abstractmethod
+    def write(self, batch: list[RecordObj]) -> None: ...
+
+    @abstractmethod
+    def close(self) -> Path: ...
+
+    def abort(self) -> None:
+        """
+        Release resources after a failed export (the output is incomplete).
+
+        Also called when ``open()`` itself failed, so it must cope with a
+        sink that was only partly opened.
+        """
+
+
+def run_sink(sink: ExportSink, records: Iterable[RecordLike]) -> Path:
+    """Feed all records to one sink."""
+    try:
+        sink.open()
+        for batch in batched(records, EXPORT_BATCH_SIZE):
+            sink.write([record_to_obj(r) for r in batch])
+    except BaseException:
+        sink.abort()
+        raise
+    return sink.close()
+
+
+class FileSink(ExportSink):
+    """Sink writing one (optionally compressed) file."""
+
+    def __init__(self, filepath: Path, compression: Optional[str] = None):
+        check_compression(compression)
+        super().__init__(filepath)
+        self.compression = compression
+        self._file = None
+
+    def open(self) -> None:
+        self._file = open_output(self.filepath, self.compression)
+
+    def close(self) -> Path:
+        self._file.close()
+        return self.filepath
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class JsonSink(FileSink):
+    """JSON array, one record per line (``pretty=True``: indented)."""
+
+    name = "json"
+
+    def __init__(
+        self,
+        filepath: Path,
+        pretty: bool = False,
+        backend: Optional[str] = None,
+        compression: Optional[str] = None,
+    ):
+        super().__init__(filepath, compression)
+        self.pretty = pretty
+        self.encode = get_encoder(backend)
+
+    def open(self) -> None:
+        super().open()
+        self._writer = JsonArrayWriter(self._file, self.pretty)
+
+    def write(self, batch: list[RecordObj]) -> None:
+        encode, pretty = self.encode, self.pretty
+        self._writer.write_many(encode(obj, pretty) for obj in batch)
+        self.count += len(batch)
+
+    def close(self) -> Path:
+        self._writer.close()
+        super().close()
+        logger.info(f"Exported {self.count} records to {self.filepath}")
+        return self.filepath
+
+
+class JsonLinesSink(FileSink):
+    """JSON Lines: one compact record per line, no enclosing array."""
+
+    name = "jsonl"
+
+    def __init__(
+        self, filepath: Path, backend: Optional[str] = None, compression: Optional[str] = None
+    ):
+        super().__init__(filepath, compression)
+        self.encode = get_encoder(backend)
+
+    def write(self, batch: list[RecordObj]) -> None:
+        if not batch:
+            return
+        encode = self.encode
+        self._file.write(b"\n".join([encode(obj, False) for obj in batch]))
+        self._file.write(b"\n")
+        self.count += len(batch)
+
+    def close(self) -> Path:
+        super().close()
+        logger.info(f"Exported {self.count} records to JSON Lines: {self.filepath}")
+        return self.filepath
+
+
+CSV_FIELDS = (
+    "id", "source_country", "source_registry", "license_number",
+    "full_name", "specialties", "status", "state_region", "city",
+    "hospital_affiliations", "insurance_networks", "collected_at", "source_url",
+)
+
+
+class CsvSink(FileSink):
+    """CSV with list columns flattened to semicolon-separated strings."""
+
+    name = "csv"
+
+    def __init__(self, filepath: Path, compression: Optional[str] = None):
+        super().__init__(filepath, compression)
+        self._text: Optional[io.TextIOWrapper] = None
+
+    def open(self) -> None:
+        super().open()
+        self._text = io.TextIOWrapper(self._file, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._text)
+        self._writer.writerow(CSV_FIELDS)
+
+    def write(self, batch: list[RecordObj]) -> None:
+        # Rows are read straight off the shared record dicts; only list
+        # columns are rebuilt
+        self._writer.writerows(
+            [
+                "; ".join(v) if isinstance(v, (list, tuple)) else v
+                for v in map(obj.get, CSV_FIELDS)
+            ]
+            for obj in batch
+        )
+        self.count += len(batch)
+
+    def close(self) -> Path:
+        self._text.close()  # flushes and closes the underlying stream
+        logger.info(f"Exported {self.count} records to CSV: {self.filepath}")
+        return self.filepath
+
+    def abort(self) -> None:
+        if self._text is not None:
+            self._text.close()  # closes the underlying stream too
+        else:
+            super().abort()
+
+
+def export_json(
+    records: Iterable[RecordLike],
+    filename: Optional[str] = None,
+    pretty: bool = False,
+    backend: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> Path:
+    """Export to JSON (compact by default; ``pretty=True`` for indented output)."""
     filename = filename or f"doctors_export_{_timestamp()}.json"
-    filepath = EXPORTS_DIR / filename
-    data = [r.model_dump() for r in records]
-    filepath.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    logger.info(f"Exported {len(records)} records to {filepath}")
-    return filepath
+    filepath = compressed_path(EXPORTS_DIR / filename, compression)
+    return run_sink(JsonSink(filepath, pretty, backend, compression), records)
+
+
+def export_jsonl(
+    records: Iterable[RecordLike],
+    filename: Optional[str] = None,
+    backend: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> Path:
+    """Export to JSON Lines (one record per line)."""
+    filename = filename or f"doctors_export_{_timestamp()}.jsonl"
+    filepath = compressed_path(EXPORTS_DIR / filename, compression)
+    return run_sink(JsonLinesSink(filepath, backend, compression), records)
 
 
-def export_csv(records: list[DoctorRecord], filename: Optional[str] = None) -> Path:
+def export_csv(
+    records: Iterable[RecordLike],
+    filename: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> Path:
     """Export to CSV with flattened columns."""
     filename = filename or f"doctors_export_{_timestamp()}.csv"
-    filepath = EXPORTS_DIR / filename
-
-    fieldnames = [
-        "id", "source_country", "source_registry", "license_number",
-        "full_name", "specialties", "status", "state_region", "city",
-        "hospital_affiliations", "insurance_networks", "collected_at", "source_url",
-    ]
-
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in records:
-            row = r.model_dump()
-            # Flatten lists to semicolon-separated strings
-            for key in ["specialties", "hospital_affiliations", "insurance_networks", "education", "languages"]:
-                if key in row and isinstance(row[key], list):
-                    row[key] = "; ".join(row[key])
-            writer.writerow({k: row.get(k, "") for k in fieldnames})
-
-    logger.info(f"Exported {len(records)} records to CSV: {filepath}")
-    return filepath
-
-
-def export_sqlite(records: list[DoctorRecord], filename: Optional[str] = None) -> Path:
-    """Export to SQLite database for local querying."""
-    filename = filename or f"doctors_{_timestamp()}.db"
-    filepath = EXPORTS_DIR / filename
+    filepath = compressed_path(EXPORTS_DIR / filename, compression)
+    return run_sink(CsvSink(filepath, compression), records)
+
 
-    conn = sqlite3.connect(str(filepath))
-    cursor = conn.cursor()
+# Record ids are stable (see `stable_record_id`), so re-exporting into an
+# existing database upserts by id and leaves unchanged rows untouched. A row
+# that was soft-deleted and shows up again is revived. ``collected_at`` is
+# not compared (every run sets it), but is updated along with a change.
+_SQLITE_COLUMNS = (
+    "id", "source_country", "source_registry", "license_number", "full_name",
+    "specialties", "specialty_codes", "status", "state_region", "city",
+    "hospital_affiliations", "insurance_networks", "education", "languages",
+    "contact", "collected_at", "source_url",
+)
+_SQLITE_COMPARED = tuple(c for c in _SQLITE_COLUMNS[1:] if c not in IGNORED_FIELDS)
+_SQLITE_UPSERT = f"""
+    INSERT INTO doctors ({", ".join(_SQLITE_COLUMNS)})
+    VALUES ({", ".join("?" for _ in _SQLITE_COLUMNS)})
+    ON CONFLICT(id) DO UPDATE SET
+        {", ".join(f"{c} = excluded.{c}" for c in _SQLITE_COLUMNS[1:])}, deleted_at = NULL
+    WHERE ({", ".join(f"doctors.{c}" for c in _SQLITE_COMPARED)}, doctors.deleted_at)
+        IS NOT ({", ".join(f"excluded.{c}" for c in _SQLITE_COMPARED)}, NULL)
+"""
+_SQLITE_INDEXES = {
+    "idx_country": "source_country",
+    "idx_status": "status",
+    "idx_license": "license_number",
+    "idx_region": "state_region",
+}
+# Indexes of earlier exports that no query can use (JSON-encoded column)
+_SQLITE_OBSOLETE_INDEXES = ("idx_specialty",)
 
-    cursor.execute("""
+# Junction tables derived from the JSON list columns, keyed (WITHOUT ROWID)
+# on (value, state_region, doctor_id) so "<value> in <region>" is one range
+# of the table itself; a missing region is stored as '':
+# table → (list column in doctors, value column)
+SQLITE_JUNCTIONS = {
+    "doctor_specialties": ("specialties", "specialty"),
+    "doctor_specialty_codes": ("specialty_codes", "code"),
+    "doctor_insurance_networks": ("insurance_networks", "network"),
+    "doctor_hospital_affiliations": ("hospital_affiliations", "hospital"),
+}
+# Name search: the tokenizer folds case and accents, so "jose" finds "José";
+# 2- to 4-character prefix indexes serve typeahead queries. FTS rows share
+# the rowid of their doctors row, which is how refreshes find them (doctors
+# has no INTEGER PRIMARY KEY, so after a VACUUM drop the table and let the
+# next export rebuild it).
+SQLITE_FTS_TABLE = "doctors_fts"
+_SQLITE_FTS_DDL = f"""
+    CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5(
+        full_name, doctor_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3 4'
+    )
+"""
+# Rows per executemany() call; the whole load is still one transaction
+SQLITE_BATCH_SIZE = 10_000
+
+
+@lru_cache(maxsize=1 << 14)
+def _json_list(values: tuple) -> str:
+    """JSON text of a list column; the same few lists repeat across records."""
+    return json.dumps(values)
+
+
+def _sqlite_row(obj: RecordObj) -> tuple:
+    """Column values for one record (lists and contact as JSON text)."""
+    contact = obj["contact"]
+    return (
+        obj["id"], obj["source_country"], obj["source_registry"], obj["license_number"],
+        obj["full_name"],
+        _json_list(tuple(obj["specialties"])),
+        _json_list(tuple(obj["specialty_codes"])),
+        obj["status"], obj["state_region"], obj["city"],
+        _json_list(tuple(obj["hospital_affiliations"])),
+        _json_list(tuple(obj["insurance_networks"])),
+        _json_list(tuple(obj["education"])),
+        _json_list(tuple(obj["languages"])),
+        json.dumps(dict(contact)) if contact else "{}",
+        obj["collected_at"], obj["source_url"],
+    )
+
+
+def _rebuild_sqlite_search(conn: sqlite3.Connection) -> None:
+    """
+    Rebuild the junction tables and the name index from ``doctors``.
+
+    Runs inside SQLite (``json_each`` over the stored list columns), so it
+    always reflects every live row of the database, not just this export's.
+    Indexes are created after each table is filled. Runs in the caller's
+    transaction.
+    """
+    for table, (column, value) in SQLITE_JUNCTIONS.items():
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"""
+            CREATE TABLE {table} (
+                {value} TEXT NOT NULL,
+                state_region TEXT NOT NULL,
+                doctor_id TEXT NOT NULL,
+                PRIMARY KEY ({value}, state_region, doctor_id)
+            ) WITHOUT ROWID
+        """)
+        # Key order, so the b-tree is built by appending
+        conn.execute(f"""
+            INSERT OR IGNORE INTO {table} ({value}, state_region, doctor_id)
+            SELECT j.value, coalesce(d.state_region, ''), d.id
+            FROM doctors d, json_each(d.{column}) j
+            WHERE d.deleted_at IS NULL
+            ORDER BY 1, 2, 3
+        """)
+
+    conn.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+    conn.execute(_SQLITE_FTS_DDL)
+    conn.execute(f"""
+        INSERT INTO {SQLITE_FTS_TABLE} (rowid, full_name, doctor_id)
+        SELECT rowid, full_name, id FROM doctors WHERE deleted_at IS NULL
+    """)
+    conn.execute(f"INSERT INTO {SQLITE_FTS_TABLE} ({SQLITE_FTS_TABLE}) VALUES ('optimize')")
+
+
+def _create_search_triggers(conn: sqlite3.Connection) -> None:
+    """
+    Keep the junction tables and the name index in step with ``doctors``.
+
+    TEMP triggers live only on this connection, so a refresh touches the
+    search tables for the rows it changes and nothing else, while bulk
+    loads pay nothing. Soft-deleted rows leave the search tables; revived
+    rows come back.
+    """
+    remove = "".join(
+        f"""
+            DELETE FROM {table} WHERE old.deleted_at IS NULL AND doctor_id = old.id
+              AND state_region = coalesce(old.state_region, '')
+              AND {value} IN (SELECT value FROM json_each(old.{column}));"""
+        for table, (column, value) in SQLITE_JUNCTIONS.items()
+    ) + f"""
+            DELETE FROM {SQLITE_FTS_TABLE} WHERE old.deleted_at IS NULL AND rowid = old.rowid;"""
+    add = "".join(
+        f"""
+            INSERT OR IGNORE INTO {table} ({value}, state_region, doctor_id)
+            SELECT value, coalesce(new.state_region, ''), new.id FROM json_each(new.{column})
+            WHERE new.deleted_at IS NULL;"""
+        for table, (column, value) in SQLITE_JUNCTIONS.items()
+    ) + f"""
+            INSERT INTO {SQLITE_FTS_TABLE} (rowid, full_name, doctor_id)
+            SELECT new.rowid, new.full_name, new.id WHERE new.deleted_at IS NULL;"""
+
+    conn.execute(f"""
+        CREATE TEMP TRIGGER IF NOT EXISTS doctors_search_insert AFTER INSERT ON main.doctors
+        BEGIN {add}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TEMP TRIGGER IF NOT EXISTS doctors_search_update AFTER UPDATE ON main.doctors
+        BEGIN {remove}{add}
+        END
+    """)
+
+
+def _has_sqlite_search(conn: sqlite3.Connection) -> bool:
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return SQLITE_FTS_TABLE in tables and tables.issuperset(SQLITE_JUNCTIONS)
+
+
+def _create_sqlite_schema(conn: sqlite3.Connection) -> None:
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS doctors (
             id TEXT PRIMARY KEY,
             source_country TEXT NOT NULL,
@@ -86,54 +430,203 @@ def export_sqlite(records: list[DoctorRecord], filename: Optional[str] = None) -
             languages TEXT,
             contact TEXT,
             collected_at TEXT,
-            source_url TEXT
+            source_url TEXT,
+            deleted_at TEXT
         )
     """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_country ON doctors(source_country);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_status ON doctors(status);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_license ON doctors(license_number);
-    """)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_specialty ON doctors(specialties);
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(doctors)")}
+    if "deleted_at" not in columns:  # export written before soft-deletes
+        conn.execute("ALTER TABLE doctors ADD COLUMN deleted_at TEXT")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS export_runs (
+            run_id INTEGER PRIMARY KEY,
+            started_at TEXT NOT NULL,
+            finished_at TEXT NOT NULL,
+            countries TEXT NOT NULL,
+            records INTEGER NOT NULL,
+            inserted INTEGER NOT NULL,
+            updated INTEGER NOT NULL,
+            unchanged INTEGER NOT NULL,
+            deleted INTEGER NOT NULL
+        )
     """)
 
-    for r in records:
-        d = r.model_dump()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO doctors
-            (id, source_country, source_registry, license_number, full_name,
-             specialties, specialty_codes, status, state_region, city,
-             hospital_affiliations, insurance_networks, education, languages,
-             contact, collected_at, source_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                d["id"], d["source_country"], d["source_registry"], d["license_number"],
-                d["full_name"],
-                json.dumps(d["specialties"]),
-                json.dumps(d["specialty_codes"]),
-                d["status"], d["state_region"], d["city"],
-                json.dumps(d["hospital_affiliations"]),
-                json.dumps(d["insurance_networks"]),
-                json.dumps(d["education"]),
-                json.dumps(d["languages"]),
-                json.dumps(d["contact"]),
-                d["collected_at"], d["source_url"],
-            ),
+
+def _soft_delete_missing(
+    conn: sqlite3.Connection, ids: Iterable[str], countries: set[str], deleted_at: str
+) -> int:
+    """Mark live rows of ``countries`` whose id is not in ``ids`` as deleted."""
+    if not countries:
+        return 0
+    marks = ", ".join("?" for _ in countries)
+    live = conn.execute(
+        f"SELECT id FROM doctors WHERE deleted_at IS NULL AND source_country IN ({marks})",
+        sorted(countries),
+    )
+    missing = {row[0] for row in live}.difference(ids)
+    if not missing:
+        return 0
+    cursor = conn.executemany(
+        "UPDATE doctors SET deleted_at = ? WHERE id = ?",
+        ((deleted_at, i) for i in sorted(missing)),
+    )
+    return cursor.rowcount
+
+
+class SqliteSink(ExportSink):
+    """
+    SQLite database, bulk-loaded or refreshed in place (see `export_sqlite()`).
+
+    Everything between ``open()`` and ``close()`` is one transaction.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self, filepath: Path, persistent: bool = False, scope: Optional[Iterable[str]] = None
+    ):
+        super().__init__(filepath)
+        self.persistent = persistent
+        self.scope = set(scope) if scope is not None else None
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def open(self) -> None:
+        self._started_at = _now()
+        self._start = time.perf_counter()
+        # Autocommit mode: the export manages its one transaction explicitly
+        conn = self.conn = sqlite3.connect(str(self.filepath), isolation_level=None)
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MB for the index builds
+        _create_sqlite_schema(conn)
+        self._before = conn.execute("SELECT COUNT(*) FROM doctors").fetchone()[0]
+        if self._before:
+            # Readers keep their snapshot while the refresh writes; a crash
+            # only risks the durability of the last commit
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        else:
+            # First load: a rollback journal has nothing to save for new
+            # pages (WAL would write every page twice), and an interrupted
+            # load is simply re-run
+            conn.execute("PRAGMA journal_mode = DELETE")
+            conn.execute("PRAGMA synchronous = OFF")
+
+        # A first load indexes everything in one go afterwards; a refresh of
+        # a database with search tables only updates the entries of changed rows
+        self._incremental_search = bool(self._before) and _has_sqlite_search(conn)
+        if self._incremental_search:
+            _create_search_triggers(conn)
+        self._countries: set[str] = set(self.scope or ())
+        self._ids: list[str] = []
+        self._changed = 0
+        conn.execute("BEGIN IMMEDIATE")
+
+    def write(self, batch: list[RecordObj]) -> None:
+        rows = [_sqlite_row(obj) for obj in batch]
+        for chunk in batched(rows, SQLITE_BATCH_SIZE):
+            # rowcount leaves out the writes made by the search triggers
+            self._changed += self.conn.executemany(_SQLITE_UPSERT, chunk).rowcount
+        if self._before:
+            self._ids.extend(row[0] for row in rows)
+        if self.scope is None:
+            self._countries.update(row[1] for row in rows)
+        self.count += len(rows)
+
+    def close(self) -> Path:
+        conn, count, changed = self.conn, self.count, self._changed
+        try:
+            inserted = conn.execute("SELECT COUNT(*) FROM doctors").fetchone()[0] - self._before
+            deleted = 0
+            if self._before:
+                deleted = _soft_delete_missing(conn, self._ids, self._countries, self._started_at)
+
+            # Building an index over loaded rows beats updating it per insert;
+            # on a refreshed export the indexes already exist and are kept up
+            # to date
+            for name in _SQLITE_OBSOLETE_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+            for name, column in _SQLITE_INDEXES.items():
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON doctors({column})")
+            if not self._incremental_search:
+                _rebuild_sqlite_search(conn)
+
+            conn.execute(
+                "INSERT INTO export_runs VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._started_at, _now(), json.dumps(sorted(self._countries)), count,
+                 inserted, changed - inserted, count - changed, deleted),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            self.abort()
+            raise
+
+        if self.persistent:
+            # Long-lived target: later refreshes don't block its readers
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.close()
+
+        elapsed = time.perf_counter() - self._start
+        logger.info(
+            f"Exported {count} records to SQLite: {self.filepath} "
+            f"({inserted} inserted, {changed - inserted} updated, "
+            f"{count - changed} unchanged, {deleted} soft-deleted; "
+            f"{count / elapsed if elapsed else 0:,.0f} rows/s)"
         )
+        return self.filepath
 
-    conn.commit()
-    conn.close()
-    logger.info(f"Exported {len(records)} records to SQLite: {filepath}")
-    return filepath
+    def abort(self) -> None:
+        if self.conn is None:
+            return
+        if self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+        self.conn.close()
+
+
+def sqlite_sink(
+    filename: Optional[str] = None, scope: Optional[Iterable[str]] = None
+) -> SqliteSink:
+    """Sink for `export_sqlite()`: a named, long-lived database or a new timestamped one."""
+    persistent = filename is not None
+    filename = filename or f"doctors_{_timestamp()}.db"
+    return SqliteSink(EXPORTS_DIR / filename, persistent, scope)
+
+
+def export_sqlite(
+    records: Iterable[RecordLike],
+    filename: Optional[str] = None,
+    scope: Optional[Iterable[str]] = None,
+) -> Path:
+    """
+    Export to SQLite database for local querying.
+
+    Without ``filename`` a new timestamped database is bulk-loaded: rows go
+    in batches inside a single transaction with ``synchronous=OFF``, and
+    indexes are built once the rows are in. A first export to ``filename``
+    is loaded the same way.
+
+    Passing the ``filename`` of a long-lived database refreshes it
+    incrementally, in one transaction:
+
+      - rows are upserted by id, and only changed rows are written;
+      - live rows of the countries in ``scope`` (by default, the countries
+        present in ``records``) that are missing from ``records`` are
+        soft-deleted (``deleted_at`` is set; they are revived if they
+        reappear);
+      - the run and its counts are appended to ``export_runs``.
+
+    Such a database stays in WAL mode, so readers keep querying the
+    previous state until the refresh commits.
+
+    Besides ``doctors``, the database gets junction tables for specialties,
+    specialty codes, insurance networks and hospital affiliations, and an
+    FTS5 index over names (see `sqlite_queries`). They cover live rows only;
+    a refresh updates just the entries of the rows it changed.
+    """
+    return run_sink(sqlite_sink(filename, scope), records)
 
 
 def _timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,198 @@
+"""
+Export fan-out: one pass over the records feeds every requested format.
+
+Running `export_json()`, `export_csv()` and `export_sqlite()` one after the
+other turns each record into a dict three times and costs the sum of the
+three exports. Here the records are batched and converted with
+`record_to_obj()` once; each batch is handed to every sink, and each sink
+writes on its own thread from a bounded queue:
+
+    records → batches of dicts ─┬→ queue → JsonSink   (thread)
+                                ├→ queue → CsvSink    (thread)
+                                └→ queue → SqliteSink (thread)
+
+What the single pass saves is the repeated conversion, not CPU time in
+the sinks. Encoding JSON, ``csv.writer`` and `record_to_obj()` run Python
+code that holds the GIL, so the JSON and CSV sinks take turns on any
+number of cores; only the work that releases it (SQLite executing
+statements, compression, the writes themselves) overlaps the other sinks.
+Processes would run the encoders in parallel but would have to pickle
+every batch they are sent. On one CPU, ``bench_export_fanout.py`` (200k
+records) measured json 0.83s, csv 1.54s and sqlite 3.76s: 6.12s one after
+another, 5.75s fanned out. The bounded queues keep at most
+``queue_depth`` batches per sink in flight.
+
+A failing sink is aborted and keeps draining its queue, so the other
+sinks still finish; the first error is raised once all are done.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..collectors.compact import RecordLike
+from ..utils.compression import compressed_path
+from ..utils.json_stream import batched
+from ..utils.logger import get_logger
+from ..utils.serialize import record_to_obj
+from . import export as _export
+from .cube import CubeSink
+from .export import (
+    EXPORT_BATCH_SIZE,
+    CsvSink,
+    ExportSink,
+    JsonLinesSink,
+    JsonSink,
+    _timestamp,
+    sqlite_sink,
+)
+from .parquet import ParquetSink
+from .postgres import PostgresCopySink
+
+logger = get_logger("exporter.fanout")
+
+DEFAULT_QUEUE_DEPTH = 4
+EXPORT_FORMATS = ("json", "jsonl", "csv", "sqlite", "parquet", "postgres", "cube")
+
+# End of stream markers: finish the export / discard it (the input failed)
+_DONE = None
+_ABORT = object()
+
+
+def make_sinks(
+    formats: Iterable[str],
+    pretty: bool = False,
+    sqlite_db: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> list[ExportSink]:
+    """
+    Sinks for the requested formats, named as the single-format exporters
+    name them. ``compression`` applies to the text formats (JSON, JSON
+    Lines, CSV); Parquet files are always zstd-compressed internally.
+    Raises ValueError for a format not in ``EXPORT_FORMATS``.
+    """
+    stamp = _timestamp()
+
+    def path(suffix: str) -> Path:
+        return compressed_path(_export.EXPORTS_DIR / f"doctors_export_{stamp}.{suffix}", compression)
+
+    sinks: list[ExportSink] = []
+    for fmt in dict.fromkeys(formats):
+        if fmt == "json":
+            sinks.append(JsonSink(path("json"), pretty, compression=compression))
+        elif fmt == "jsonl":
+            sinks.append(JsonLinesSink(path("jsonl"), compression=compression))
+        elif fmt == "csv":
+            sinks.append(CsvSink(path("csv"), compression))
+        elif fmt == "sqlite":
+            sinks.append(sqlite_sink(sqlite_db))
+        elif fmt == "parquet":
+            sinks.append(ParquetSink(_export.EXPORTS_DIR / f"doctors_export_{stamp}.parquet"))
+        elif fmt == "postgres":
+            sinks.append(PostgresCopySink(_export.EXPORTS_DIR / f"doctors_pg_{stamp}"))
+        elif fmt == "cube":
+            sinks.append(CubeSink(_export.EXPORTS_DIR / f"doctors_cube_{stamp}.json"))
+        else:
+            raise ValueError(
+                f"Unknown export format: {fmt} (available: {', '.join(EXPORT_FORMATS)})"
+            )
+    return sinks
+
+
+class _SinkWorker(threading.Thread):
+    """Drains one sink's queue into the sink, timing the sink's own work."""
+
+    def __init__(self, sink: ExportSink, queue_depth: int):
+        super().__init__(name=f"export-{sink.name}", daemon=True)
+        self.sink = sink
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_depth)
+        self.busy = 0.0
+        self.error: Optional[BaseException] = None
+        self.path: Optional[Path] = None
+
+    def _timed(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.busy += time.perf_counter() - start
+
+    def _fail(self, error: BaseException) -> None:
+        """Record the sink's error and abort it; the queue is still drained."""
+        self.error = error
+        try:
+            self.sink.abort()
+        except Exception as e:
+            logger.warning(f"{self.sink.name}: abort after {error!r} failed: {e}")
+
+    def run(self) -> None:
+        try:
+            self._timed(self.sink.open)
+        except BaseException as e:
+            self._fail(e)
+        while (batch := self.queue.get()) is not _DONE:
+            if batch is _ABORT:
+                if self.error is None:
+                    self.sink.abort()
+                return
+            if self.error is None:
+                try:
+                    self._timed(self.sink.write, batch)
+                except BaseException as e:
+                    self._fail(e)
+        if self.error is None:
+            try:
+                self.path = self._timed(self.sink.close)
+            except BaseException as e:
+                self.error = e
+
+
+def fan_out(
+    records: Iterable[RecordLike],
+    sinks: list[ExportSink],
+    batch_size: int = EXPORT_BATCH_SIZE,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> list[Path]:
+    """Stream records to all sinks at once; returns the written paths in sink order."""
+    if not sinks:
+        return []
+    workers = [_SinkWorker(sink, queue_depth) for sink in sinks]
+    for worker in workers:
+        worker.start()
+
+    start = time.perf_counter()
+    convert = 0.0
+    count = 0
+    end = _ABORT
+    try:
+        for batch in batched(records, batch_size):
+            t = time.perf_counter()
+            objs = [record_to_obj(r) for r in batch]
+            convert += time.perf_counter() - t
+            count += len(objs)
+            for worker in workers:
+                worker.queue.put(objs)
+        end = _DONE
+    finally:
+        for worker in workers:
+            worker.queue.put(end)
+        for worker in workers:
+            worker.join()
+    elapsed = time.perf_counter() - start
+
+    per_sink = ", ".join(f"{w.sink.name} {w.busy:.2f}s" for w in workers)
+    logger.info(
+        f"Export fan-out: {count} records in {elapsed:.2f}s "
+        f"(record_to_obj {convert:.2f}s; {per_sink})"
+    )
+    for worker in workers:
+        if worker.error is not None:
+            logger.error(f"{worker.sink.name} export failed: {worker.error}")
+    for worker in workers:
+        if worker.error is not None:
+            raise worker.error
+    return [w.path for w in workers]
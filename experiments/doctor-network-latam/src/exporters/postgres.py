@@ -0,0 +1,363 @@
+"""
+Postgres bulk-load export: COPY-ready chunk files plus matching DDL.
+
+Per-row ORM inserts of ~900k doctors take hours; ``COPY`` loads them in
+minutes. `PostgresCopySink` writes a directory the platform ingests with
+plain ``psql``:
+
+    doctors_pg_<ts>/
+        schema.sql             CREATE TABLE doctors (...)  -- run first
+        doctors_00000.copy     COPY text format, CHUNK_ROWS rows each
+        doctors_00001.copy
+        ...
+        post_load.sql          indexes + ANALYZE            -- run last
+        load.sql               \\copy of every chunk, for a sequential load
+        schema.prisma          the matching Prisma model
+        manifest.json          columns, chunks, row counts, SHA-256s
+
+Chunks are independent, so they can be loaded in parallel sessions:
+
+    psql -f schema.sql
+    ls doctors_*.copy | xargs -P 4 -I{} psql -c "\\copy doctors FROM '{}'"
+    psql -f post_load.sql
+
+List fields are ``text[]`` columns and ``contact`` is ``jsonb``. Columns
+are snake_case; the Prisma model maps its camelCase fields onto them.
+
+`verify_copy_export()` parses the chunks back offline (checksums, row
+counts, escaping, array and JSON literals, unique ids) without a
+database.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from ..collectors.compact import RecordLike
+from ..utils.logger import get_logger
+from ..utils.serialize import record_to_obj
+from . import export as _export
+from .export import ExportSink, RecordObj, _timestamp, run_sink
+
+logger = get_logger("exporter.postgres")
+
+# Rows per chunk file; each chunk is one COPY
+CHUNK_ROWS = 100_000
+PG_TABLE = "doctors"
+
+# column → (Postgres type, Prisma field, Prisma type)
+PG_COLUMNS: dict[str, tuple[str, str, str]] = {
+    "id": ("uuid PRIMARY KEY", "id", 'String @id @db.Uuid'),
+    "source_country": ("text NOT NULL", "sourceCountry", "String"),
+    "source_registry": ("text NOT NULL", "sourceRegistry", "String"),
+    "license_number": ("text NOT NULL", "licenseNumber", "String"),
+    "full_name": ("text NOT NULL", "fullName", "String"),
+    "specialties": ("text[] NOT NULL DEFAULT '{}'", "specialties", "String[]"),
+    "specialty_codes": ("text[] NOT NULL DEFAULT '{}'", "specialtyCodes", "String[]"),
+    "status": ("text NOT NULL", "status", "String"),
+    "state_region": ("text", "stateRegion", "String?"),
+    "city": ("text", "city", "String?"),
+    "hospital_affiliations": ("text[] NOT NULL DEFAULT '{}'", "hospitalAffiliations", "String[]"),
+    "insurance_networks": ("text[] NOT NULL DEFAULT '{}'", "insuranceNetworks", "String[]"),
+    "education": ("text[] NOT NULL DEFAULT '{}'", "education", "String[]"),
+    "languages": ("text[] NOT NULL DEFAULT '{}'", "languages", "String[]"),
+    "contact": ("jsonb NOT NULL DEFAULT '{}'", "contact", "Json"),
+    "collected_at": ("timestamptz NOT NULL", "collectedAt", "DateTime @db.Timestamptz"),
+    "source_url": ("text", "sourceUrl", "String?"),
+}
+_ARRAY_COLUMNS = frozenset(c for c, (pg, _, _) in PG_COLUMNS.items() if pg.startswith("text[]"))
+
+# Built after the load: cheaper than maintaining them row by row
+PG_POST_LOAD = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {PG_TABLE}_license_key "
+    f"ON {PG_TABLE} (source_country, license_number);",
+    f"CREATE INDEX IF NOT EXISTS {PG_TABLE}_region_idx "
+    f"ON {PG_TABLE} (source_country, state_region);",
+    f"CREATE INDEX IF NOT EXISTS {PG_TABLE}_specialty_codes_idx "
+    f"ON {PG_TABLE} USING gin (specialty_codes);",
+    f"ANALYZE {PG_TABLE};",
+)
+
+NULL = "\\N"
+# COPY text format escapes (backslash first)
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_COPY_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def copy_escape(value: Optional[str]) -> str:
+    """One field in COPY text format (``\\N`` for NULL)."""
+    return NULL if value is None else value.translate(_COPY_ESCAPES)
+
+
+@lru_cache(maxsize=1 << 16)
+def array_literal(values: tuple[str, ...]) -> str:
+    """Postgres array literal with every element quoted: ``{"a","b \\"c\\""}``."""
+    if not values:
+        return "{}"
+    quoted = (v.replace("\\", "\\\\").replace('"', '\\"') for v in values)
+    return "{" + ",".join(f'"{v}"' for v in quoted) + "}"
+
+
+@lru_cache(maxsize=1 << 16)
+def _array_field(values: tuple[str, ...]) -> str:
+    return copy_escape(array_literal(values))
+
+
+def _contact_field(value) -> str:
+    return copy_escape(json.dumps(dict(value), ensure_ascii=False)) if value else "{}"
+
+
+# Per column, in table order: value → COPY field
+_FIELD_ENCODERS = tuple(
+    (column, (lambda v: _array_field(tuple(v))) if column in _ARRAY_COLUMNS
+     else _contact_field if column == "contact" else copy_escape)
+    for column in PG_COLUMNS
+)
+
+
+def copy_line(obj: RecordObj) -> str:
+    """One record as a COPY text line (without the newline)."""
+    return "\t".join([encode(obj[column]) for column, encode in _FIELD_ENCODERS])
+
+
+def schema_sql() -> str:
+    columns = ",\n".join(f"    {c} {pg}" for c, (pg, _, _) in PG_COLUMNS.items())
+    return f"CREATE TABLE IF NOT EXISTS {PG_TABLE} (\n{columns}\n);\n"
+
+
+def prisma_model() -> str:
+    width = max(len(field) for _, field, _ in PG_COLUMNS.values())
+    lines = []
+    for column, (_, field, prisma_type) in PG_COLUMNS.items():
+        mapped = f' @map("{column}")' if field != column else ""
+        lines.append(f"  {field.ljust(width)} {prisma_type}{mapped}")
+    lines += ["", "  @@unique([sourceCountry, licenseNumber])", f'  @@map("{PG_TABLE}")']
+    return "model Doctor {\n" + "\n".join(lines) + "\n}\n"
+
+
+class PostgresCopySink(ExportSink):
+    """Directory of COPY text chunks, DDL, Prisma model and manifest."""
+
+    name = "postgres"
+
+    def __init__(self, filepath: Path, chunk_rows: int = CHUNK_ROWS):
+        super().__init__(filepath)
+        self.chunk_rows = chunk_rows
+        self._file = None
+
+    def open(self) -> None:
+        self.filepath.mkdir(parents=True, exist_ok=True)
+        self._chunks: list[dict] = []
+        self._file = None
+
+    def _start_chunk(self) -> None:
+        name = f"{PG_TABLE}_{len(self._chunks):05d}.copy"
+        self._file = open(self.filepath / name, "wb")
+        self._digest = hashlib.sha256()
+        self._chunks.append({"file": name, "rows": 0})
+
+    def _end_chunk(self) -> None:
+        self._file.close()
+        self._file = None
+        self._chunks[-1]["sha256"] = self._digest.hexdigest()
+
+    def write(self, batch: list[RecordObj]) -> None:
+        start = 0
+        while start < len(batch):
+            if self._file is None:
+                self._start_chunk()
+            chunk = self._chunks[-1]
+            take = batch[start:start + self.chunk_rows - chunk["rows"]]
+            data = "".join([copy_line(obj) + "\n" for obj in take]).encode("utf-8")
+            self._file.write(data)
+            self._digest.update(data)
+            chunk["rows"] += len(take)
+            start += len(take)
+            if chunk["rows"] >= self.chunk_rows:
+                self._end_chunk()
+        self.count += len(batch)
+
+    def close(self) -> Path:
+        if self._file is not None:
+            self._end_chunk()
+        out = self.filepath
+        (out / "schema.sql").write_text(schema_sql(), encoding="utf-8")
+        (out / "post_load.sql").write_text("\n".join(PG_POST_LOAD) + "\n", encoding="utf-8")
+        (out / "load.sql").write_text(
+            "".join(f"\\copy {PG_TABLE} FROM '{c['file']}'\n" for c in self._chunks),
+            encoding="utf-8",
+        )
+        (out / "schema.prisma").write_text(prisma_model(), encoding="utf-8")
+        manifest = {
+            "table": PG_TABLE,
+            "format": "text",
+            "columns": list(PG_COLUMNS),
+            "rows": self.count,
+            "chunks": self._chunks,
+        }
+        (out / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        logger.info(
+            f"Exported {self.count} records for Postgres COPY: {out} ({len(self._chunks)} chunks)"
+        )
+        return out
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def export_postgres(
+    records: Iterable[RecordLike],
+    dirname: Optional[str] = None,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Path:
+    """Export COPY-ready chunks plus DDL for a bulk load into Postgres."""
+    dirname = dirname or f"doctors_pg_{_timestamp()}"
+    return run_sink(PostgresCopySink(_export.EXPORTS_DIR / dirname, chunk_rows), records)
+
+
+# ---------------------------------------------------------------------------
+# Offline verification
+# ---------------------------------------------------------------------------
+
+def copy_unescape(field: str) -> Optional[str]:
+    """Inverse of `copy_escape()`."""
+    if field == NULL:
+        return None
+    if "\\" not in field:
+        return field
+    out = []
+    i = 0
+    while i < len(field):
+        c = field[i]
+        if c == "\\":
+            nxt = field[i + 1:i + 2]
+            if nxt not in _COPY_UNESCAPES:
+                raise ValueError(f"Invalid COPY escape: \\{nxt}")
+            out.append(_COPY_UNESCAPES[nxt])
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+def parse_array_literal(text: str) -> list[str]:
+    """Inverse of `array_literal()` (one-dimensional, all elements quoted)."""
+    if not (text.startswith("{") and text.endswith("}")):
+        raise ValueError(f"Not an array literal: {text[:40]!r}")
+    values: list[str] = []
+    i, end = 1, len(text) - 1
+    try:
+        while i < end:
+            if text[i] != '"':
+                raise ValueError(f"Unquoted array element at {i}: {text[:40]!r}")
+            i += 1
+            buf = []
+            while text[i] != '"':
+                if text[i] == "\\":
+                    i += 1
+                buf.append(text[i])
+                i += 1
+            values.append("".join(buf))
+            i += 1
+            if i < end:
+                if text[i] != ",":
+                    raise ValueError(f"Expected ',' at {i}: {text[:40]!r}")
+                i += 1
+    except IndexError:
+        raise ValueError(f"Unterminated array literal: {text[:40]!r}") from None
+    if i > end:
+        raise ValueError(f"Unterminated array literal: {text[:40]!r}")
+    return values
+
+
+def read_copy_chunk(path: Path) -> Iterator[dict]:
+    """Rows of a chunk file, parsed back into Python values."""
+    columns = list(PG_COLUMNS)
+    with open(path, "r", encoding="utf-8", newline="\n") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.endswith("\n"):
+                raise ValueError(f"{path.name}:{line_no}: truncated line")
+            fields = line[:-1].split("\t")
+            if len(fields) != len(columns):
+                raise ValueError(
+                    f"{path.name}:{line_no}: {len(fields)} fields, expected {len(columns)}"
+                )
+            row = {}
+            for column, field in zip(columns, fields):
+                value = copy_unescape(field)
+                if column in _ARRAY_COLUMNS:
+                    value = parse_array_literal(value)
+                elif column == "contact":
+                    value = json.loads(value)
+                row[column] = value
+            yield row
+
+
+def verify_copy_export(directory: Path, records: Optional[Iterable[RecordLike]] = None) -> int:
+    """
+    Parse a `PostgresCopySink` directory back and check it; returns the row
+    count or raises ValueError.
+
+    Checks chunk checksums and row counts against the manifest, field
+    counts, escapes, array and JSON literals, ids (valid, unique) and
+    NOT NULL columns. With ``records``, every row must also match the
+    record it came from.
+    """
+    manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    if manifest["columns"] != list(PG_COLUMNS):
+        raise ValueError(f"Column mismatch: {manifest['columns']}")
+    required = [c for c, (pg, _, _) in PG_COLUMNS.items() if "NOT NULL" in pg or "PRIMARY" in pg]
+    expected = None
+    if records is not None:
+        expected = {obj["id"]: obj for obj in map(record_to_obj, records)}
+
+    seen: set[str] = set()
+    for chunk in manifest["chunks"]:
+        path = directory / chunk["file"]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while block := f.read(1 << 20):
+                digest.update(block)
+        if digest.hexdigest() != chunk["sha256"]:
+            raise ValueError(f"{chunk['file']}: checksum mismatch")
+
+        rows = 0
+        for row in read_copy_chunk(path):
+            rows += 1
+            missing = [c for c in required if row[c] is None]
+            if missing:
+                raise ValueError(f"{chunk['file']}: NULL in {missing} for id {row['id']}")
+            uuid.UUID(row["id"])
+            if row["id"] in seen:
+                raise ValueError(f"{chunk['file']}: duplicate id {row['id']}")
+            seen.add(row["id"])
+            if expected is not None:
+                _check_row(row, expected.get(row["id"]), chunk["file"])
+        if rows != chunk["rows"]:
+            raise ValueError(f"{chunk['file']}: {rows} rows, manifest says {chunk['rows']}")
+
+    if len(seen) != manifest["rows"]:
+        raise ValueError(f"{len(seen)} rows, manifest says {manifest['rows']}")
+    if expected is not None and len(seen) != len(expected):
+        raise ValueError(f"{len(seen)} rows exported, {len(expected)} records given")
+    return len(seen)
+
+
+def _check_row(row: dict, obj: Optional[RecordObj], chunk: str) -> None:
+    if obj is None:
+        raise ValueError(f"{chunk}: unexpected id {row['id']}")
+    for column in PG_COLUMNS:
+        value = obj[column]
+        if column in _ARRAY_COLUMNS:
+            value = list(value)
+        elif column == "contact":
+            value = dict(value) if value else {}
+        if row[column] != value:
+            raise ValueError(f"{chunk}: {column} differs for id {row['id']}: {row[column]!r}")
@@ -0,0 +1,100 @@
+"""
+Lookups against a SQLite export (see `export_sqlite()`).
+
+These are the queries the platform makes against an export. Each one is
+served by an index:
+
+  - by license:              ``idx_license`` on ``doctors``
+  - by name prefix:          the FTS5 ``doctors_fts`` table (accent-folded)
+  - by specialty + region:   ``doctor_specialty_codes`` (or
+                             ``doctor_specialties``), indexed on
+                             (value, state_region)
+
+Results are `sqlite3.Row`s of the ``doctors`` table; JSON list columns are
+left encoded. Soft-deleted rows (``deleted_at`` set) are never returned.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union
+
+from .export import SQLITE_FTS_TABLE
+
+DEFAULT_LIMIT = 50
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def connect(path: Union[Path, str]) -> sqlite3.Connection:
+    """Read-only connection to an export, returning `sqlite3.Row`s."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def name_match_expression(text: str) -> Optional[str]:
+    """FTS5 query matching names with a word starting with each token of ``text``."""
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    # Quoting keeps FTS5 operators ("AND", "-", ...) in user input literal
+    return " ".join(f'"{t}"*' for t in tokens)
+
+
+def find_by_license(
+    conn: sqlite3.Connection, license_number: str, country: Optional[str] = None
+) -> list[sqlite3.Row]:
+    """Doctors with this (normalized) license number, optionally in one country."""
+    if country:
+        return conn.execute(
+            "SELECT * FROM doctors WHERE license_number = ? AND source_country = ? "
+            "AND deleted_at IS NULL",
+            (license_number, country),
+        ).fetchall()
+    return conn.execute(
+        "SELECT * FROM doctors WHERE license_number = ? AND deleted_at IS NULL",
+        (license_number,),
+    ).fetchall()
+
+
+def search_names(
+    conn: sqlite3.Connection, text: str, limit: int = DEFAULT_LIMIT
+) -> list[sqlite3.Row]:
+    """Doctors whose name has words starting with every token of ``text``."""
+    expression = name_match_expression(text)
+    if expression is None:
+        return []
+    return conn.execute(
+        f"""
+        SELECT d.* FROM {SQLITE_FTS_TABLE} f JOIN doctors d ON d.id = f.doctor_id
+        WHERE {SQLITE_FTS_TABLE} MATCH ? LIMIT ?
+        """,
+        (expression, limit),
+    ).fetchall()
+
+
+def find_by_specialty(
+    conn: sqlite3.Connection,
+    specialty: str,
+    state_region: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    by_code: bool = True,
+) -> list[sqlite3.Row]:
+    """
+    Doctors with a specialty, optionally in one state/region.
+
+    ``specialty`` is a taxonomy code (``CARDIOLOGY``) by default, or the
+    normalized specialty text with ``by_code=False``.
+    """
+    table, column = (
+        ("doctor_specialty_codes", "code") if by_code else ("doctor_specialties", "specialty")
+    )
+    query = f"SELECT d.* FROM {table} s JOIN doctors d ON d.id = s.doctor_id WHERE s.{column} = ?"
+    params: list = [specialty]
+    if state_region is not None:
+        query += " AND s.state_region = ?"
+        params.append(state_region)
+    return conn.execute(query + " LIMIT ?", (*params, limit)).fetchall()
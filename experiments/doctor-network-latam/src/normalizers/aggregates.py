@@ -0,0 +1,154 @@
+"""
+Aggregate cube: doctor counts by country × state × specialty × status.
+
+Dashboards ask the same rollups over and over ("cardiologists per UF",
+"active doctors in AR vs `estimated_doctors`"). `AggregateCube` keeps base
+counts per (country, state, status) and per (country, state, status,
+specialty code), updated record by record with `add()` / `remove()`, so it
+can be maintained alongside a stream instead of rescanning records:
+
+  - the change-feed stage (`diff.py`) updates a persisted cube from the
+    old/new record of each change, in O(changes);
+  - the ``cube`` export format fills one during the export fan-out.
+
+`cube()` materializes every rollup (any dimension may be ``ALL``) once,
+after which `count()` is a dict lookup. Doctors with several specialty
+codes count once per code, and once in the ``ALL`` specialty rollups;
+doctors without codes are counted under ``UNMAPPED``. ``version`` is
+saved with the counts, for callers to tie a persisted cube to the data
+it was counted from.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from itertools import product
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..collectors.compact import RecordLike
+from ..utils.logger import get_logger
+
+logger = get_logger("normalizer.aggregates")
+
+COUNTRIES_CONFIG = Path(__file__).resolve().parents[2] / "config" / "countries.json"
+
+ALL = "*"
+UNMAPPED = "UNMAPPED"
+DIMENSIONS = ("country", "state", "specialty", "status")
+
+CubeKey = tuple[str, str, str, str]  # (country, state, specialty, status)
+
+
+class AggregateCube:
+    """Incrementally maintained counts with all rollups on demand."""
+
+    def __init__(self):
+        self.doctors: Counter[tuple[str, str, str]] = Counter()
+        self.specialties: Counter[tuple[str, str, str, str]] = Counter()
+        self._cube: Optional[dict[CubeKey, int]] = None
+        self.version: Optional[str] = None
+
+    def add_values(
+        self, country: str, state: Optional[str], status: str, codes: Iterable[str], sign: int = 1
+    ) -> None:
+        base = (country, state or "", status)
+        self.doctors[base] += sign
+        codes = tuple(codes) or (UNMAPPED,)
+        for code in codes:
+            self.specialties[(*base, code)] += sign
+        self._cube = None
+
+    def add(self, record: RecordLike, sign: int = 1) -> None:
+        self.add_values(
+            record.source_country, record.state_region, record.status,
+            record.specialty_codes, sign,
+        )
+
+    def remove(self, record: RecordLike) -> None:
+        self.add(record, -1)
+
+    def update(self, records: Iterable[RecordLike]) -> "AggregateCube":
+        for record in records:
+            self.add(record)
+        return self
+
+    def cube(self) -> dict[CubeKey, int]:
+        """Every rollup: (country, state, specialty, status), each possibly ``ALL``."""
+        if self._cube is None:
+            cube: Counter[CubeKey] = Counter()
+            for (country, state, status), n in self.doctors.items():
+                if n:
+                    for c, s, t in product((country, ALL), (state, ALL), (status, ALL)):
+                        cube[(c, s, ALL, t)] += n
+            for (country, state, status, code), n in self.specialties.items():
+                if n:
+                    for c, s, t in product((country, ALL), (state, ALL), (status, ALL)):
+                        cube[(c, s, code, t)] += n
+            self._cube = dict(cube)
+        return self._cube
+
+    def count(
+        self,
+        country: str = ALL,
+        state: Optional[str] = ALL,
+        specialty: str = ALL,
+        status: str = ALL,
+    ) -> int:
+        """Doctors matching the given dimension values (``ALL`` = any)."""
+        return self.cube().get((country, state or "", specialty, status), 0)
+
+    def coverage(self, estimates: Optional[dict[str, int]] = None) -> list[dict]:
+        """Doctors collected per country vs the registry's ``estimated_doctors``."""
+        estimates = load_estimates() if estimates is None else estimates
+        countries = sorted({c for c, _, _ in self.doctors} | set(estimates))
+        rows = []
+        for country in countries:
+            collected = self.count(country)
+            estimated = estimates.get(country)
+            rows.append({
+                "country": country,
+                "collected": collected,
+                "active": self.count(country, status="ACTIVE"),
+                "estimated_doctors": estimated,
+                "coverage": round(collected / estimated, 4) if estimated else None,
+            })
+        return rows
+
+    # -- persistence ---------------------------------------------------------
+
+    def to_json_obj(self) -> dict:
+        """Base counts (to reload and keep updating) plus every rollup row."""
+        return {
+            "dimensions": list(DIMENSIONS),
+            "version": self.version,
+            "doctors": [[*k, n] for k, n in sorted(self.doctors.items()) if n],
+            "specialties": [[*k, n] for k, n in sorted(self.specialties.items()) if n],
+            "cube": [[*k, n] for k, n in sorted(self.cube().items())],
+        }
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_json_obj(), ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "AggregateCube":
+        """Reload saved base counts (an empty cube if ``path`` doesn't exist)."""
+        cube = cls()
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            cube.version = data.get("version")
+            cube.doctors.update({tuple(row[:3]): row[3] for row in data["doctors"]})
+            cube.specialties.update({tuple(row[:4]): row[4] for row in data["specialties"]})
+        return cube
+
+
+def load_estimates(path: Path = COUNTRIES_CONFIG) -> dict[str, int]:
+    """``estimated_doctors`` per country code from the countries config."""
+    with open(path, "r", encoding="utf-8") as f:
+        countries = json.load(f)["countries"]
+    return {
+        code: c["estimated_doctors"] for code, c in countries.items() if c.get("estimated_doctors")
+    }
@@ -0,0 +1,154 @@
+"""
+Column-wise batch normalization.
+
+Same results as `normalize_batch()` (record for record, including dedup
+order), but records are processed as column batches: each column is
+factorized (`pd.factorize`, hashing in C) and the normalization function runs
+once per *distinct* value instead of once per record, then the batch is
+rebuilt with the tuple constructor in one pass. Statuses and specialty lists
+repeat heavily, and common names repeat across a registry.
+
+Reusing the per-record functions on the distinct values (rather than
+re-implementing them with `Series.str` ops) keeps `.title()`, `.strip()` and
+`\\s` matching identical to the per-record path by construction — pandas'
+own string methods are no faster on object columns and Arrow-backed strings
+differ on Unicode edge cases.
+"""
+
+from __future__ import annotations
+
+import gc
+from contextlib import contextmanager
+from itertools import compress
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from ..collectors.base import stable_record_id
+from ..collectors.compact import FIELDS, CompactRecord, RecordBatch, RecordLike
+from ..utils.json_stream import batched
+from ..utils.logger import get_logger
+from .normalize import (
+    intern_value,
+    normalize_license,
+    normalize_name,
+    normalize_specialties,
+    normalize_status,
+)
+from .taxonomy import reconcile_specialty_codes
+
+logger = get_logger("normalizer.columnar")
+
+DEFAULT_COLUMNAR_BATCH_SIZE = 100_000
+
+_MISSING = object()
+
+
+
+def _object_array(values: list) -> np.ndarray:
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def _map_distinct(values: list, fn: Callable[[Any], Any]) -> list:
+    """
+    Apply ``fn`` once per distinct value of a column and broadcast back.
+
+    `pd.factorize` does the hashing/dedup in C; the transform itself is the
+    per-record function, so results are identical by construction. The
+    column must not contain None (factorize treats it as missing).
+    """
+    codes, uniques = pd.factorize(_object_array(values))
+    out = _object_array([fn(u) for u in uniques])
+    return out[codes].tolist()
+
+
+def _map_memo(keys: Iterable, fn: Callable[..., Any], star: bool = False) -> list:
+    """Dict-memoized map for low-cardinality (or nullable) columns."""
+    memo: dict = {}
+    out = []
+    append = out.append
+    for key in keys:
+        value = memo.get(key, _MISSING)
+        if value is _MISSING:
+            value = memo[key] = fn(*key) if star else fn(key)
+        append(value)
+    return out
+
+
+def _normalize_specialty_tuple(specialties: tuple) -> tuple:
+    return tuple(normalize_specialties(specialties))
+
+
+def _specialty_code_tuple(country: str, specialties: tuple) -> tuple:
+    return tuple(reconcile_specialty_codes(country, specialties))
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic GC while building a batch: we allocate hundreds of
+    thousands of acyclic tuples/strings, and the collections that triggers
+    rescan the whole live dataset for nothing.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def normalize_columns(batch: RecordBatch) -> RecordBatch:
+    """Normalize name, license, id, specialties (+ codes) and status column-wise."""
+    if not len(batch):
+        return batch
+    cols = dict(batch.columns)
+    countries = cols["source_country"]
+    cols["full_name"] = _map_distinct(cols["full_name"], normalize_name)
+    # Licenses are nearly all distinct, so memoizing them would only add cost
+    cols["license_number"] = list(map(normalize_license, countries, cols["license_number"]))
+    cols["id"] = list(
+        map(stable_record_id, countries, cols["source_registry"], cols["license_number"])
+    )
+    cols["status"] = _map_memo(zip(countries, cols["status"]), normalize_status, star=True)
+    cols["specialties"] = _map_distinct(cols["specialties"], _normalize_specialty_tuple)
+    cols["specialty_codes"] = _map_memo(
+        zip(countries, cols["specialties"]), _specialty_code_tuple, star=True
+    )
+    for name in ("source_registry", "state_region", "city"):
+        cols[name] = _map_memo(cols[name], intern_value)
+    return RecordBatch(cols)
+
+
+def normalize_batch_columnar(
+    records: Iterable[RecordLike], batch_size: int = DEFAULT_COLUMNAR_BATCH_SIZE
+) -> list[CompactRecord]:
+    """Drop-in, column-wise equivalent of `normalize_batch()`."""
+    total = 0
+    seen: dict[str, CompactRecord] = {}
+
+    for chunk in batched(records, batch_size):
+        total += len(chunk)
+        with _gc_paused():
+            cols = normalize_columns(RecordBatch.from_records(chunk)).columns
+
+            # Deduplicate by (country + license_number), first occurrence wins
+            keys = [f"{c}:{l}" for c, l in zip(cols["source_country"], cols["license_number"])]
+            fresh = ~pd.Series(keys).duplicated().to_numpy()
+            if seen:
+                fresh &= np.fromiter((k not in seen for k in keys), dtype=bool, count=len(keys))
+
+            make = CompactRecord.from_values
+            rows = compress(zip(*(cols[n] for n in FIELDS)), fresh.tolist())
+            seen.update(zip(compress(keys, fresh.tolist()), map(make, rows)))
+
+    deduped = list(seen.values())
+    logger.info(
+        f"Normalized {total} records → {len(deduped)} unique "
+        f"({total - len(deduped)} duplicates removed, columnar)"
+    )
+    return deduped
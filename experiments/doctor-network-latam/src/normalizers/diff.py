@@ -0,0 +1,221 @@
+"""
+Snapshot diff: a change feed between normalized runs.
+
+Downstream consumers (network matching, search indexing) shouldn't have to
+reload the whole normalized dataset after every run. This stage compares
+the current run with the previous one and writes only what changed, as
+NDJSON, one change per line:
+
+    {"op": "added",   "key": "BR:CRM-SP 1", "id": "...", "record": {...}}
+    {"op": "removed", "key": "BR:CRM-SP 2", "id": "..."}
+    {"op": "status_changed", "key": ..., "id": ..., "previous_status": "ACTIVE",
+     "changes": {"status": "SUSPENDED", ...}}
+    {"op": "updated", "key": ..., "id": ..., "changes": {"city": "Santos"}}
+
+``changes`` holds the new values of the fields that differ. ``collected_at``
+and ``raw_data`` change on every run and are not compared. Changes are
+ordered by dedup key.
+
+The previous run is kept as a baseline snapshot sorted by dedup key
+(``data/normalized/changes/baseline_<country>.json``). Diffing is a sorted
+merge join of that file, streamed, against the current records sorted by
+key, so it is linear and holds only the current run in memory. With no
+baseline yet, every record is ``added``. Applying a feed to the previous
+snapshot (`apply_change_feed()`) yields the current one.
+
+The aggregate cube next to the baseline (``cube_<country>.json``, see
+`aggregates.py`) is updated from the old and new record of each change, so
+it stays in step with the baseline without a rescan. It is saved with the
+version (size and mtime) of the baseline it matches; a run that stopped
+between swapping the baseline and saving the cube leaves a mismatch, and
+the next run counts the baseline again instead of building on a cube one
+run behind.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ..collectors.compact import (
+    FIELDS,
+    IGNORED_FIELDS,
+    CompactRecord,
+    RecordLike,
+    to_compact,
+)
+from ..utils.json_stream import iter_json_array
+from ..utils.logger import get_logger
+from ..utils.serialize import get_encoder, write_records
+from . import normalize as _normalize
+from .aggregates import AggregateCube
+
+logger = get_logger("normalizer.diff")
+
+CHANGE_OPS = ("added", "removed", "status_changed", "updated")
+_COMPARED = tuple((i, n) for i, n in enumerate(FIELDS) if n not in IGNORED_FIELDS)
+_STATUS = FIELDS.index("status")
+# Left out of added records and the baseline (kept in the raw store)
+_EXCLUDED = frozenset({"raw_data"})
+
+Change = dict[str, Any]
+# Called with (old, new) for every change; None on the missing side
+ChangeHook = Callable[[Optional[CompactRecord], Optional[CompactRecord]], None]
+
+
+def dedup_key(record: RecordLike) -> str:
+    return f"{record.source_country}:{record.license_number}"
+
+
+def sort_by_key(records: Iterable[RecordLike]) -> list[tuple[str, CompactRecord]]:
+    """(dedup key, record) pairs in key order; the first record of a key wins."""
+    keyed: dict[str, CompactRecord] = {}
+    for r in records:
+        keyed.setdefault(dedup_key(r), to_compact(r))
+    return sorted(keyed.items())
+
+
+def _changed_fields(old: CompactRecord, new: CompactRecord) -> dict[str, Any]:
+    return {name: new[i] for i, name in _COMPARED if old[i] != new[i]}
+
+
+def diff_sorted(
+    previous: Iterable[tuple[str, CompactRecord]],
+    current: Iterable[tuple[str, CompactRecord]],
+    on_change: Optional[ChangeHook] = None,
+) -> Iterator[Change]:
+    """Sorted merge join of two key-ordered (key, record) streams → changes."""
+    prev_it, cur_it = iter(previous), iter(current)
+    prev = next(prev_it, None)
+    cur = next(cur_it, None)
+    while prev is not None or cur is not None:
+        if cur is None or (prev is not None and prev[0] < cur[0]):
+            key, old = prev
+            if on_change:
+                on_change(old, None)
+            yield {"op": "removed", "key": key, "id": old.id}
+            prev = next(prev_it, None)
+        elif prev is None or cur[0] < prev[0]:
+            key, new = cur
+            if on_change:
+                on_change(None, new)
+            yield {"op": "added", "key": key, "id": new.id, "record": new.as_json_obj(_EXCLUDED)}
+            cur = next(cur_it, None)
+        else:
+            key, old = prev
+            new = cur[1]
+            changes = _changed_fields(old, new)
+            if changes:
+                if on_change:
+                    on_change(old, new)
+                if old[_STATUS] != new[_STATUS]:
+                    yield {"op": "status_changed", "key": key, "id": new.id,
+                           "previous_status": old.status, "changes": changes}
+                else:
+                    yield {"op": "updated", "key": key, "id": new.id, "changes": changes}
+            prev = next(prev_it, None)
+            cur = next(cur_it, None)
+
+
+def iter_baseline(path: Path) -> Iterator[tuple[str, CompactRecord]]:
+    """Stream a key-sorted baseline snapshot (empty if there is none yet)."""
+    if not path.exists():
+        return
+    for obj in iter_json_array(path):
+        record = CompactRecord.from_dict(obj)
+        yield dedup_key(record), record
+
+
+def write_change_feed(changes: Iterable[Change], target: Path) -> dict[str, int]:
+    """Write changes as NDJSON; returns the count per op."""
+    encode = get_encoder()
+    counts = dict.fromkeys(CHANGE_OPS, 0)
+    with open(target, "wb") as f:
+        for change in changes:
+            counts[change["op"]] += 1
+            f.write(encode(change, False) + b"\n")
+    return counts
+
+
+def apply_change_feed(
+    snapshot: dict[str, CompactRecord], changes: Iterable[Change]
+) -> dict[str, CompactRecord]:
+    """Apply changes to a key → record snapshot in place (what a consumer does)."""
+    for change in changes:
+        op, key = change["op"], change["key"]
+        if op == "added":
+            snapshot[key] = CompactRecord.from_dict(change["record"])
+        elif op == "removed":
+            del snapshot[key]
+        else:
+            snapshot[key] = snapshot[key].replace(**change["changes"])
+    return snapshot
+
+
+def _cube_updater(cube: AggregateCube) -> ChangeHook:
+    def update(old: Optional[CompactRecord], new: Optional[CompactRecord]) -> None:
+        if old is not None:
+            cube.remove(old)
+        if new is not None:
+            cube.add(new)
+    return update
+
+
+def baseline_version(path: Path) -> Optional[str]:
+    """Size and mtime of a baseline snapshot (None if there is none yet)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def snapshot_diff(
+    records: Iterable[RecordLike],
+    baseline: Path,
+    feed: Path,
+    cube: Optional[AggregateCube] = None,
+) -> dict[str, int]:
+    """
+    Diff ``records`` against ``baseline``, write ``feed``, then replace the
+    baseline. ``cube``, if given, must match the baseline; it is updated
+    to match ``records``.
+    """
+    current = sort_by_key(records)
+    on_change = _cube_updater(cube) if cube is not None else None
+    counts = write_change_feed(diff_sorted(iter_baseline(baseline), current, on_change), feed)
+
+    # The next run diffs against this one; swap the baseline in atomically
+    tmp = baseline.with_name(baseline.name + ".tmp")
+    write_records((r for _, r in current), tmp, exclude=_EXCLUDED)
+    os.replace(tmp, baseline)
+    return counts
+
+
+def run_snapshot_diff(
+    records: Iterable[RecordLike], country: Optional[str] = None
+) -> Path:
+    """Write the change feed since the previous run next to the normalized output."""
+    out_dir = _normalize.DATA_DIR / "normalized" / "changes"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    suffix = country or "all"
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    feed = out_dir / f"changes_{suffix}_{stamp}.ndjson"
+    baseline = out_dir / f"baseline_{suffix}.json"
+    cube_path = out_dir / f"cube_{suffix}.json"
+    cube = AggregateCube.load(cube_path)
+    if cube.version != baseline_version(baseline):
+        # Not saved for this baseline (none yet, or the last run stopped
+        # before saving it): count the baseline once
+        logger.info(f"Aggregate cube does not match {baseline.name}; recounting it")
+        cube = AggregateCube().update(r for _, r in iter_baseline(baseline))
+    counts = snapshot_diff(records, baseline, feed, cube)
+    cube.version = baseline_version(baseline)
+    cube.save(cube_path)
+    logger.info(
+        f"Change feed: {sum(counts.values())} changes → {feed} ("
+        + ", ".join(f"{n} {op}" for op, n in counts.items()) + ")"
+    )
+    return feed
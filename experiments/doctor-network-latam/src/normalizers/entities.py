@@ -0,0 +1,260 @@
+"""
+Cross-registry entity resolution with blocking.
+
+Exact dedup only merges records sharing ``country:license``. A physician
+licensed in Brazil and Argentina (CFM + REFEPS) is two records with
+different licenses; this stage links them.
+
+Comparing every pair is quadratic, so candidates are generated by blocking:
+each record gets a few blocking keys and only records sharing a key (and
+coming from different registries) are scored. Keys are built from
+`create_search_key()` tokens:
+
+  - ``n:<first name>:<surname>``  phonetic codes, one key per surname token
+    (so "Silva Santos" and "Santos Silva" still meet)
+  - ``s:<surname>:<specialty>``   last surname + each accent-folded specialty
+
+Blocks larger than ``max_block_size`` (very common names) are skipped and
+counted rather than compared. Candidate pairs are scored on name tokens and
+specialties, and pairs at or above the threshold are merged with
+union-find into clusters. Work is linear in the number of records times
+the (bounded) block size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from pydantic import BaseModel
+
+from ..collectors.compact import RecordLike
+from ..utils.logger import get_logger
+from ..utils.serialize import write_records
+from . import normalize as _normalize
+from .normalize import NAME_CACHE_SIZE, VALUE_CACHE_SIZE, create_search_key
+
+logger = get_logger("normalizer.entities")
+
+MATCH_THRESHOLD = 0.9
+DEFAULT_MAX_BLOCK_SIZE = 200
+NAME_WEIGHT = 0.8
+
+# Spanish/Portuguese spelling variants that sound alike, applied in order to
+# accent-folded lowercase tokens
+_PHONETIC_RULES = [
+    (re.compile(p), r) for p, r in [
+        (r"ph", "f"),
+        (r"lh", "l"),
+        (r"nh", "n"),
+        (r"[cs]h", "x"),
+        (r"qu", "k"),
+        (r"gu(?=[ei])", "g"),
+        (r"c(?=[ei])", "s"),
+        (r"[cq]", "k"),
+        (r"z", "s"),
+        (r"[vw]", "b"),
+        (r"y", "i"),
+        (r"h", ""),
+        (r"(.)\1+", r"\1"),
+    ]
+]
+_INNER_VOWELS_RE = re.compile(r"(?<!^)[aeiou]")
+PHONETIC_CODE_LENGTH = 6
+
+
+class EntityCluster(BaseModel):
+    """Records believed to be the same physician."""
+
+    cluster_id: str
+    record_ids: list[str]
+    dedup_keys: list[str]  # country:license of each member, same order
+    score: float  # weakest match score that joined the cluster
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def phonetic_code(token: str) -> str:
+    """Short sound-alike code for one accent-folded name token."""
+    code = token
+    for pattern, replacement in _PHONETIC_RULES:
+        code = pattern.sub(replacement, code)
+    return _INNER_VOWELS_RE.sub("", code)[:PHONETIC_CODE_LENGTH]
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def name_tokens(full_name: str) -> tuple[str, ...]:
+    return tuple(create_search_key(full_name).split())
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def _specialty_key(specialty: str) -> str:
+    return create_search_key(specialty)
+
+
+def blocking_keys(record: RecordLike) -> set[str]:
+    """Blocking keys for one record (empty if the name has no usable tokens)."""
+    tokens = name_tokens(record.full_name)
+    if len(tokens) < 2:
+        return set()
+    first = phonetic_code(tokens[0])
+    surnames = [phonetic_code(t) for t in tokens[1:]]
+    keys = {f"n:{first}:{s}" for s in surnames}
+    keys.update(f"s:{surnames[-1]}:{_specialty_key(sp)}" for sp in record.specialties)
+    return keys
+
+
+def _profile(record: RecordLike) -> tuple[frozenset, str, frozenset]:
+    """(name token set, sorted token string, specialty key set) for scoring."""
+    tokens = name_tokens(record.full_name)
+    specialties = frozenset(_specialty_key(s) for s in record.specialties)
+    return frozenset(tokens), " ".join(sorted(tokens)), specialties
+
+
+def _score(a: tuple, b: tuple, threshold: float = 0.0) -> float:
+    """
+    Score two profiles. Below ``threshold`` the result is only a lower
+    bound: the expensive string ratio is skipped once it can't matter.
+    """
+    tokens_a, sorted_a, spec_a = a
+    tokens_b, sorted_b, spec_b = b
+    name = len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+    if spec_a and spec_b:
+        specialty = len(spec_a & spec_b) / len(spec_a | spec_b)
+        weight = NAME_WEIGHT
+    else:
+        specialty, weight = 0.0, 1.0
+
+    needed = (threshold - (1 - weight) * specialty) / weight
+    if name < needed:
+        # Upper bound of the ratio from the lengths alone (= real_quick_ratio)
+        la, lb = len(sorted_a), len(sorted_b)
+        if 2 * min(la, lb) / (la + lb or 1) >= needed:
+            matcher = SequenceMatcher(None, sorted_a, sorted_b, autojunk=False)
+            if matcher.quick_ratio() >= needed:
+                name = max(name, matcher.ratio())
+    return weight * name + (1 - weight) * specialty
+
+
+def match_score(a: RecordLike, b: RecordLike) -> float:
+    """Similarity in [0, 1] from name tokens and (when both have any) specialties."""
+    return _score(_profile(a), _profile(b))
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent: dict[int, int] = {}
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:  # path compression
+            parent[x], x = root, parent.get(x, x)
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def _cluster_id(dedup_keys: list[str]) -> str:
+    """Stable id: hash of the smallest member key."""
+    return "ent_" + hashlib.sha1(min(dedup_keys).encode("utf-8")).hexdigest()[:16]
+
+
+def resolve_entities(
+    records: Iterable[RecordLike],
+    threshold: float = MATCH_THRESHOLD,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+) -> list[EntityCluster]:
+    """Cluster records across registries; returns clusters of two or more."""
+    records = list(records)
+    keys_of = [blocking_keys(r) for r in records]
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for i, keys in enumerate(keys_of):
+        for key in keys:
+            blocks[key].append(i)
+
+    profiles = [_profile(r) for r in records]
+    registry_of = [(r.source_country, r.source_registry) for r in records]
+    uf = _UnionFind()
+    link_score: dict[int, float] = {}
+    compared = 0
+    oversized = {key for key, members in blocks.items() if len(members) > max_block_size}
+
+    for block_key, members in blocks.items():
+        if len(members) < 2 or block_key in oversized:
+            continue
+        # Licenses are unique within a registry: only pair across registries
+        by_registry: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for i in members:
+            by_registry[registry_of[i]].append(i)
+        if len(by_registry) < 2:
+            continue
+        groups = list(by_registry.values())
+        for g, group in enumerate(groups):
+            for other in groups[g + 1:]:
+                for i in group:
+                    for j in other:
+                        # Pair is scored in the first block it shares that isn't skipped
+                        shared = keys_of[i] & keys_of[j]
+                        if min(k for k in shared if k not in oversized) != block_key:
+                            continue
+                        compared += 1
+                        # difflib's ratio isn't symmetric; fix the argument order
+                        lo, hi = (i, j) if i < j else (j, i)
+                        score = _score(profiles[lo], profiles[hi], threshold)
+                        if score >= threshold:
+                            uf.union(i, j)
+                            for k in (i, j):
+                                link_score[k] = min(link_score.get(k, 1.0), score)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i in link_score:
+        groups[uf.find(i)].append(i)
+
+    clusters = []
+    for members in groups.values():
+        members.sort()
+        keys = [f"{records[i].source_country}:{records[i].license_number}" for i in members]
+        clusters.append(EntityCluster(
+            cluster_id=_cluster_id(keys),
+            record_ids=[records[i].id for i in members],
+            dedup_keys=keys,
+            score=round(min(link_score[i] for i in members), 4),
+        ))
+    clusters.sort(key=lambda c: c.dedup_keys[0])
+
+    logger.info(
+        f"Entity resolution: {len(records)} records, {len(blocks)} blocks "
+        f"({len(oversized)} oversized skipped), {compared} pairs compared → "
+        f"{len(clusters)} clusters covering {len(link_score)} records"
+    )
+    return clusters
+
+
+def cluster_assignments(clusters: Iterable[EntityCluster]) -> dict[str, tuple[str, float]]:
+    """dedup key → (cluster id, score) for every clustered record."""
+    return {
+        key: (c.cluster_id, c.score) for c in clusters for key in c.dedup_keys
+    }
+
+
+def run_entity_resolution(
+    records: Iterable[RecordLike], country: Optional[str] = None
+) -> list[EntityCluster]:
+    """Resolve entities and save the clusters next to the normalized output."""
+    clusters = resolve_entities(records)
+    out_dir = _normalize.DATA_DIR / "normalized"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_file = out_dir / f"entities_{country or 'all'}.json"
+    write_records(clusters, out_file)
+    logger.info(f"Saved {len(clusters)} entity clusters to {out_file}")
+    return clusters
@@ -0,0 +1,353 @@
+"""
+Incremental normalization into a persistent, keyed store.
+
+`run_normalization()` re-reads every raw file on every call. This module
+keeps a SQLite store next to the normalized output instead:
+
+    data/normalized/store.db
+      raw_files   manifest of folded raw files (path, size, mtime, sha256)
+      records     one normalized record per dedup key (country:license),
+                  with the raw file its stored version came from
+      meta        store version, bumped by every folded file
+      snapshots   store version each ``doctors_<suffix>.json`` was written at
+
+Each run only reads raw files whose content hash has not been folded in
+yet (unchanged size + mtime skips even the hashing), normalizes their
+records and upserts them. Conflicts on a dedup key resolve
+last-writer-wins on ``collected_at``; on a tie the file folded later wins.
+That differs on purpose from `normalize_batch()`, which keeps the first
+record it sees in a single pass.
+
+Each file is merged in its own transaction together with its manifest
+row, so an interrupted run never half-applies a file.
+
+A raw file rewritten in place replaces what it contributed: keys whose
+stored version came from its previous content and that are missing from
+the new one are dropped. A copy of such a key that an older version had
+beaten in another raw file is not brought back, and a raw file that is
+deleted outright leaves its keys in place; delete ``store.db`` to rebuild
+from the raw files as they are.
+
+The manifest is shared by every country, but snapshots are per suffix: a
+``--country BR`` run can fold files that ``doctors_all.json`` doesn't have
+yet. A snapshot is rewritten whenever the store version (or the file)
+changed since it was written, not only when the current run folded files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from ..collectors.compact import CompactRecord, RecordLike, to_compact
+from ..utils.logger import get_logger
+from ..utils.serialize import get_encoder, record_to_obj, write_encoded
+from . import normalize as _normalize
+from .normalize import iter_file_records, normalize_record
+
+logger = get_logger("normalizer.incremental")
+
+HASH_CHUNK_SIZE = 1 << 20
+
+try:  # decode with the fast parser when the fast encoder is around
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dedup_key(record: RecordLike) -> str:
+    return f"{record.source_country}:{record.license_number}"
+
+
+def _latest_by_key(records: Iterable[RecordLike]) -> dict[str, CompactRecord]:
+    """Normalize records, keeping the latest ``collected_at`` per dedup key."""
+    latest: dict[str, CompactRecord] = {}
+    for record in records:
+        r = to_compact(normalize_record(record))
+        key = dedup_key(r)
+        current = latest.get(key)
+        if current is None or r.collected_at >= current.collected_at:
+            latest[key] = r
+    return latest
+
+
+class NormalizedStore:
+    """SQLite-backed normalized records plus the manifest of folded raw files."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self._create_schema()
+
+    @classmethod
+    def default(cls) -> "NormalizedStore":
+        return cls(_normalize.DATA_DIR / "normalized" / "store.db")
+
+    def _create_schema(self) -> None:
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS raw_files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    records INTEGER NOT NULL,
+                    folded_at TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS records (
+                    dedup_key TEXT PRIMARY KEY,
+                    source_country TEXT NOT NULL,
+                    collected_at TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    source_file TEXT
+                )
+            """)
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(records)")}
+            if "source_file" not in columns:  # store created before it was tracked
+                self.conn.execute("ALTER TABLE records ADD COLUMN source_file TEXT")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_records_country ON records(source_country)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    suffix TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL
+                )
+            """)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "NormalizedStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- manifest -----------------------------------------------------------
+
+    def pending_files(self, files: Iterable[Path]) -> list[tuple[Path, str]]:
+        """(file, sha256) for raw files whose content has not been folded in."""
+        known = {
+            row[0]: row[1:]
+            for row in self.conn.execute("SELECT path, size, mtime_ns, sha256 FROM raw_files")
+        }
+        folded_hashes = {entry[2] for entry in known.values()}
+        pending = []
+        for f in files:
+            name = _manifest_name(f)
+            stat = f.stat()
+            entry = known.get(name)
+            if entry and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+                continue
+            digest = file_digest(f)
+            if digest in folded_hashes:
+                # Touched or copied, but nothing new to fold in
+                self._touch_file(name, stat, digest)
+                continue
+            pending.append((f, digest))
+        return pending
+
+    def _touch_file(self, name: str, stat, digest: str) -> None:
+        """Record a file whose content is already folded in (keeps its count)."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO raw_files (path, size, mtime_ns, sha256, records, folded_at)
+                VALUES (?, ?, ?, ?, 0, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    size = excluded.size, mtime_ns = excluded.mtime_ns,
+                    sha256 = excluded.sha256, folded_at = excluded.folded_at
+                """,
+                (name, stat.st_size, stat.st_mtime_ns, digest, _now()),
+            )
+
+    # -- records ------------------------------------------------------------
+
+    def fold_file(self, path: Path, digest: str, records: Iterable[RecordLike]) -> int:
+        """
+        Upsert one raw file's normalized records and record it as folded.
+
+        Returns the number of keys stored or updated, i.e. not counting
+        records an already stored, later ``collected_at`` won over.
+        """
+        encode = get_encoder()
+        name = _manifest_name(path)
+        latest = _latest_by_key(records)
+        rows = [
+            (key, r.source_country, r.collected_at, encode(record_to_obj(r), False), name)
+            for key, r in latest.items()
+        ]
+        with self.conn:
+            # Keys the previous content of this file stored but the new one lacks
+            stale = [
+                (key,)
+                for (key,) in self.conn.execute(
+                    "SELECT dedup_key FROM records WHERE source_file = ?", (name,)
+                )
+                if key not in latest
+            ]
+            self.conn.executemany("DELETE FROM records WHERE dedup_key = ?", stale)
+            if stale:
+                logger.info(f"Dropped {len(stale)} keys no longer in {name}")
+            changes = self.conn.total_changes
+            self.conn.executemany(
+                """
+                INSERT INTO records (dedup_key, source_country, collected_at, data, source_file)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(dedup_key) DO UPDATE SET
+                    collected_at = excluded.collected_at, data = excluded.data,
+                    source_file = excluded.source_file
+                WHERE excluded.collected_at >= records.collected_at
+                """,
+                rows,
+            )
+            stored = self.conn.total_changes - changes
+            stat = path.stat()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO raw_files VALUES (?, ?, ?, ?, ?, ?)",
+                (name, stat.st_size, stat.st_mtime_ns, digest, len(rows), _now()),
+            )
+            self.conn.execute(
+                """
+                INSERT INTO meta (key, value) VALUES ('version', 1)
+                ON CONFLICT(key) DO UPDATE SET value = value + 1
+                """
+            )
+        return stored
+
+    @property
+    def version(self) -> int:
+        """Number of files folded into the store so far."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else 0
+
+    # -- snapshots ----------------------------------------------------------
+
+    def snapshot_current(self, target: Path, suffix: str) -> bool:
+        """Whether ``target`` was written by this store at its current version."""
+        row = self.conn.execute(
+            "SELECT version, mtime_ns FROM snapshots WHERE suffix = ?", (suffix,)
+        ).fetchone()
+        try:
+            mtime_ns = target.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        return row is not None and row == (self.version, mtime_ns)
+
+    def save_snapshot(self, target: Path, suffix: str, country: Optional[str] = None) -> int:
+        """`write_snapshot()` and record the store version it was written at."""
+        written = self.write_snapshot(target, country)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                (suffix, self.version, target.stat().st_mtime_ns),
+            )
+        return written
+
+    def _select(self, country: Optional[str]) -> Iterator[bytes]:
+        # rowid order = order in which each dedup key was first stored
+        if country:
+            cursor = self.conn.execute(
+                "SELECT data FROM records WHERE source_country = ? ORDER BY rowid", (country,)
+            )
+        else:
+            cursor = self.conn.execute("SELECT data FROM records ORDER BY rowid")
+        for (data,) in cursor:
+            yield data
+
+    def iter_records(self, country: Optional[str] = None) -> Iterator[CompactRecord]:
+        for data in self._select(country):
+            yield CompactRecord.from_dict(_loads(data))
+
+    def write_snapshot(self, target: Path, country: Optional[str] = None) -> int:
+        """Write the stored records as a JSON array without re-encoding them."""
+        return write_encoded(self._select(country), target)
+
+    def count(self, country: Optional[str] = None) -> int:
+        if country:
+            query = ("SELECT COUNT(*) FROM records WHERE source_country = ?", (country,))
+        else:
+            query = ("SELECT COUNT(*) FROM records", ())
+        return self.conn.execute(*query).fetchone()[0]
+
+
+def _manifest_name(path: Path) -> str:
+    """Raw file name relative to data/raw/ (e.g. "BR/BR_sample_2026.json")."""
+    return f"{path.parent.name}/{path.name}"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def run_incremental_normalization(
+    country: Optional[str] = None,
+    trusted: bool = False,
+    store: Optional[NormalizedStore] = None,
+) -> list[CompactRecord]:
+    """
+    Incremental pipeline: fold new raw files into the store → save snapshot.
+
+    Only raw files not folded in before are read and normalized. Returns
+    every stored record for ``country`` (or all countries), like
+    `run_normalization()`.
+    """
+    owns_store = store is None
+    store = store or NormalizedStore.default()
+    try:
+        pending = store.pending_files(_normalize._raw_files(country))
+        folded = 0
+        for f, digest in pending:
+            try:
+                records = list(iter_file_records(f, trusted=trusted, compact=True))
+            except Exception as e:
+                # Not recorded in the manifest, so the next run retries it
+                logger.warning(f"Failed to load {f}: {e}")
+                continue
+            stored = store.fold_file(f, digest, records)
+            folded += len(records)
+            logger.info(f"Folded {f.name}: {len(records)} records → {stored} keys stored")
+
+        total = store.count(country)
+        logger.info(
+            f"Incremental normalization: {len(pending)} new raw files, "
+            f"{folded} records normalized, {total} records in store"
+        )
+        if not total:
+            logger.warning("No raw records found to normalize")
+            return []
+
+        out_dir = _normalize.DATA_DIR / "normalized"
+        suffix = country or "all"
+        out_file = out_dir / f"doctors_{suffix}.json"
+        if not store.snapshot_current(out_file, suffix):
+            store.save_snapshot(out_file, suffix, country)
+            logger.info(f"Saved {total} normalized records to {out_file}")
+
+        return list(store.iter_records(country))
+    finally:
+        if owns_store:
+            store.close()
@@ -0,0 +1,257 @@
+"""
+Trigram index for fuzzy doctor-name search.
+
+Registries spell the same name differently: accents, initials, particles
+and word order all vary ("Maria Jose da Silva" vs "Silva, María José" vs
+"M. José Silva"), so exact ``full_name`` matches miss them. Names are
+reduced to `create_search_key()` (accent-folded, lowercase, letters only,
+titles like "Dr." dropped) and broken into trigrams the way ``pg_trgm``
+does: each word padded as ``"  word "``, so word order doesn't matter and
+word starts weigh a little more. Similarity is the Jaccard index of two
+trigram sets.
+
+The index is inverted: trigram → ascending positions of the names that
+contain it (``array('I')``), plus the trigram count ``n`` of every name.
+A query with ``q`` trigrams reads only its own posting lists and counts
+how many trigrams ``c`` each name in them shares with it: with
+``np.unique`` over the concatenated lists or, when they are dense enough
+that an array up to their highest position is at most
+``DENSE_COUNT_RATIO`` times their length, with the faster ``np.bincount``.
+Either way the count costs time in the postings read, not in the size of
+the index, and it is enough to score the name exactly
+(``c / (q + n - c)``). Names sharing none are never touched, and since
+``n >= c`` a name can only reach ``threshold`` with ``c >= threshold · q``,
+so only those are scored and ranked. No query scans the names or compares
+strings.
+
+`build_name_index()` builds from records (or `from_store()` from the
+incremental `NormalizedStore`); `save()` / `load()` persist it as SQLite
+(``data/normalized/names_<country>.db``): one row per name and one per
+trigram with its posting list as a blob.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from array import array
+from functools import lru_cache
+from itertools import chain
+from math import ceil
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+
+from ..collectors.compact import RecordLike
+from ..utils.logger import get_logger
+from . import normalize as _normalize
+from .incremental import NormalizedStore
+from .normalize import NAME_CACHE_SIZE, VALUE_CACHE_SIZE, create_search_key
+
+logger = get_logger("normalizer.name_index")
+
+DEFAULT_THRESHOLD = 0.3  # pg_trgm's default similarity threshold
+DEFAULT_LIMIT = 10
+# Count shared trigrams with a dense array when it is at most this many
+# times the postings read (np.bincount beats np.unique's sort from ~1:10)
+DENSE_COUNT_RATIO = 8
+# Honorifics some registries prefix to names
+TITLES = frozenset({"dr", "dra", "doctor", "doctora", "doutor", "doutora", "prof"})
+
+_POSTING_TYPE = "I"  # unsigned 32-bit name positions
+_EMPTY = array(_POSTING_TYPE)
+
+
+class NameMatch(NamedTuple):
+    record_id: str
+    search_key: str
+    score: float
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def search_key(full_name: str) -> str:
+    """`create_search_key()` without titles: "Dra. María José" → "maria jose"."""
+    return " ".join(w for w in create_search_key(full_name).split() if w not in TITLES)
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def _word_trigrams(word: str) -> tuple[str, ...]:
+    padded = f"  {word} "
+    return tuple(sys.intern(padded[i:i + 3]) for i in range(len(padded) - 2))
+
+
+def trigrams(key: str) -> set[str]:
+    """pg_trgm-style trigrams of a search key."""
+    return set(chain.from_iterable(_word_trigrams(w) for w in key.split()))
+
+
+def similarity(a: str, b: str) -> float:
+    """Trigram similarity of two search keys, in [0, 1]."""
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb) if ta or tb else 0.0
+
+
+class NameTrigramIndex:
+    """Inverted trigram index over the search keys of record names."""
+
+    def __init__(self):
+        self.record_ids: list[str] = []
+        self.keys: list[str] = []
+        self.sizes = array("H")  # trigram count per name
+        self.postings: dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.record_ids)
+
+    def add(self, record_id: str, full_name: str) -> None:
+        key = search_key(full_name)
+        grams = trigrams(key)
+        position = len(self.record_ids)
+        self.record_ids.append(record_id)
+        self.keys.append(key)
+        self.sizes.append(len(grams))
+        postings = self.postings
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array(_POSTING_TYPE)
+            posting.append(position)
+
+    def update(self, records: Iterable[RecordLike]) -> "NameTrigramIndex":
+        for record in records:
+            self.add(record.id, record.full_name)
+        return self
+
+    @classmethod
+    def from_store(
+        cls, store: Optional[NormalizedStore] = None, country: Optional[str] = None
+    ) -> "NameTrigramIndex":
+        """Index the records of the incremental normalized store."""
+        owns_store = store is None
+        store = store or NormalizedStore.default()
+        try:
+            return cls().update(store.iter_records(country))
+        finally:
+            if owns_store:
+                store.close()
+
+    # -- search --------------------------------------------------------------
+
+    def search(
+        self,
+        name: str,
+        limit: int = DEFAULT_LIMIT,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> list[NameMatch]:
+        """Names at least ``threshold`` similar to ``name``, best first."""
+        query = trigrams(search_key(name))
+        lists = [self.postings[g] for g in query if g in self.postings]
+        if not lists:
+            return []
+        q = len(query)
+        threshold = max(threshold, 1e-6)
+        # Shared trigrams per name in the query's posting lists, in time
+        # proportional to the postings (lists are ascending: p[-1] is the top)
+        postings = np.concatenate([np.frombuffer(p, dtype=np.uint32) for p in lists])
+        # score = c / (q + n - c) with n >= c, so a match shares c >= threshold · q
+        needed = ceil(threshold * q - 1e-9)
+        if max(p[-1] for p in lists) < len(postings) * DENSE_COUNT_RATIO:
+            shared = np.bincount(postings)
+            candidates = np.flatnonzero(shared >= needed)
+            c = shared[candidates]
+        else:
+            positions, shared = np.unique(postings, return_counts=True)
+            enough = shared >= needed
+            candidates, c = positions[enough].astype(np.intp), shared[enough]
+        n = np.frombuffer(self.sizes, dtype=np.uint16)[candidates]
+        scores = c / (q + n - c)
+        keep = scores >= threshold
+        candidates, scores = candidates[keep], scores[keep]
+        # Best first; ties in index order
+        top = np.lexsort((candidates, -scores))[:limit]
+        return [
+            NameMatch(self.record_ids[i], self.keys[i], round(float(score), 4))
+            for i, score in zip(candidates[top].tolist(), scores[top].tolist())
+        ]
+
+    # -- persistence ---------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the index to a SQLite file (replacing it atomically)."""
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.unlink(missing_ok=True)
+        conn = sqlite3.connect(str(tmp))
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE names (position INTEGER PRIMARY KEY, record_id TEXT NOT NULL, "
+                    "search_key TEXT NOT NULL, trigrams INTEGER NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE trigrams (trigram TEXT PRIMARY KEY, postings BLOB NOT NULL)"
+                )
+                conn.executemany(
+                    "INSERT INTO names VALUES (?, ?, ?, ?)",
+                    zip(range(len(self)), self.record_ids, self.keys, self.sizes),
+                )
+                conn.executemany(
+                    "INSERT INTO trigrams VALUES (?, ?)",
+                    ((g, _to_blob(p)) for g, p in sorted(self.postings.items())),
+                )
+        finally:
+            conn.close()
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "NameTrigramIndex":
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            index = cls()
+            rows = conn.execute(
+                "SELECT record_id, search_key, trigrams FROM names ORDER BY position"
+            ).fetchall()
+            index.record_ids = [r[0] for r in rows]
+            index.keys = [r[1] for r in rows]
+            index.sizes = array("H", (r[2] for r in rows))
+            index.postings = {
+                sys.intern(g): _from_blob(b)
+                for g, b in conn.execute("SELECT trigram, postings FROM trigrams")
+            }
+        finally:
+            conn.close()
+        return index
+
+
+def _to_blob(posting: array) -> bytes:
+    if sys.byteorder == "big":  # stored little-endian
+        posting = array(_POSTING_TYPE, posting)
+        posting.byteswap()
+    return posting.tobytes()
+
+
+def _from_blob(blob: bytes) -> array:
+    posting = array(_POSTING_TYPE)
+    posting.frombytes(blob)
+    if sys.byteorder == "big":
+        posting.byteswap()
+    return posting
+
+
+def build_name_index(records: Iterable[RecordLike]) -> NameTrigramIndex:
+    return NameTrigramIndex().update(records)
+
+
+def run_name_index(
+    records: Iterable[RecordLike], country: Optional[str] = None
+) -> Path:
+    """Build the name index and save it next to the normalized output."""
+    index = build_name_index(records)
+    out_dir = _normalize.DATA_DIR / "normalized"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_file = out_dir / f"names_{country or 'all'}.db"
+    index.save(out_file)
+    logger.info(
+        f"Saved name index of {len(index)} names ({len(index.postings)} trigrams) to {out_file}"
+    )
+    return out_file
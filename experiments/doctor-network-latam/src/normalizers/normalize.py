@@ -4,25 +4,44 @@ Normalize raw collector output into the unified DoctorRecord schema.
 Handles:
   - Name standardization (title case, accent normalization)
   - Status mapping across countries
-  - Specialty code reconciliation
+  - Specialty code reconciliation (see taxonomy.py)
   - Deduplication across registries
 """
 
 from __future__ import annotations
 
-import json
 import re
+import sys
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
-from ..collectors.base import DoctorRecord
+from pydantic import TypeAdapter
+
+from ..collectors.base import DoctorRecord, stable_record_id
+from ..collectors.compact import CompactRecord, RecordLike, replace_fields
+from ..utils.json_stream import batched, iter_json_array
 from ..utils.logger import get_logger
+from ..utils.serialize import write_records
+from .taxonomy import reconcile_specialty_codes, specialty_codes_for
 
 logger = get_logger("normalizer")
 
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
+# Validating a whole batch through one adapter is much cheaper than calling
+# DoctorRecord(**r) per row.
+_RECORD_LIST_ADAPTER = TypeAdapter(list[DoctorRecord])
+# model_construct() introspects each default_factory on every call, which is
+# slower than validating — fill factory defaults ourselves in trusted mode.
+_DEFAULT_FACTORIES = {
+    name: field.default_factory
+    for name, field in DoctorRecord.model_fields.items()
+    if field.default_factory is not None
+}
+DEFAULT_LOAD_BATCH_SIZE = 5_000
+
 
 # ---------------------------------------------------------------------------
 # Status mapping per country
@@ -58,14 +77,37 @@ STATUS_MAP = {
 }
 
 
+WHITESPACE_RE = re.compile(r"\s+")
+NAME_PREFIX_RE = re.compile(r"^(dr\.?|dra\.?)\s+", re.IGNORECASE)
+
+# ---------------------------------------------------------------------------
+# Memoization / interning
+#
+# Statuses, specialties, regions and registry names repeat millions of times.
+# Their normalizers are wrapped in bounded LRU caches so each distinct input
+# is normalized once, and low-cardinality results are interned so every
+# record shares one string object per distinct value. Full names are mostly
+# unique, so `normalize_name` is not cached: it would only fill the cache.
+# ---------------------------------------------------------------------------
+NAME_CACHE_SIZE = 1 << 18  # per-name caches elsewhere (search keys, name tokens)
+VALUE_CACHE_SIZE = 1 << 14
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def intern_value(value: Optional[str]) -> Optional[str]:
+    """Canonical shared instance of a low-cardinality string."""
+    return sys.intern(value) if value else value
+
+
 def normalize_name(name: str) -> str:
     """Standardize a doctor name: title case, clean whitespace."""
-    name = re.sub(r"\s+", " ", name.strip())
+    name = WHITESPACE_RE.sub(" ", name.strip())
     # Handle common prefixes
-    name = re.sub(r"^(dr\.?|dra\.?)\s+", "", name, flags=re.IGNORECASE)
+    name = NAME_PREFIX_RE.sub("", name)
     return name.title()
 
 
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
 def normalize_status(country: str, raw_status: str) -> str:
     """Map country-specific status strings to unified enum."""
     if not raw_status:
@@ -77,22 +119,58 @@ def normalize_status(country: str, raw_status: str) -> str:
 
 def normalize_license(country: str, raw_license: str) -> str:
     """Clean and format license numbers."""
-    cleaned = re.sub(r"\s+", " ", raw_license.strip())
+    cleaned = WHITESPACE_RE.sub(" ", raw_license.strip())
     return cleaned
 
 
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def _clean_specialty(specialty: str) -> tuple[str, str]:
+    """(interned title-cased name, dedup key) for one raw specialty string."""
+    cleaned = sys.intern(specialty.strip().title())
+    return cleaned, cleaned.lower()
+
+
 def normalize_specialties(specialties: list[str]) -> list[str]:
     """Clean and deduplicate specialty names."""
     seen = set()
     result = []
     for s in specialties:
-        cleaned = s.strip().title()
-        if cleaned and cleaned.lower() not in seen:
-            seen.add(cleaned.lower())
+        cleaned, key = _clean_specialty(s)
+        if cleaned and key not in seen:
+            seen.add(key)
             result.append(cleaned)
     return result
 
 
+_CACHED_NORMALIZERS = {
+    "status": normalize_status,
+    "specialty": _clean_specialty,
+    "taxonomy": specialty_codes_for,
+    "intern": intern_value,
+}
+
+
+def normalization_cache_stats() -> dict[str, dict[str, float]]:
+    """Hit/miss counts and hit rate for each memoized normalizer."""
+    stats = {}
+    for label, fn in _CACHED_NORMALIZERS.items():
+        info = fn.cache_info()
+        lookups = info.hits + info.misses
+        stats[label] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+def clear_normalization_caches() -> None:
+    for fn in _CACHED_NORMALIZERS.values():
+        fn.cache_clear()
+
+
 def create_search_key(name: str) -> str:
     """Create a normalized key for deduplication (remove accents, lowercase)."""
     nfkd = unicodedata.normalize("NFKD", name)
@@ -100,89 +178,159 @@ def create_search_key(name: str) -> str:
     return re.sub(r"[^a-z\s]", "", ascii_name.lower()).strip()
 
 
-def normalize_record(record: DoctorRecord) -> DoctorRecord:
-    """Apply all normalizations to a single record."""
-    return DoctorRecord(
-        id=record.id,
-        source_country=record.source_country,
-        source_registry=record.source_registry,
-        license_number=normalize_license(record.source_country, record.license_number),
+def normalize_record(record: RecordLike) -> RecordLike:
+    """Apply all normalizations to a single record (keeps its representation)."""
+    country, registry = record.source_country, record.source_registry
+    license_number = normalize_license(country, record.license_number)
+    specialties = normalize_specialties(record.specialties)
+    return replace_fields(
+        record,
+        id=stable_record_id(country, registry, license_number),
+        license_number=license_number,
         full_name=normalize_name(record.full_name),
-        specialties=normalize_specialties(record.specialties),
-        specialty_codes=record.specialty_codes,
+        specialties=specialties,
+        specialty_codes=reconcile_specialty_codes(country, specialties),
         status=normalize_status(record.source_country, record.status),
-        state_region=record.state_region,
-        city=record.city,
-        hospital_affiliations=record.hospital_affiliations,
-        insurance_networks=record.insurance_networks,
-        education=record.education,
-        languages=record.languages,
-        contact=record.contact,
-        raw_data=record.raw_data,
-        collected_at=record.collected_at,
-        source_url=record.source_url,
+        source_registry=intern_value(registry),
+        state_region=intern_value(record.state_region),
+        city=intern_value(record.city),
     )
 
 
-def normalize_batch(records: list[DoctorRecord]) -> list[DoctorRecord]:
-    """Normalize and deduplicate a batch of records."""
-    normalized = [normalize_record(r) for r in records]
+def normalize_batch(records: Iterable[RecordLike]) -> list[RecordLike]:
+    """Normalize and deduplicate a batch (or stream) of records."""
+    total = 0
 
     # Deduplicate by (country + license_number)
-    seen: dict[str, DoctorRecord] = {}
-    for r in normalized:
+    seen: dict[str, RecordLike] = {}
+    for record in records:
+        total += 1
+        r = normalize_record(record)
         key = f"{r.source_country}:{r.license_number}"
         if key not in seen:
             seen[key] = r
 
     deduped = list(seen.values())
     logger.info(
-        f"Normalized {len(records)} records → {len(deduped)} unique "
-        f"({len(records) - len(deduped)} duplicates removed)"
+        f"Normalized {total} records → {len(deduped)} unique "
+        f"({total - len(deduped)} duplicates removed)"
     )
     return deduped
 
 
-def load_raw_records(country: Optional[str] = None) -> list[DoctorRecord]:
-    """Load raw JSON files from data/raw/ directory."""
+def _raw_files(country: Optional[str] = None) -> list[Path]:
+    """List raw JSON files for one country (or all), in load order."""
     raw_dir = DATA_DIR / "raw"
-    records: list[DoctorRecord] = []
+    if not raw_dir.exists():
+        return []
 
     if country:
         search_dirs = [raw_dir / country]
     else:
-        search_dirs = [d for d in raw_dir.iterdir() if d.is_dir()]
-
-    for d in search_dirs:
-        for f in sorted(d.glob("*.json")):
-            try:
-                data = json.loads(f.read_text(encoding="utf-8"))
-                records.extend(DoctorRecord(**r) for r in data)
-            except Exception as e:
-                logger.warning(f"Failed to load {f}: {e}")
-
-    return records
-
-
-def run_normalization(country: Optional[str] = None) -> list[DoctorRecord]:
-    """Full normalization pipeline: load raw → normalize → save."""
-    records = load_raw_records(country)
-    if not records:
+        search_dirs = sorted(d for d in raw_dir.iterdir() if d.is_dir())
+
+    return [f for d in search_dirs for f in sorted(d.glob("*.json"))]
+
+
+def _construct_trusted(row: dict) -> DoctorRecord:
+    if "id" not in row:
+        row["id"] = stable_record_id(
+            row["source_country"], row["source_registry"], row["license_number"]
+        )
+    for name, factory in _DEFAULT_FACTORIES.items():
+        if name not in row:
+            row[name] = factory()
+    return DoctorRecord.model_construct(**row)
+
+
+def iter_file_records(
+    path: Path,
+    trusted: bool = False,
+    batch_size: int = DEFAULT_LOAD_BATCH_SIZE,
+    compact: bool = False,
+) -> Iterator[RecordLike]:
+    """Stream the records of one raw file (raises on invalid input)."""
+    for batch in batched(iter_json_array(path), batch_size):
+        if trusted and compact:
+            yield from (CompactRecord.from_dict(r) for r in batch)
+        elif trusted:
+            yield from (_construct_trusted(r) for r in batch)
+        elif compact:
+            models = _RECORD_LIST_ADAPTER.validate_python(batch)
+            yield from (CompactRecord.from_model(m) for m in models)
+        else:
+            yield from _RECORD_LIST_ADAPTER.validate_python(batch)
+
+
+def iter_raw_records(
+    country: Optional[str] = None,
+    trusted: bool = False,
+    batch_size: int = DEFAULT_LOAD_BATCH_SIZE,
+    compact: bool = False,
+) -> Iterator[RecordLike]:
+    """
+    Stream raw records from data/raw/ without loading whole files.
+
+    Records are decoded incrementally and validated ``batch_size`` at a time.
+    With ``trusted=True`` validation is skipped entirely — only use it for
+    files written by our own collectors. With ``compact=True`` records are
+    yielded as `CompactRecord` instead of pydantic models.
+
+    Files load all or nothing: a file's records are held until the whole
+    file has decoded and validated, so one that is corrupt or invalid
+    partway through is skipped entirely. Peak memory is the records of the
+    largest file, never its JSON text and dict tree at once.
+    """
+    for f in _raw_files(country):
+        try:
+            records = list(iter_file_records(f, trusted, batch_size, compact))
+        except Exception as e:
+            logger.warning(f"Skipped {f}: {e}")
+            continue
+        yield from records
+
+
+def load_raw_records(
+    country: Optional[str] = None, trusted: bool = False
+) -> list[DoctorRecord]:
+    """Load raw JSON files from data/raw/ directory."""
+    return list(iter_raw_records(country, trusted=trusted))
+
+
+def run_normalization(
+    country: Optional[str] = None,
+    trusted: bool = False,
+    normalizer: Optional[Callable[[Iterable[RecordLike]], list]] = None,
+) -> list[CompactRecord]:
+    """
+    Full normalization pipeline: load raw → normalize → save.
+
+    Works on `CompactRecord`s end to end; call `to_model()` on the results
+    where a validated `DoctorRecord` is needed. ``normalizer`` swaps in an
+    alternative to `normalize_batch` with the same contract (e.g. the
+    columnar one).
+    """
+    normalizer = normalizer or normalize_batch
+    normalized = normalizer(
+        iter_raw_records(country, trusted=trusted, compact=True)
+    )
+    logger.info(
+        "Normalizer cache hit rates: "
+        + ", ".join(
+            f"{label}={s['hit_rate']:.1%}" for label, s in normalization_cache_stats().items()
+        )
+    )
+    if not normalized:
         logger.warning("No raw records found to normalize")
         return []
 
-    normalized = normalize_batch(records)
-
     # Save normalized output
     out_dir = DATA_DIR / "normalized"
     out_dir.mkdir(parents=True, exist_ok=True)
 
     suffix = country or "all"
     out_file = out_dir / f"doctors_{suffix}.json"
-    out_file.write_text(
-        json.dumps([r.model_dump() for r in normalized], indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    write_records(normalized, out_file)
     logger.info(f"Saved {len(normalized)} normalized records to {out_file}")
 
     return normalized
@@ -0,0 +1,192 @@
+"""
+Specialty taxonomy reconciliation: free-text specialties → taxonomy codes.
+
+`config/specialties.json` maps each taxonomy code (``CARDIOLOGY``,
+``INTERNAL_MEDICINE``, ...) to synonyms per language and, optionally, per
+country. For each country the synonyms are accent-folded and compiled once
+into an Aho-Corasick automaton, so a specialty string is matched against
+every synonym in a single left-to-right pass ("Cardiologia",
+"Cardiología" and "CARDIOLOGÍA " all fold to the same text).
+
+Matches must sit on word boundaries; overlapping matches resolve
+leftmost-longest ("Cirurgia Cardiovascular" is cardiovascular surgery, not
+cardiology). Results are memoized per (country, specialty), since the
+same few hundred strings repeat across a registry.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger("normalizer.taxonomy")
+
+TAXONOMY_PATH = Path(__file__).resolve().parents[2] / "config" / "specialties.json"
+CODE_CACHE_SIZE = 1 << 14
+
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+def fold(text: str) -> str:
+    """Accent-folded, lowercase text with non-alphanumerics as single spaces."""
+    if not text.isascii():
+        nfkd = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in nfkd if not unicodedata.combining(c))
+    return _NON_ALNUM_RE.sub(" ", text.lower()).strip()
+
+
+class SpecialtyMatcher:
+    """
+    Aho-Corasick automaton over folded synonyms → taxonomy codes.
+
+    The alphabet is whole words rather than characters: matches have to sit
+    on word boundaries anyway, and a specialty is a handful of words but
+    dozens of characters.
+    """
+
+    def __init__(self, synonyms: dict[str, str]):
+        # State 0 is the root; per state: transitions, failure link and the
+        # (length in words, code) of the longest synonym ending there
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[Optional[tuple[int, str]]] = [None]
+        # Every synonym ending at each state, including via failure links
+        self._outputs: list[tuple[tuple[int, str], ...]] = []
+
+        for synonym, code in synonyms.items():
+            self._add(fold(synonym).split(), code)
+        self._build()
+
+    def _add(self, words: list[str], code: str) -> None:
+        if not words:
+            return
+        state = 0
+        for word in words:
+            nxt = self._goto[state].get(word)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][word] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+            state = nxt
+        # Synonyms that fold to the same words keep the first code, as in
+        # `SpecialtyTaxonomy.synonyms_for`
+        current = self._out[state]
+        if current is None:
+            self._out[state] = (len(words), code)
+        elif current[1] != code:
+            logger.warning(
+                f"Synonym {' '.join(words)!r} maps to {current[1]} and {code}; keeping {current[1]}"
+            )
+
+    def _build(self) -> None:
+        """Breadth-first failure links; merge outputs along them."""
+        outputs: list[tuple[tuple[int, str], ...]] = [()] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            own = (self._out[state],) if self._out[state] else ()
+            outputs[state] = own + outputs[self._fail[state]]
+            for word, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(word, 0)
+                queue.append(nxt)
+        self._outputs = outputs
+
+    def match(self, text: str) -> list[str]:
+        """Taxonomy codes found in ``text`` (in order, without repeats)."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: list[tuple[int, int, str]] = []  # (start, -length, code)
+        state = 0
+        for end, word in enumerate(fold(text).split(), 1):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for length, code in outputs[state]:
+                found.append((end - length, -length, code))
+
+        # Leftmost-longest, non-overlapping
+        codes: list[str] = []
+        covered = 0
+        for start, neg_length, code in sorted(found):
+            if start >= covered:
+                covered = start - neg_length
+                if code not in codes:
+                    codes.append(code)
+        return codes
+
+
+class SpecialtyTaxonomy:
+    """Per-country matchers compiled from the synonym table."""
+
+    def __init__(self, table: dict):
+        self.names = {code: entry["name"] for code, entry in table["specialties"].items()}
+        self.languages: dict[str, str] = table.get("country_languages", {})
+        self._specialties = table["specialties"]
+        self._matchers: dict[Optional[str], SpecialtyMatcher] = {}
+
+    @classmethod
+    def load(cls, path: Path = TAXONOMY_PATH) -> "SpecialtyTaxonomy":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def synonyms_for(self, country: Optional[str]) -> dict[str, str]:
+        """synonym → code for a country (all synonyms for unknown countries)."""
+        language = self.languages.get(country) if country else None
+        synonyms: dict[str, str] = {}
+        for code, entry in self._specialties.items():
+            for key, words in entry["synonyms"].items():
+                if language is None or key in (language, country):
+                    for word in words:
+                        synonyms.setdefault(word, code)
+        return synonyms
+
+    def matcher(self, country: Optional[str]) -> SpecialtyMatcher:
+        key = country if country in self.languages else None
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            matcher = self._matchers[key] = SpecialtyMatcher(self.synonyms_for(key))
+        return matcher
+
+    def codes(self, country: Optional[str], specialties: Iterable[str]) -> list[str]:
+        """Taxonomy codes for a record's specialties (in order, without repeats)."""
+        matcher = self.matcher(country)
+        codes: list[str] = []
+        for specialty in specialties:
+            for code in matcher.match(specialty):
+                if code not in codes:
+                    codes.append(code)
+        return codes
+
+
+@lru_cache(maxsize=1)
+def default_taxonomy() -> SpecialtyTaxonomy:
+    taxonomy = SpecialtyTaxonomy.load()
+    logger.info(f"Loaded specialty taxonomy: {len(taxonomy.names)} codes from {TAXONOMY_PATH}")
+    return taxonomy
+
+
+@lru_cache(maxsize=CODE_CACHE_SIZE)
+def specialty_codes_for(country: str, specialty: str) -> tuple[str, ...]:
+    """Memoized codes for one specialty string with the default taxonomy."""
+    return tuple(default_taxonomy().matcher(country).match(specialty))
+
+
+def reconcile_specialty_codes(country: str, specialties: Iterable[str]) -> list[str]:
+    """`specialty_codes` for a record: codes of each specialty, without repeats."""
+    codes: list[str] = []
+    for specialty in specialties:
+        for code in specialty_codes_for(country, specialty):
+            if code not in codes:
+                codes.append(code)
+    return codes
@@ -0,0 +1,327 @@
+"""
+Read-only doctor lookup server over a normalized snapshot.
+
+The scheduling frontend looks doctors up by id, by license and by name
+prefix. Opening the latest SQLite or JSON export per query is too slow for
+that, so this loads a snapshot (``data/normalized/doctors_<country>.json``)
+into memory once:
+
+  - by id:          dict id → record
+  - by license:     dict license number → records (one per country)
+  - by name prefix: sorted accent-folded name words (`fold()`), each with
+                    the positions of the records using it, so the words
+                    starting with a prefix are one `bisect` range
+
+A name query walks the postings of its most selective word's range and
+checks its other words against each candidate's folded name. Encoded responses are
+kept in an LRU cache per snapshot, so a hot query is a dict hit.
+
+`LookupService` serves one `LookupIndex` at a time. `reload()` builds the
+new index beside the one serving and swaps the reference, so requests in
+flight finish on the old snapshot and none is refused; a snapshot that
+fails to load leaves the old one in place. `watch()` reloads when the
+snapshot file changes.
+
+HTTP (``ThreadingHTTPServer``, JSON, keep-alive):
+
+    GET /doctors/<id>
+    GET /license/<license number>?country=BR
+    GET /search?q=maria%20sil&limit=20
+    GET /health
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from ..collectors.compact import CompactRecord, RecordLike, to_compact
+from ..normalizers.normalize import NAME_CACHE_SIZE, normalize_license
+from ..normalizers.taxonomy import fold
+from ..utils.json_stream import iter_json_array
+from ..utils.logger import get_logger
+from ..utils.serialize import get_encoder
+
+logger = get_logger("service.lookup")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 200
+QUERY_CACHE_SIZE = 1 << 14
+WATCH_INTERVAL = 5.0
+
+# Returned records leave out the raw registry payload
+_EXCLUDED = frozenset({"raw_data"})
+_MAX_TOKEN = "\U0010ffff"
+_encode = get_encoder()
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _fold_word(word: str) -> tuple[str, ...]:
+    # Names share a small vocabulary of words; fold each one once
+    return tuple(sys.intern(t) for t in fold(word).split())
+
+
+def name_tokens(name: str) -> list[str]:
+    """Accent-folded, lowercase words of a name."""
+    return [t for word in name.split() for t in _fold_word(word)]
+
+
+class LookupIndex:
+    """In-memory indexes over one snapshot; immutable once built."""
+
+    def __init__(
+        self,
+        records: Iterable[RecordLike],
+        source: Optional[Path] = None,
+        cache_size: int = QUERY_CACHE_SIZE,
+    ):
+        self.records: list[CompactRecord] = []
+        self.by_id: dict[str, CompactRecord] = {}
+        self.by_license: dict[str, list[CompactRecord]] = {}
+        postings: dict[str, list[int]] = {}
+        # " maria silva": a query word is a name-word prefix iff " <word>" is in it
+        self._folded_names: list[str] = []
+        for record in records:
+            record = to_compact(record)
+            position = len(self.records)
+            self.records.append(record)
+            self.by_id[record.id] = record
+            self.by_license.setdefault(record.license_number, []).append(record)
+            tokens = name_tokens(record.full_name)
+            self._folded_names.append(" " + " ".join(tokens))
+            for token in set(tokens):
+                postings.setdefault(token, []).append(position)
+        self._tokens = sorted(postings)
+        self._postings = [postings[t] for t in self._tokens]
+        # Postings before each token, to size a prefix range without walking it
+        self._offsets = [0, *accumulate(map(len, self._postings))]
+
+        self.source = source
+        self.loaded_at = datetime.now(timezone.utc).isoformat()
+        # Per snapshot, so a swap can never serve the previous one's answers
+        self.respond = lru_cache(maxsize=cache_size)(self._respond)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def find_by_id(self, record_id: str) -> Optional[CompactRecord]:
+        return self.by_id.get(record_id)
+
+    def find_by_license(
+        self, license_number: str, country: Optional[str] = None
+    ) -> list[CompactRecord]:
+        """Doctors with this license number, optionally in one country."""
+        found = self.by_license.get(normalize_license(country or "", license_number), [])
+        return [r for r in found if not country or r.source_country == country]
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        """Slice of the sorted tokens that start with ``prefix``."""
+        return (
+            bisect_left(self._tokens, prefix),
+            bisect_left(self._tokens, prefix + _MAX_TOKEN),
+        )
+
+    def search_names(self, text: str, limit: int = DEFAULT_LIMIT) -> list[CompactRecord]:
+        """Doctors with a name word starting with every (accent-folded) word of ``text``."""
+        query = set(name_tokens(text))
+        if not query:
+            return []
+        # Walk the postings of the most selective word, check the others
+        ranges = {q: self._prefix_range(q) for q in query}
+        word = min(query, key=lambda q: self._offsets[ranges[q][1]] - self._offsets[ranges[q][0]])
+        start, stop = ranges[word]
+        others = [" " + q for q in query if q != word]
+        names = self._folded_names
+        results: list[CompactRecord] = []
+        seen: set[int] = set()
+        for position in chain.from_iterable(self._postings[start:stop]):
+            if position in seen:
+                continue
+            seen.add(position)
+            name = names[position]
+            if all(q in name for q in others):
+                results.append(self.records[position])
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _respond(self, kind: str, key: str, option: str) -> Optional[bytes]:
+        """Encoded body of one query, or None if nothing was found."""
+        if kind == "doctors":
+            record = self.find_by_id(key)
+            return _encode(record.as_json_obj(_EXCLUDED), False) if record else None
+        if kind == "license":
+            found = self.find_by_license(key, option or None)
+            if not found:
+                return None
+        else:
+            found = self.search_names(key, int(option))
+        return _encode([r.as_json_obj(_EXCLUDED) for r in found], False)
+
+    def cache_stats(self) -> dict:
+        info = self.respond.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def load_snapshot(path: Path, cache_size: int = QUERY_CACHE_SIZE) -> LookupIndex:
+    """Build a `LookupIndex` from a normalized snapshot file."""
+    start = time.perf_counter()
+    index = LookupIndex(
+        (CompactRecord.from_dict(obj) for obj in iter_json_array(path)), path, cache_size
+    )
+    logger.info(
+        f"Loaded {len(index)} records from {path} in {time.perf_counter() - start:.2f}s"
+    )
+    return index
+
+
+class LookupService:
+    """The index being served, hot-swapped on reload."""
+
+    def __init__(self, snapshot: Path, cache_size: int = QUERY_CACHE_SIZE):
+        self.snapshot = snapshot
+        self.cache_size = cache_size
+        self.index = load_snapshot(snapshot, cache_size)
+        self._version = self._file_version()
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _file_version(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self.snapshot.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def swap(self, index: LookupIndex) -> None:
+        # A single reference assignment: each request reads self.index once
+        self.index = index
+
+    def reload(self) -> bool:
+        """Load the snapshot again and swap it in; on failure keep serving the old one."""
+        with self._reload_lock:
+            # Recorded either way: a failed version is retried once the file changes again
+            self._version = self._file_version()
+            try:
+                index = load_snapshot(self.snapshot, self.cache_size)
+            except Exception as e:
+                logger.warning(f"Keeping the current snapshot, reload failed: {e}")
+                return False
+            self.swap(index)
+            return True
+
+    def watch(self, interval: float = WATCH_INTERVAL) -> threading.Thread:
+        """Reload in the background whenever the snapshot file changes."""
+        def run() -> None:
+            while not self._stop.wait(interval):
+                version = self._file_version()
+                if version is not None and version != self._version:
+                    self.reload()
+
+        thread = threading.Thread(target=run, name="snapshot-watch", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class LookupHandler(BaseHTTPRequestHandler):
+    """JSON lookups against ``server.service``."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive: clients reuse connections
+    # Headers and body go out in separate writes; with Nagle on, the body
+    # waits for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+    server: "LookupServer"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        parts = url.path.strip("/").split("/", 1)
+        index = self.server.service.index  # one snapshot for the whole request
+
+        if parts == ["health"]:
+            self._send(HTTPStatus.OK, _encode({
+                "status": "ok",
+                "snapshot": str(index.source),
+                "records": len(index),
+                "loaded_at": index.loaded_at,
+                "cache": index.cache_stats(),
+            }, False))
+            return
+        if parts[0] in ("doctors", "license") and len(parts) == 2 and parts[1]:
+            body = index.respond(parts[0], unquote(parts[1]), params.get("country", [""])[0])
+        elif parts == ["search"] and params.get("q"):
+            try:
+                limit = min(int(params.get("limit", [DEFAULT_LIMIT])[0]), MAX_LIMIT)
+            except ValueError:
+                self._error(HTTPStatus.BAD_REQUEST, "limit must be an integer")
+                return
+            body = index.respond("search", params["q"][0], str(max(limit, 1)))
+        else:
+            self._error(HTTPStatus.NOT_FOUND, "unknown endpoint")
+            return
+        if body is None:
+            self._error(HTTPStatus.NOT_FOUND, "not found")
+        else:
+            self._send(HTTPStatus.OK, body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, _encode({"error": message}, False))
+
+    def _send(self, status: HTTPStatus, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # One line per request would dominate the cost of a lookup
+        pass
+
+
+class LookupServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, service: LookupService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.service = service
+        super().__init__((host, port), LookupHandler)
+
+
+def serve(
+    snapshot: Path,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    watch_interval: float = WATCH_INTERVAL,
+) -> None:
+    """Serve lookups over ``snapshot`` until interrupted, reloading it when it changes."""
+    service = LookupService(snapshot)
+    service.watch(watch_interval)
+    with LookupServer(service, host, port) as server:
+        logger.info(f"Serving {len(service.index)} doctors on http://{host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.stop()
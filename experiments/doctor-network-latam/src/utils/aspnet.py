@@ -0,0 +1,169 @@
+"""
+Pool of ASP.NET WebForms sessions for form-based registry searches.
+
+A WebForms page only accepts a postback carrying the hidden fields it
+rendered (``__VIEWSTATE``, ``__EVENTVALIDATION``, ...) from the session
+named by its cookie. The naive client GETs the form before every POST and
+runs one query at a time. Instead, each `AspNetSession` keeps its own
+cookies and the hidden fields of the last page it received: a postback's
+response is the form again with fresh fields, so consecutive queries on a
+session are one POST each. The form is fetched again only when the fields
+are stale:
+
+  - older than ``max_age`` (before the server's session timeout), or
+  - the server rejected them: HTTP 500 (ViewState MAC / event validation
+    failure), a redirect (expired session; not followed, since each hop
+    would be a request outside the rate limit), or a reply without the
+    hidden fields; the query is then retried once
+
+`AspNetSessionPool` runs queries concurrently, one per session at a time,
+all through the collector's `RateLimitedClient`, so the rate limit still
+spaces every request while the sessions' round trips overlap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import re
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+import httpx
+from tenacity import RetryError
+
+from .http_client import RateLimitedClient
+from .logger import get_logger
+
+logger = get_logger("http.aspnet")
+
+POOL_SIZE = 4
+SESSION_MAX_AGE = 15 * 60  # seconds; IIS expires idle sessions after 20 minutes
+
+# WebForms renders its hidden fields in this fixed shape
+_HIDDEN_RE = re.compile(
+    r'<input type="hidden" name="(__[A-Z]+)" id="__[A-Z]+" value="([^"]*)"\s*/?>'
+)
+
+Q = TypeVar("Q")
+R = TypeVar("R")
+
+
+class StaleFormError(Exception):
+    """The server no longer accepts a session's form fields."""
+
+
+def hidden_fields(page: str) -> dict[str, str]:
+    """``__VIEWSTATE``, ``__EVENTVALIDATION``, ... of a WebForms page."""
+    return {name: html.unescape(value) for name, value in _HIDDEN_RE.findall(page)}
+
+
+class AspNetSession:
+    """One server session: its cookies and the form's current hidden fields."""
+
+    def __init__(self, http: RateLimitedClient, url: str, max_age: float = SESSION_MAX_AGE):
+        self.http = http
+        self.url = url
+        self.max_age = max_age
+        self.cookies = httpx.Cookies()
+        self.fields: dict[str, str] = {}
+        self.loaded_at = 0.0
+        self.refreshes = 0
+
+    @property
+    def stale(self) -> bool:
+        return not self.fields or time.monotonic() - self.loaded_at > self.max_age
+
+    def _headers(self) -> dict[str, str]:
+        if not self.cookies:
+            return {}
+        return {"Cookie": "; ".join(f"{k}={v}" for k, v in self.cookies.items())}
+
+    def _accept(self, response: httpx.Response) -> str:
+        """Keep the cookies and hidden fields of a form page; return its HTML."""
+        self.cookies.update(response.cookies)
+        page = response.text
+        fields = hidden_fields(page)
+        if response.url.path != httpx.URL(self.url).path or "__VIEWSTATE" not in fields:
+            raise StaleFormError(f"not the form: {response.url}")
+        self.fields = fields
+        return page
+
+    async def load(self) -> None:
+        """Start over: new session cookie and fresh hidden fields."""
+        self.cookies = httpx.Cookies()
+        self.fields = {}
+        response = await self.http.get(self.url, headers=self._headers())
+        self._accept(response)
+        self.loaded_at = time.monotonic()
+        self.refreshes += 1
+
+    async def submit(self, form: dict[str, str]) -> str:
+        """Post ``form`` with the current hidden fields; HTML of the result page."""
+        for attempt in (1, 2):
+            if self.stale:
+                await self.load()
+            try:
+                response = await self.http.post(
+                    self.url, data={**self.fields, **form}, headers=self._headers(),
+                    follow_redirects=False,
+                )
+                page = self._accept(response)
+            except (httpx.HTTPStatusError, StaleFormError) as e:
+                if isinstance(e, httpx.HTTPStatusError) and not (
+                    e.response.is_redirect or e.response.status_code == 500
+                ):
+                    raise
+                if attempt == 2:
+                    raise StaleFormError(f"rejected after a refresh: {e}") from e
+                logger.debug(f"Form fields went stale ({e}); reloading {self.url}")
+                self.fields = {}
+                continue
+            self.loaded_at = time.monotonic()  # the server just renewed the session
+            return page
+
+
+class AspNetSessionPool:
+    """``size`` independent sessions on one form, queried concurrently."""
+
+    def __init__(
+        self,
+        http: RateLimitedClient,
+        url: str,
+        size: int = POOL_SIZE,
+        max_age: float = SESSION_MAX_AGE,
+    ):
+        # Sessions keep their own cookies: the shared client must not mix them
+        http.client.cookies = httpx.Cookies(CookieJar(DefaultCookiePolicy(allowed_domains=[])))
+        self.sessions = [AspNetSession(http, url, max_age) for _ in range(max(size, 1))]
+
+    @property
+    def refreshes(self) -> int:
+        return sum(s.refreshes for s in self.sessions)
+
+    async def map(
+        self,
+        fn: Callable[[AspNetSession, Q], Awaitable[R]],
+        queries: Iterable[Q],
+    ) -> list[Optional[R]]:
+        """
+        ``fn(session, query)`` for every query, in order; None where it failed.
+
+        Failures are logged by the query's position, never its value.
+        """
+        queries = list(queries)
+        results: list[Optional[R]] = [None] * len(queries)
+        pending = iter(enumerate(queries))
+
+        async def worker(session: AspNetSession) -> None:
+            # Workers share the iterator: each takes the next query when free
+            for i, query in pending:
+                try:
+                    results[i] = await fn(session, query)
+                except (httpx.HTTPError, RetryError, StaleFormError) as e:
+                    # By position: queries can be personal data (national IDs)
+                    logger.warning(f"Query #{i} of {len(queries)} failed: {e}")
+
+        await asyncio.gather(*(worker(s) for s in self.sessions))
+        return results
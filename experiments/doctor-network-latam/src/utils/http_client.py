@@ -57,11 +57,14 @@ class RateLimitedClient:
         url: str,
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
+        follow_redirects: bool = True,
     ) -> httpx.Response:
         """GET with rate limiting and retry."""
         await self._wait_for_rate_limit()
         logger.debug(f"GET {url} params={params}")
-        response = await self.client.get(url, params=params, headers=headers)
+        response = await self.client.get(
+            url, params=params, headers=headers, follow_redirects=follow_redirects
+        )
         response.raise_for_status()
         return response
 
@@ -77,12 +80,14 @@ class RateLimitedClient:
         json: Optional[dict] = None,
         content: Optional[str] = None,
         headers: Optional[dict] = None,
+        follow_redirects: bool = True,
     ) -> httpx.Response:
         """POST with rate limiting and retry."""
         await self._wait_for_rate_limit()
         logger.debug(f"POST {url}")
         response = await self.client.post(
-            url, data=data, json=json, content=content, headers=headers
+            url, data=data, json=json, content=content, headers=headers,
+            follow_redirects=follow_redirects,
         )
         response.raise_for_status()
         return response
@@ -0,0 +1,80 @@
+"""Incremental JSON readers for large record files."""
+
+from __future__ import annotations
+
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in ``chunk_size`` pieces and each element is decoded as
+    soon as it is complete, so only one chunk plus the current element is
+    held in memory instead of the whole document.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+        started = False
+
+        while True:
+            # Skip separators; refill when we run off the end of the buffer
+            while pos < len(buf) and (buf[pos] in _WHITESPACE or (started and buf[pos] == ",")):
+                pos += 1
+            if pos >= len(buf):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {path}")
+                buf, pos = f.read(chunk_size), 0
+                eof = not buf
+                continue
+
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError(f"Expected a JSON array in {path}")
+                started = True
+                pos += 1
+                continue
+
+            if buf[pos] == "]":
+                return
+
+            try:
+                item, end = _decoder.raw_decode(buf, pos)
+                # A value cut at the buffer edge can still decode ("1." of
+                # "1.5" as 1), so only trust it once the "," or "]" after it
+                # is in the buffer.
+                after = end
+                while after < len(buf) and buf[after] in _WHITESPACE:
+                    after += 1
+                if after >= len(buf) or buf[after] not in ",]":
+                    raise json.JSONDecodeError("Expecting ',' or ']'", buf, after)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    eof = True
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+
+            yield item
+            pos = end
+            if pos > chunk_size:
+                buf, pos = buf[pos:], 0
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Group an iterable into lists of at most ``size`` items."""
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
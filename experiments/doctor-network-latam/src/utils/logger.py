@@ -16,6 +16,9 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         return logger
 
     logger.setLevel(level)
+    # Every logger gets its own handlers; don't repeat records via parents
+    # like "doctor-network.normalizer" for "doctor-network.normalizer.columnar"
+    logger.propagate = False
     formatter = logging.Formatter(
         "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -0,0 +1,104 @@
+"""
+Append-only side store for raw collector payloads (`DoctorRecord.raw_data`).
+
+Collectors write each record's raw payload here once, keyed by record id,
+instead of carrying it through normalization and every exporter. Layout per
+country:
+
+    data/raw_store/<CC>/payloads.jsonl   one JSON object per line
+    data/raw_store/<CC>/payloads.idx     "<id>\t<offset>\t<length>" per line
+
+Both files are append-only; when an id is written twice the latest entry
+wins. The index is read lazily on first lookup and payloads are read with a
+single seek.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+STORE_DIR = DATA_DIR / "raw_store"
+
+
+class RawStore:
+    """Keyed, append-only payload file with an offset index."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.data_path = self.directory / "payloads.jsonl"
+        self.index_path = self.directory / "payloads.idx"
+        self._index: Optional[dict[str, tuple[int, int]]] = None
+
+    @classmethod
+    def for_country(cls, country_code: str) -> "RawStore":
+        return cls(STORE_DIR / country_code)
+
+    def put_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Append payloads; empty payloads are skipped. Returns count written."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        written = 0
+        index_lines: list[str] = []
+
+        with open(self.data_path, "ab") as data:
+            offset = data.tell()
+            for record_id, payload in items:
+                if not payload:
+                    continue
+                line = json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+                data.write(line)
+                index_lines.append(f"{record_id}\t{offset}\t{len(line)}\n")
+                if self._index is not None:
+                    self._index[record_id] = (offset, len(line))
+                offset += len(line)
+                written += 1
+
+        if index_lines:
+            with open(self.index_path, "a", encoding="utf-8") as idx:
+                idx.writelines(index_lines)
+        return written
+
+    def get(self, record_id: str) -> Optional[dict[str, Any]]:
+        """Load one payload by record id (None if absent)."""
+        entry = self._load_index().get(record_id)
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(self.data_path, "rb") as data:
+            data.seek(offset)
+            return json.loads(data.read(length))
+
+    def get_many(self, record_ids: Iterable[str]) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Load several payloads in file order with one open handle."""
+        index = self._load_index()
+        wanted = sorted(
+            (index[rid][0], index[rid][1], rid) for rid in set(record_ids) if rid in index
+        )
+        if not wanted:
+            return
+        with open(self.data_path, "rb") as data:
+            for offset, length, rid in wanted:
+                data.seek(offset)
+                yield rid, json.loads(data.read(length))
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._load_index())
+
+    def _load_index(self) -> dict[str, tuple[int, int]]:
+        if self._index is None:
+            index: dict[str, tuple[int, int]] = {}
+            if self.index_path.exists():
+                with open(self.index_path, "r", encoding="utf-8") as idx:
+                    for line in idx:
+                        parts = line.rstrip("\n").split("\t")
+                        if len(parts) != 3:
+                            continue  # torn write from an interrupted run
+                        index[parts[0]] = (int(parts[1]), int(parts[2]))
+            self._index = index
+        return self._index
+
@@ -0,0 +1,162 @@
+"""
+Streaming record serialization with pluggable JSON encoder backends.
+
+`write_records()` encodes records one at a time and flushes bytes to the
+output in chunks, so no per-file list of dicts or giant string is ever
+built. Output is a JSON array with one record per line by default;
+``pretty=True`` reproduces the ``json.dumps(..., indent=2)`` layout.
+
+Backends are plain callables ``(obj, pretty) -> bytes``. ``"json"`` (stdlib)
+is always available, ``"orjson"`` is used by default when installed, and
+others can be added with `register_encoder()`. `write_encoded()` writes
+values that are already encoded (e.g. JSON kept in a store) the same way,
+and `JsonArrayWriter` does so incrementally.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Iterable, Optional, Union
+
+try:  # optional, much faster encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+Encoder = Callable[[Any, bool], bytes]
+
+DEFAULT_CHUNK_SIZE = 1_000
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types the encoders don't know (CompactRecord internals)."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if hasattr(obj, "as_json_obj"):
+        return obj.as_json_obj()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(obj: Any, pretty: bool) -> bytes:
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+    return text.encode("utf-8")
+
+
+def _encode_orjson(obj: Any, pretty: bool) -> bytes:
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+_ENCODERS: dict[str, Encoder] = {"json": _encode_json}
+if orjson is not None:
+    _ENCODERS["orjson"] = _encode_orjson
+
+
+def register_encoder(name: str, encoder: Encoder) -> None:
+    """Make an encoder available to `write_records(backend=name)`."""
+    _ENCODERS[name] = encoder
+
+
+def available_encoders() -> list[str]:
+    return sorted(_ENCODERS)
+
+
+def get_encoder(backend: Optional[str] = None) -> Encoder:
+    if backend is None:
+        backend = "orjson" if "orjson" in _ENCODERS else "json"
+    try:
+        return _ENCODERS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown serialization backend: {backend} (available: {available_encoders()})"
+        ) from None
+
+
+def record_to_obj(record: Any, exclude: frozenset[str] = frozenset()) -> Any:
+    """
+    Cheapest JSON-encodable view of a record.
+
+    CompactRecords become a shallow field dict (tuples and mapping proxies are
+    left for the encoder); pydantic models go through `model_dump()`.
+    """
+    if hasattr(record, "as_json_obj"):
+        return record.as_json_obj(exclude)
+    if hasattr(record, "model_dump"):
+        return record.model_dump(exclude=set(exclude) or None)
+    return record
+
+
+def write_records(
+    records: Iterable[Any],
+    target: Union[Path, str, BinaryIO],
+    pretty: bool = False,
+    backend: Optional[str] = None,
+    exclude: Iterable[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Stream records to ``target`` (path or binary stream) as a JSON array."""
+    encode = get_encoder(backend)
+    excluded = frozenset(exclude)
+    encoded = (encode(record_to_obj(r, excluded), pretty) for r in records)
+    return write_encoded(encoded, target, pretty, chunk_size)
+
+
+def write_encoded(
+    items: Iterable[bytes],
+    target: Union[Path, str, BinaryIO],
+    pretty: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Write already-encoded JSON values to ``target`` as a JSON array."""
+    if isinstance(target, (str, Path)):
+        with open(target, "wb") as f:
+            return write_encoded(items, f, pretty, chunk_size)
+
+    writer = JsonArrayWriter(target, pretty, chunk_size)
+    writer.write_many(items)
+    return writer.close()
+
+
+class JsonArrayWriter:
+    """
+    Incremental `write_encoded()`: encoded values are pushed as they come
+    (e.g. batch by batch from another thread) instead of pulled from one
+    iterable. `close()` ends the array; the stream itself stays open.
+    """
+
+    def __init__(self, target: BinaryIO, pretty: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.target = target
+        self.pretty = pretty
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._buf: list[bytes] = []
+
+    def write_many(self, items: Iterable[bytes]) -> None:
+        pretty, buf, target = self.pretty, self._buf, self.target
+        sep = b",\n  " if pretty else b",\n"
+        limit = 2 * self.chunk_size
+        count = self.count
+
+        for data in items:
+            if pretty:
+                data = data.replace(b"\n", b"\n  ")
+            buf.append((b"[\n  " if pretty else b"[\n") if count == 0 else sep)
+            buf.append(data)
+            count += 1
+            if len(buf) >= limit:
+                target.write(b"".join(buf))
+                buf.clear()
+        self.count = count
+
+    def close(self) -> int:
+        """Write the closing bracket; returns the number of values written."""
+        self._buf.append(b"\n]" if self.count else b"[]")
+        self.target.write(b"".join(self._buf))
+        self._buf.clear()
+        return self.count
@@ -0,0 +1,54 @@
+"""Tests for the aggregate cube and its upkeep by the change feed."""
+
+import pytest
+
+from src.normalizers import normalize as _normalize
+from src.normalizers.aggregates import ALL, UNMAPPED, AggregateCube
+from src.normalizers.diff import run_snapshot_diff
+
+from .test_diff import RUNS
+
+
+def test_change_feed_keeps_the_cube_in_step(tmp_path, monkeypatch):
+    monkeypatch.setattr(_normalize, "DATA_DIR", tmp_path)
+    cube_path = tmp_path / "normalized" / "changes" / "cube_BR.json"
+    for run in RUNS:
+        run_snapshot_diff(run, "BR")
+        assert AggregateCube.load(cube_path).cube() == AggregateCube().update(run).cube()
+
+
+def test_cube_not_saved_after_the_baseline_swap_is_recounted(tmp_path, monkeypatch):
+    monkeypatch.setattr(_normalize, "DATA_DIR", tmp_path)
+    cube_path = tmp_path / "normalized" / "changes" / "cube_BR.json"
+    run_snapshot_diff(RUNS[0], "BR")
+
+    def crash(self, path):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as m:
+        m.setattr(AggregateCube, "save", crash)
+        with pytest.raises(KeyboardInterrupt):
+            run_snapshot_diff(RUNS[1], "BR")  # baseline swapped, cube still at RUNS[0]
+
+    run_snapshot_diff(RUNS[2], "BR")
+    assert AggregateCube.load(cube_path).cube() == AggregateCube().update(RUNS[2]).cube()
+
+
+def test_cube_rollups():
+    cube = AggregateCube().update(RUNS[1])
+    assert cube.count() == 4
+    assert cube.count("BR", "SP") == 3
+    assert cube.count(specialty="CARD") == 3
+    assert cube.count(specialty="PED") == 1
+    assert cube.count(specialty=UNMAPPED) == 1
+    assert cube.count("BR", ALL, ALL, "SUSPENDED") == 1
+    for record in RUNS[1]:
+        cube.remove(record)
+    assert cube.count() == 0
+
+
+def test_cube_save_and_load(tmp_path):
+    cube = AggregateCube().update(RUNS[1])
+    cube.save(tmp_path / "cube.json")
+    assert AggregateCube.load(tmp_path / "cube.json").cube() == cube.cube()
+    assert AggregateCube.load(tmp_path / "missing.json").cube() == {}
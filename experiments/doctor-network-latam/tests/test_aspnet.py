@@ -0,0 +1,156 @@
+"""Tests for the ASP.NET WebForms session pool."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.utils import aspnet
+from src.utils.aspnet import AspNetSession, AspNetSessionPool, StaleFormError, hidden_fields
+from src.utils.http_client import RateLimitedClient
+
+URL = "https://example.gov/Consulta.aspx"
+FORM = (
+    '<form><input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{state}" />'
+    '<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="ok" />'
+    "{result}</form>"
+)
+
+
+class Form:
+    """A form whose fields are valid for the session that rendered them, until expired."""
+
+    def __init__(self):
+        self.log = []
+        self.sessions = 0
+        self.valid: set[str] = set()
+        self.reject_next = []  # responses returned to the next postbacks
+        self.failing = set()  # queries always answered with HTTP 500
+
+    def page(self, session, result=""):
+        state = f"{session}-{len(self.log)}"
+        self.valid.add(state)
+        return httpx.Response(
+            200, text=FORM.format(state=state, result=result),
+            headers={"Set-Cookie": f"ASP.NET_SessionId={session}; path=/"},
+        )
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.log.append(request.method)
+        if request.method == "GET":
+            self.sessions += 1
+            return self.page(f"s{self.sessions}")
+        if self.reject_next:
+            return self.reject_next.pop(0)
+        form = dict(httpx.QueryParams(request.content.decode()))
+        session = request.headers.get("Cookie", "").partition("=")[2]
+        state = form["__VIEWSTATE"]
+        if state not in self.valid or not state.startswith(session) or form["q"] in self.failing:
+            return httpx.Response(500, text="Validation of viewstate MAC failed.")
+        return self.page(session, f"<p>{form['q']}</p>")
+
+
+def expired():
+    return httpx.Response(302, headers={"Location": "/Error.aspx"})
+
+
+def mock_client(form: Form) -> RateLimitedClient:
+    http = RateLimitedClient(requests_per_minute=60_000)
+    http.client = httpx.AsyncClient(transport=httpx.MockTransport(form.handle))
+    return http
+
+
+def submit_all(form, queries, **session_options):
+    async def go():
+        http = mock_client(form)
+        session = AspNetSession(http, URL, **session_options)
+        try:
+            return [await session.submit({"q": q}) for q in queries], session
+        finally:
+            await http.close()
+    return asyncio.run(go())
+
+
+def test_hidden_fields():
+    assert hidden_fields(FORM.format(state="a&amp;b", result="")) == {
+        "__VIEWSTATE": "a&b", "__EVENTVALIDATION": "ok",
+    }
+
+
+def test_session_reuses_fields_across_postbacks():
+    form = Form()
+    pages, session = submit_all(form, ["1", "2", "3"])
+    assert "<p>1</p>" in pages[0] and "<p>3</p>" in pages[2]
+    assert form.log == ["GET", "POST", "POST", "POST"]
+    assert session.refreshes == 1 and not session.stale
+
+
+def test_fields_older_than_max_age_are_reloaded():
+    form = Form()
+    _, session = submit_all(form, ["1", "2"], max_age=0)
+    assert form.log == ["GET", "POST", "GET", "POST"]
+    assert session.refreshes == 2
+
+    session.fields = {"__VIEWSTATE": "x"}
+    session.max_age, session.loaded_at = 60, time.monotonic()
+    assert not session.stale
+    session.loaded_at -= 61
+    assert session.stale
+
+
+@pytest.mark.parametrize("rejection", [
+    lambda: httpx.Response(500, text="Validation of viewstate MAC failed."),
+    expired,
+    lambda: httpx.Response(200, text="<html>Error</html>"),  # no hidden fields
+])
+def test_rejected_fields_are_reloaded_and_the_query_retried(rejection):
+    form = Form()
+    form.reject_next = [rejection()]
+    pages, session = submit_all(form, ["1", "2"])
+    assert "<p>1</p>" in pages[0]
+    assert form.log == ["GET", "POST", "GET", "POST", "POST"]
+    assert session.refreshes == 2
+
+
+def test_second_rejection_raises():
+    form = Form()
+    form.reject_next = [expired(), expired()]
+    with pytest.raises(StaleFormError, match="after a refresh"):
+        submit_all(form, ["1"])
+    assert form.log == ["GET", "POST", "GET", "POST"]
+
+
+def test_other_errors_are_not_retried():
+    form = Form()
+    form.reject_next = [httpx.Response(404)]
+    with pytest.raises(httpx.HTTPStatusError):
+        submit_all(form, ["1"])
+    assert form.log == ["GET", "POST"]
+
+
+def test_pool_keeps_sessions_apart_and_order(monkeypatch):
+    form = Form()
+    form.failing = {"1020304050"}
+    warnings = []
+    monkeypatch.setattr(aspnet.logger, "warning", warnings.append)
+
+    async def go():
+        http = mock_client(form)
+        pool = AspNetSessionPool(http, URL, size=3)
+
+        async def query(session, q):
+            return (await session.submit({"q": q})).count(f"<p>{q}</p>")
+
+        try:
+            queries = [str(i) for i in range(4)] + ["1020304050"] + [str(i) for i in range(5, 9)]
+            return await pool.map(query, queries), pool
+        finally:
+            await http.close()
+
+    results, pool = asyncio.run(go())
+    # Fields only validate for their own session's cookie; the ID fails twice
+    assert results == [1, 1, 1, 1, None, 1, 1, 1, 1]
+    assert form.sessions == pool.refreshes == 4
+    assert len(warnings) == 1 and "#4" in warnings[0]
+    assert "1020304050" not in warnings[0]  # the query may be a national ID
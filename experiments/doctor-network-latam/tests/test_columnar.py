@@ -0,0 +1,54 @@
+"""Tests for the column-wise normalizer against `normalize_batch()`."""
+
+import pytest
+
+from benchmarks.synthetic import make_raw_records
+from src.collectors.base import DoctorRecord
+from src.collectors.compact import CompactRecord, to_compact
+from src.normalizers.columnar import normalize_batch_columnar
+from src.normalizers.normalize import normalize_batch
+
+
+def raw(license, name="Maria Silva", country="BR", **fields):
+    return {
+        "source_country": country, "source_registry": "CFM" if country == "BR" else "REFEPS",
+        "license_number": license, "full_name": name,
+        "collected_at": "2026-01-01T00:00:00+00:00", **fields,
+    }
+
+
+# Duplicates that only match once normalized, same license in two countries,
+# prefixes, blank and missing optional values, repeated specialties
+EDGE_CASES = [
+    raw(" CRM  1 ", "  dr. maria   silva ", specialties=["cardiologia", "Cardiologia "],
+        status="Ativo", state_region="SP"),
+    raw("CRM 1", "Maria Silva (duplicate)", status="Cancelado"),
+    raw("CRM 1", "Juan Pérez", country="AR", status="Habilitado"),
+    raw("CRM 2", "DRA. ANA COSTA", status="", specialties=[]),
+    raw("CRM 3", "Ana", status="desconhecido", specialties=["Pediatria", " pediatria"],
+        city="Santos"),
+    raw("MN 7", "josé  de la   cruz", country="AR", specialties=["Cirugía Cardíaca"]),
+    raw("CRM 2", "Ana Costa again"),
+]
+
+
+def records(kind):
+    """The edge cases plus synthetic rows, as CompactRecords or DoctorRecords."""
+    rows = EDGE_CASES + make_raw_records(300, duplicate_rate=0.2, with_raw_data=False)
+    make = CompactRecord.from_dict if kind == "compact" else lambda r: DoctorRecord(**r)
+    return [make(dict(r)) for r in rows]
+
+
+def expected(rows):
+    return [to_compact(r) for r in normalize_batch(rows)]
+
+
+@pytest.mark.parametrize("kind", ["compact", "model"])
+@pytest.mark.parametrize("batch_size", [1, 7, 100_000])
+def test_matches_normalize_batch(kind, batch_size):
+    rows = records(kind)
+    assert normalize_batch_columnar(rows, batch_size=batch_size) == expected(rows)
+
+
+def test_empty_input():
+    assert normalize_batch_columnar([]) == []
@@ -0,0 +1,86 @@
+"""Tests for CompactRecord and its conversions to and from DoctorRecord."""
+
+import pickle
+
+import pytest
+
+from src.collectors.base import DoctorRecord, stable_record_id
+from src.collectors.compact import (
+    EMPTY_MAPPING,
+    FIELDS,
+    CompactRecord,
+    RecordBatch,
+    from_plain,
+    replace_fields,
+    to_compact,
+    to_plain,
+)
+
+FULL = {
+    "source_country": "BR", "source_registry": "CFM", "license_number": "CRM-SP 123",
+    "full_name": "Maria Silva", "specialties": ["Cardiologia"], "specialty_codes": ["CARDIOLOGY"],
+    "status": "ACTIVE", "state_region": "SP", "city": "São Paulo",
+    "languages": ["pt", "es"], "contact": {"phone": "11 5555"},
+    "raw_data": {"situacao": "Ativo"}, "collected_at": "2026-01-01T00:00:00+00:00",
+}
+MINIMAL = {
+    "source_country": "AR", "source_registry": "REFEPS", "license_number": "MN 1",
+    "full_name": "Juan Pérez", "collected_at": "2026-01-01T00:00:00+00:00",
+}
+
+
+@pytest.mark.parametrize("data", [FULL, MINIMAL])
+def test_round_trips_through_the_model(data):
+    model = DoctorRecord(**data)
+    compact = CompactRecord.from_dict(data)
+    assert compact.model_dump() == model.model_dump()
+    assert CompactRecord.from_model(model) == compact
+    assert compact.to_model() == model
+    assert to_compact(model) == compact and to_compact(compact) is compact
+
+
+def test_defaults_are_shared_and_id_is_stable():
+    a, b = CompactRecord.from_dict(MINIMAL), CompactRecord.from_dict(MINIMAL)
+    assert a.id == stable_record_id("AR", "REFEPS", "MN 1")
+    assert a.specialties == () and a.specialties is b.specialties
+    assert a.contact is EMPTY_MAPPING and a.raw_data is EMPTY_MAPPING
+    assert a.status == "UNKNOWN"
+    assert CompactRecord.from_dict({**MINIMAL, "id": "given"}).id == "given"
+
+
+def test_missing_required_field():
+    with pytest.raises(TypeError, match="full_name"):
+        CompactRecord(source_country="BR", source_registry="CFM", license_number="1")
+
+
+def test_replace_compacts_changed_fields():
+    record = CompactRecord.from_dict(FULL)
+    changed = record.replace(specialties=["Pediatria"], contact={}, city="Santos")
+    assert (changed.specialties, changed.contact, changed.city) == (
+        ("Pediatria",), EMPTY_MAPPING, "Santos"
+    )
+    assert changed.full_name is record.full_name
+    model = replace_fields(DoctorRecord(**FULL), city="Santos")
+    assert model.city == "Santos" and isinstance(model, DoctorRecord)
+
+
+@pytest.mark.parametrize("data", [FULL, MINIMAL])
+def test_pickle_and_plain_round_trips(data):
+    record = CompactRecord.from_dict(data)
+    assert pickle.loads(pickle.dumps(record)) == record
+    plain = to_plain(record)
+    assert pickle.loads(pickle.dumps(plain)) == plain
+    assert from_plain(plain) == record
+
+
+def test_plain_restores_the_shared_empty_mapping():
+    record = from_plain(to_plain(CompactRecord.from_dict(MINIMAL)))
+    assert record.contact is EMPTY_MAPPING and record.raw_data is EMPTY_MAPPING
+
+
+def test_record_batch_round_trip():
+    records = [CompactRecord.from_dict(FULL), CompactRecord.from_dict(MINIMAL)]
+    batch = RecordBatch.from_records(records)
+    assert len(batch) == 2 and list(batch.columns) == list(FIELDS)
+    assert batch.to_records() == records
+    assert len(RecordBatch.from_records([])) == 0
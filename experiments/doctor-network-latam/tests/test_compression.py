@@ -0,0 +1,61 @@
+"""Tests for compressed export files."""
+
+import gzip
+
+import pytest
+
+from src.exporters import export
+from src.exporters.export import export_csv, export_json, export_jsonl
+from src.utils import compression
+from src.utils.compression import available_compressions, check_compression, compressed_path
+
+from .test_fanout import RECORDS
+
+CODECS = [
+    "gzip",
+    pytest.param("zstd", marks=pytest.mark.skipif(
+        "zstd" not in available_compressions(), reason="zstandard is not installed"
+    )),
+]
+
+
+def decompress(path, codec):
+    if codec == "gzip":
+        return gzip.decompress(path.read_bytes())
+    import zstandard
+
+    # Streamed frames carry no content size, so decompress them as a stream
+    return zstandard.ZstdDecompressor().decompressobj().decompress(path.read_bytes())
+
+
+@pytest.fixture(autouse=True)
+def exports_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORTS_DIR", tmp_path)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize("exporter, name", [
+    (export_json, "doctors.json"), (export_jsonl, "doctors.jsonl"), (export_csv, "doctors.csv"),
+])
+def test_compressed_export_round_trips(codec, exporter, name):
+    plain = exporter(RECORDS, name)
+    packed = exporter(RECORDS, name, compression=codec)
+    assert packed == compressed_path(plain, codec)
+    assert packed.name == name + compression.COMPRESSION_SUFFIXES[codec]
+    assert decompress(packed, codec) == plain.read_bytes()
+    assert packed.stat().st_size < plain.stat().st_size
+
+
+def test_gzip_output_is_reproducible():
+    first = export_jsonl(RECORDS, "doctors.jsonl", compression="gzip").read_bytes()
+    second = export_jsonl(RECORDS, "doctors.jsonl", compression="gzip").read_bytes()
+    assert first == second
+
+
+def test_unknown_or_unavailable_codec(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown compression: brotli"):
+        check_compression("brotli")
+    monkeypatch.setattr(compression, "zstandard", None)
+    with pytest.raises(ValueError, match="zstandard package"):
+        export_csv(RECORDS, "doctors.csv", compression="zstd")
+    check_compression(None)
@@ -0,0 +1,86 @@
+"""Tests for the snapshot change feed between normalized runs."""
+
+import json
+
+from src.collectors.compact import FIELDS, IGNORED_FIELDS, CompactRecord
+from src.normalizers import normalize as _normalize
+from src.normalizers.diff import (
+    apply_change_feed,
+    dedup_key,
+    iter_baseline,
+    run_snapshot_diff,
+    sort_by_key,
+)
+
+
+def record(license, name, status="ACTIVE", state="SP", codes=("CARD",), **fields):
+    return CompactRecord(
+        source_country="BR", source_registry="CFM", license_number=license,
+        full_name=name, status=status, state_region=state, specialty_codes=codes, **fields,
+    )
+
+
+RUNS = [
+    [record("1", "Ana"), record("2", "Bia", codes=()), record("3", "Caio", state="RJ")],
+    [
+        record("1", "Ana", collected_at="2026-02-01T00:00:00", raw_data={"page": 2}),
+        record("2", "Bia", status="SUSPENDED", codes=()),
+        record("3", "Caio", state="RJ", city="Niterói"),
+        record("4", "Davi", codes=("CARD", "PED")),
+    ],
+    [record("4", "Davi", codes=("PED",)), record("5", "Eva", state="RJ")],
+    [],
+]
+
+
+def compared(record):
+    return {name: getattr(record, name) for name in FIELDS if name not in IGNORED_FIELDS}
+
+
+def read_feed(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_feeds_replay_every_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(_normalize, "DATA_DIR", tmp_path)
+    changes_dir = tmp_path / "normalized" / "changes"
+    snapshot = {}
+    for run in RUNS:
+        feed = run_snapshot_diff(run, "BR")
+        apply_change_feed(snapshot, read_feed(feed))
+        expected = dict(sort_by_key(run))
+        assert snapshot.keys() == expected.keys()
+        # Fields the diff ignores keep the value of the run that added the record
+        replayed = {key: compared(r) for key, r in snapshot.items()}
+        assert replayed == {key: compared(r) for key, r in expected.items()}
+        assert dict(iter_baseline(changes_dir / "baseline_BR.json")).keys() == expected.keys()
+
+
+def test_change_ops(tmp_path, monkeypatch):
+    monkeypatch.setattr(_normalize, "DATA_DIR", tmp_path)
+    first = read_feed(run_snapshot_diff(RUNS[0], "BR"))
+    assert [c["op"] for c in first] == ["added"] * 3
+    assert "raw_data" not in first[0]["record"]
+
+    second = read_feed(run_snapshot_diff(RUNS[1], "BR"))
+    by_key = {c["key"]: c for c in second}
+    assert "BR:1" not in by_key  # only collected_at and raw_data changed
+    assert by_key["BR:2"] == {
+        "op": "status_changed", "key": "BR:2", "id": RUNS[1][1].id,
+        "previous_status": "ACTIVE", "changes": {"status": "SUSPENDED"},
+    }
+    assert by_key["BR:3"]["op"] == "updated"
+    assert by_key["BR:3"]["changes"] == {"city": "Niterói"}
+    assert by_key["BR:4"]["op"] == "added"
+
+    third = read_feed(run_snapshot_diff(RUNS[2], "BR"))
+    assert [(c["op"], c["key"]) for c in third] == [
+        ("removed", "BR:1"), ("removed", "BR:2"), ("removed", "BR:3"),
+        ("updated", "BR:4"), ("added", "BR:5"),
+    ]
+
+
+def test_dedup_key_keeps_the_first_record():
+    a, b = record("1", "Ana"), record("1", "Ana Maria")
+    assert dedup_key(a) == "BR:1"
+    assert sort_by_key([a, b]) == [("BR:1", a)]
@@ -0,0 +1,43 @@
+"""Tests for cross-registry entity resolution."""
+
+from src.collectors.compact import CompactRecord
+from src.normalizers.entities import blocking_keys, cluster_assignments, resolve_entities
+
+
+def record(id, country, registry, license, name, specialties=()):
+    return CompactRecord(
+        id=id, source_country=country, source_registry=registry,
+        license_number=license, full_name=name, specialties=specialties,
+    )
+
+
+def test_links_the_same_physician_across_registries():
+    br = record("b", "BR", "CFM", "CRM-SP 1", "María José Silva", ("Cardiologia",))
+    ar = record("a", "AR", "REFEPS", "MN 9", "Maria Jose Silva", ("Cardiología",))
+    other = record("c", "AR", "REFEPS", "MN 10", "Pedro Gómez", ("Pediatría",))
+    clusters = resolve_entities([br, ar, other])
+    assert [c.record_ids for c in clusters] == [["b", "a"]]
+    assert cluster_assignments(clusters)["AR:MN 9"][0] == clusters[0].cluster_id
+
+
+def test_never_pairs_within_one_registry():
+    a = record("a", "BR", "CFM", "CRM-SP 1", "Maria Silva", ("Cardiologia",))
+    b = record("b", "BR", "CFM", "CRM-RJ 2", "Maria Silva", ("Cardiologia",))
+    assert resolve_entities([a, b]) == []
+
+
+def test_pair_first_shared_block_oversized_is_scored_in_another():
+    # 250 BR "Maria Silva" fill the name block past max_block_size; the
+    # AR record still meets its BR twin in the surname + specialty block
+    records = [
+        record(f"b{i}", "BR", "CFM", f"CRM {i}", "Maria Silva",
+               ("Cardiologia",) if i == 0 else ("Pediatria",))
+        for i in range(250)
+    ]
+    records.append(record("a0", "AR", "REFEPS", "MN 1", "Maria Silva", ("Cardiologia",)))
+    shared = blocking_keys(records[0]) & blocking_keys(records[-1])
+    assert len(shared) == 2  # name block (oversized) and specialty block
+
+    clusters = resolve_entities(records, max_block_size=200)
+    assert [(c.record_ids, c.score) for c in clusters] == [(["b0", "a0"], 1.0)]
+    assert clusters == resolve_entities([records[0], records[-1]], max_block_size=200)
@@ -0,0 +1,36 @@
+"""Tests for the spill-to-disk normalizer against `normalize_batch()`."""
+
+import pytest
+
+from src.normalizers import external
+from src.normalizers.external import normalize_batch_external
+
+from .test_columnar import expected, records
+
+# Budget for about three buffered records, so every run spills
+TINY_BUDGET_MB = 3 * external.APPROX_RECORD_BYTES / (1024 * 1024)
+
+
+@pytest.mark.parametrize("kind", ["compact", "model"])
+@pytest.mark.parametrize("budget", [external.DEFAULT_MEMORY_BUDGET_MB, TINY_BUDGET_MB])
+def test_matches_normalize_batch(tmp_path, kind, budget):
+    rows = records(kind)
+    assert normalize_batch_external(rows, budget, spill_dir=tmp_path) == expected(rows)
+    assert list(tmp_path.iterdir()) == []  # scratch runs are cleaned up
+
+
+def test_multi_pass_merge_and_small_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(external, "MAX_MERGE_FAN_IN", 3)
+    monkeypatch.setattr(external, "RUN_BLOCK_SIZE", 2)
+    rows = records("compact")
+    assert normalize_batch_external(rows, TINY_BUDGET_MB, spill_dir=tmp_path) == expected(rows)
+
+
+def test_fits_in_budget_without_spilling(tmp_path, monkeypatch):
+    monkeypatch.setattr(external._RunWriter, "write", lambda *a: pytest.fail("spilled"))
+    rows = records("compact")
+    assert normalize_batch_external(rows, spill_dir=tmp_path) == expected(rows)
+
+
+def test_empty_input(tmp_path):
+    assert normalize_batch_external([], TINY_BUDGET_MB, spill_dir=tmp_path) == []
@@ -0,0 +1,79 @@
+"""Tests for streaming one export to several sinks."""
+
+import contextlib
+import json
+
+import pytest
+
+from src.collectors.compact import CompactRecord
+from src.exporters.cube import CubeSink
+from src.exporters.export import CsvSink, ExportSink, JsonLinesSink, JsonSink, SqliteSink
+from src.exporters.fanout import fan_out, make_sinks
+from src.exporters.postgres import PostgresCopySink
+
+RECORDS = [
+    CompactRecord(source_country="BR", source_registry="CFM", license_number=f"CRM {i}",
+                  full_name=f"Doctor {i}")
+    for i in range(50)
+]
+
+
+class FailingSink(ExportSink):
+    name = "failing"
+
+    def __init__(self, fail_in):
+        super().__init__(None)
+        self.fail_in = fail_in
+        self.calls = []
+
+    def open(self):
+        self.calls.append("open")
+        if self.fail_in == "open":
+            raise OSError("disk full")
+
+    def write(self, batch):
+        self.calls.append("write")
+        if self.fail_in == "write":
+            raise OSError("disk full")
+
+    def close(self):
+        self.calls.append("close")
+
+    def abort(self):
+        self.calls.append("abort")
+
+
+@pytest.mark.parametrize("fail_in", ["open", "write"])
+def test_failed_sink_is_aborted_and_others_finish(tmp_path, fail_in):
+    failing = FailingSink(fail_in)
+    good = JsonLinesSink(tmp_path / "out.jsonl")
+    with pytest.raises(OSError, match="disk full"):
+        fan_out(RECORDS, [failing, good], batch_size=1, queue_depth=1)
+    assert failing.calls == (["open", "abort"] if fail_in == "open"
+                             else ["open", "write", "abort"])
+    lines = (tmp_path / "out.jsonl").read_text().splitlines()
+    assert [json.loads(line)["license_number"] for line in lines] == [
+        r.license_number for r in RECORDS
+    ]
+
+
+@pytest.mark.parametrize("make_sink", [
+    lambda d: JsonSink(d / "missing" / "out.json"),
+    lambda d: JsonLinesSink(d / "missing" / "out.jsonl"),
+    lambda d: CsvSink(d / "missing" / "out.csv"),
+    lambda d: SqliteSink(d / "missing" / "out.db"),
+    lambda d: PostgresCopySink(d / "file.txt"),
+    lambda d: CubeSink(d / "missing" / "cube.json"),
+])
+def test_sinks_abort_after_a_failed_open(tmp_path, make_sink):
+    (tmp_path / "file.txt").write_text("not a directory")
+    sink = make_sink(tmp_path)
+    sink.abort()  # never opened
+    with contextlib.suppress(Exception):
+        sink.open()
+    sink.abort()  # partly (or fully) opened
+
+
+def test_make_sinks_rejects_unknown_formats():
+    with pytest.raises(ValueError, match="Unknown export format: xml"):
+        make_sinks(["json", "xml"])
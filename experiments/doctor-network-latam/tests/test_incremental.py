@@ -0,0 +1,130 @@
+"""Tests for the incremental normalized store."""
+
+import json
+
+import pytest
+
+from src.normalizers import incremental
+from src.normalizers import normalize as _normalize
+from src.normalizers.incremental import NormalizedStore, run_incremental_normalization
+from src.utils.json_stream import iter_json_array
+
+
+def raw(country, license, name, collected_at="2026-01-01T00:00:00+00:00", status="Ativo"):
+    return {
+        "source_country": country,
+        "source_registry": "CFM" if country == "BR" else "REFEPS",
+        "license_number": license, "full_name": name, "status": status,
+        "collected_at": collected_at,
+    }
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_normalize, "DATA_DIR", tmp_path)
+    for country in ("BR", "AR"):
+        (tmp_path / "raw" / country).mkdir(parents=True)
+    return tmp_path
+
+
+def write_raw(data_dir, country, name, rows):
+    path = data_dir / "raw" / country / name
+    path.write_text(json.dumps(rows), encoding="utf-8")
+    return path
+
+
+def snapshot(data_dir, suffix):
+    return {r["license_number"]: r for r in iter_json_array(
+        data_dir / "normalized" / f"doctors_{suffix}.json"
+    )}
+
+
+def test_only_new_files_are_folded(data_dir):
+    write_raw(data_dir, "BR", "BR_1.json", [raw("BR", "CRM 1", "Maria Silva")])
+    with NormalizedStore.default() as store:
+        assert len(run_incremental_normalization(store=store)) == 1
+        assert store.version == 1
+        assert store.pending_files(_normalize._raw_files()) == []
+        write_raw(data_dir, "AR", "AR_1.json", [raw("AR", "MN 2", "Juan Pérez")])
+        assert [f.name for f, _ in store.pending_files(_normalize._raw_files())] == ["AR_1.json"]
+        assert len(run_incremental_normalization(store=store)) == 2
+        assert store.version == 2
+
+
+def test_latest_collected_at_wins(data_dir):
+    write_raw(data_dir, "BR", "BR_1.json", [
+        raw("BR", "CRM 1", "Maria Silva", "2026-02-01T00:00:00+00:00", "Ativo"),
+    ])
+    write_raw(data_dir, "BR", "BR_2.json", [
+        raw("BR", "CRM 1", "Maria Silva", "2026-01-01T00:00:00+00:00", "Cancelado"),
+    ])
+    (record,) = run_incremental_normalization()
+    assert record.status == "ACTIVE"  # the older file folded later doesn't win
+
+
+def test_fold_file_counts_only_stored_keys(data_dir):
+    newer = raw("BR", "CRM 1", "Maria Silva", "2026-02-01T00:00:00+00:00")
+    older = raw("BR", "CRM 1", "Maria Silva", "2026-01-01T00:00:00+00:00", "Cancelado")
+    first = write_raw(data_dir, "BR", "BR_1.json", [newer])
+    second = write_raw(data_dir, "BR", "BR_2.json", [older, raw("BR", "CRM 2", "Ana Costa")])
+    with NormalizedStore.default() as store:
+        assert store.fold_file(first, "a", _normalize.iter_file_records(first)) == 1
+        # CRM 1 loses to the stored, later record; only CRM 2 is stored
+        assert store.fold_file(second, "b", _normalize.iter_file_records(second)) == 1
+
+
+def test_rewritten_file_drops_keys_it_no_longer_has(data_dir):
+    write_raw(data_dir, "BR", "BR_1.json", [
+        raw("BR", "CRM 1", "Maria Silva"), raw("BR", "CRM 2", "Ana Costa"),
+    ])
+    write_raw(data_dir, "BR", "BR_2.json", [raw("BR", "CRM 3", "João Souza")])
+    run_incremental_normalization()
+    write_raw(data_dir, "BR", "BR_1.json", [raw("BR", "CRM 1", "Maria Silva")])
+    records = run_incremental_normalization()
+    assert [r.license_number for r in records] == ["CRM 1", "CRM 3"]
+    assert set(snapshot(data_dir, "all")) == {"CRM 1", "CRM 3"}
+
+
+def test_copied_file_is_not_folded_again(data_dir):
+    rows = [raw("BR", "CRM 1", "Maria Silva")]
+    write_raw(data_dir, "BR", "BR_1.json", rows)
+    run_incremental_normalization()
+    write_raw(data_dir, "BR", "BR_copy.json", rows)
+    with NormalizedStore.default() as store:
+        assert store.pending_files(_normalize._raw_files()) == []
+        assert store.version == 1
+
+
+def test_snapshot_of_other_suffix_is_refreshed(data_dir):
+    write_raw(data_dir, "BR", "BR_1.json", [raw("BR", "CRM 1", "Maria Silva")])
+    run_incremental_normalization()  # --country all
+    write_raw(data_dir, "BR", "BR_2.json", [raw("BR", "CRM 2", "Ana Costa")])
+    run_incremental_normalization("BR")  # folds BR_2, writes doctors_BR.json only
+    assert set(snapshot(data_dir, "BR")) == {"CRM 1", "CRM 2"}
+
+    run_incremental_normalization()  # nothing pending, but doctors_all.json is stale
+    assert set(snapshot(data_dir, "all")) == {"CRM 1", "CRM 2"}
+
+
+def test_unchanged_snapshot_is_not_rewritten(data_dir, monkeypatch):
+    write_raw(data_dir, "BR", "BR_1.json", [raw("BR", "CRM 1", "Maria Silva")])
+    run_incremental_normalization()
+    writes = []
+    original = NormalizedStore.write_snapshot
+    monkeypatch.setattr(NormalizedStore, "write_snapshot",
+                        lambda self, *a: writes.append(a) or original(self, *a))
+    run_incremental_normalization()
+    assert writes == []
+
+    # Replaced by someone else: written again
+    (data_dir / "normalized" / "doctors_all.json").write_text("[]")
+    run_incremental_normalization()
+    assert len(writes) == 1
+    assert set(snapshot(data_dir, "all")) == {"CRM 1"}
+
+
+def test_file_digest_matches_content(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.write_bytes(b"x" * (incremental.HASH_CHUNK_SIZE + 3))
+    b.write_bytes(b"x" * (incremental.HASH_CHUNK_SIZE + 3))
+    assert incremental.file_digest(a) == incremental.file_digest(b)
@@ -0,0 +1,44 @@
+"""Tests for the incremental JSON array reader."""
+
+import json
+
+import pytest
+
+from src.utils.json_stream import batched, iter_json_array
+
+DOCUMENT = [1.5, 2, -3e5, 1e-7, "a, ]", {"x": [1.25, None]}, True, 0.0, 12345678901234]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 16, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_values_split_at_any_chunk_boundary(tmp_path, chunk_size, indent):
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(DOCUMENT, indent=indent), encoding="utf-8")
+    assert list(iter_json_array(path, chunk_size)) == DOCUMENT
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+def test_float_split_after_the_point(tmp_path, chunk_size):
+    path = tmp_path / "doc.json"
+    path.write_text("[1.5, 2]", encoding="utf-8")
+    assert list(iter_json_array(path, chunk_size)) == [1.5, 2]
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ ]  ", "\n[\n]\n"])
+def test_empty_array(tmp_path, text):
+    path = tmp_path / "doc.json"
+    path.write_text(text, encoding="utf-8")
+    assert list(iter_json_array(path, 1)) == []
+
+
+@pytest.mark.parametrize("text", ["[1, 2", "[1.5", '{"a": 1}', "[1 2]"])
+@pytest.mark.parametrize("chunk_size", [1, 1 << 20])
+def test_malformed_documents_raise(tmp_path, text, chunk_size):
+    path = tmp_path / "doc.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, chunk_size))
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
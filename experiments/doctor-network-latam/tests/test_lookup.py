@@ -0,0 +1,111 @@
+"""Tests for the lookup service and its HTTP endpoints."""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from src.collectors.compact import CompactRecord
+from src.service.lookup import LookupServer, LookupService
+
+
+def doctor(country, license, name, **fields):
+    return CompactRecord(
+        source_country=country, source_registry="CFM" if country == "BR" else "REFEPS",
+        license_number=license, full_name=name, raw_data={"page": 1}, **fields,
+    ).model_dump()
+
+
+DOCTORS = [
+    doctor("BR", "CRM 1", "María José da Silva", status="ACTIVE"),
+    doctor("AR", "CRM 1", "Juan Pérez"),
+    doctor("BR", "CRM 2", "Mariana Silveira"),
+    doctor("BR", "CRM 3", "José Souza"),
+]
+
+
+def write_snapshot(path, doctors):
+    path.write_text(json.dumps(doctors, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def service(tmp_path):
+    snapshot = tmp_path / "doctors_all.json"
+    write_snapshot(snapshot, DOCTORS)
+    return LookupService(snapshot)
+
+
+@pytest.fixture
+def client(service):
+    server = LookupServer(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{server.server_port}") as client:
+            yield client
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def licenses(response):
+    return [(r["source_country"], r["license_number"]) for r in response.json()]
+
+
+def test_doctor_by_id(client):
+    response = client.get(f"/doctors/{DOCTORS[0]['id']}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["full_name"] == "María José da Silva" and "raw_data" not in body
+    assert client.get("/doctors/no-such-id").status_code == 404
+
+
+def test_license(client):
+    assert licenses(client.get("/license/CRM%201")) == [("BR", "CRM 1"), ("AR", "CRM 1")]
+    assert licenses(client.get("/license/ CRM  1 ", params={"country": "AR"})) == [("AR", "CRM 1")]
+    response = client.get("/license/CRM%201", params={"country": "CL"})
+    assert (response.status_code, response.json()) == (404, {"error": "not found"})
+
+
+def test_search_by_name_prefix(client):
+    assert licenses(client.get("/search", params={"q": "mari sil"})) == [
+        ("BR", "CRM 1"), ("BR", "CRM 2"),
+    ]
+    jose = [("BR", "CRM 1"), ("BR", "CRM 3")]
+    assert licenses(client.get("/search", params={"q": "JOSE"})) == jose
+    assert licenses(client.get("/search", params={"q": "jose", "limit": "1"})) == [("BR", "CRM 1")]
+    response = client.get("/search", params={"q": "zzz"})
+    assert (response.status_code, response.json()) == (200, [])
+
+
+@pytest.mark.parametrize("path, status, error", [
+    ("/search?q=maria&limit=many", 400, "limit must be an integer"),
+    ("/search", 404, "unknown endpoint"),
+    ("/doctors/", 404, "unknown endpoint"),
+    ("/nope", 404, "unknown endpoint"),
+])
+def test_bad_requests(client, path, status, error):
+    response = client.get(path)
+    assert (response.status_code, response.json()) == (status, {"error": error})
+
+
+def test_health_and_cache(client):
+    client.get("/search", params={"q": "maria"})
+    client.get("/search", params={"q": "maria"})
+    body = client.get("/health").json()
+    assert (body["status"], body["records"]) == ("ok", 4)
+    assert body["snapshot"].endswith("doctors_all.json")
+    assert (body["cache"]["hits"], body["cache"]["misses"]) == (1, 1)
+
+
+def test_reload_swaps_the_snapshot_and_keeps_it_on_failure(service, client):
+    write_snapshot(service.snapshot, DOCTORS[:1])
+    assert service.reload()
+    assert client.get("/health").json()["records"] == 1
+    assert client.get("/license/CRM%203").status_code == 404
+
+    service.snapshot.write_text("[{broken", encoding="utf-8")
+    assert not service.reload()
+    assert client.get("/health").json()["records"] == 1
@@ -0,0 +1,42 @@
+"""Tests for the memoized, interning normalizers."""
+
+from src.collectors.compact import CompactRecord
+from src.normalizers import normalize as N
+
+
+def test_cache_stats_count_hits_and_clear():
+    N.clear_normalization_caches()
+    for _ in range(3):
+        N.normalize_status("BR", "Ativo")
+    stats = N.normalization_cache_stats()
+    assert set(stats) == {"status", "specialty", "taxonomy", "intern"}
+    assert (stats["status"]["hits"], stats["status"]["misses"]) == (2, 1)
+    assert stats["status"]["hit_rate"] == 2 / 3
+
+    N.clear_normalization_caches()
+    assert N.normalization_cache_stats()["status"]["size"] == 0
+
+
+def test_memoized_normalizers_match_their_uncached_versions():
+    N.clear_normalization_caches()
+    for status in ("Ativo", " ATIVO ", "Cancelado", "", "desconhecido"):
+        assert N.normalize_status("BR", status) == N.normalize_status.__wrapped__("BR", status)
+    for specialty in ("cardiologia", " Cardiologia ", ""):
+        cleaned = specialty.strip().title()
+        assert N._clean_specialty(specialty) == (cleaned, cleaned.lower())
+
+
+def test_low_cardinality_values_are_shared():
+    def row(license):
+        # Fresh, equal string objects per record, as a JSON parser returns them
+        text = "".join
+        return CompactRecord.from_dict({
+            "source_country": "BR", "source_registry": text(["C", "FM"]),
+            "license_number": license, "full_name": "Ana", "city": text(["San", "tos"]),
+            "state_region": text(["S", "P"]), "specialties": [text(["pedi", "atria"])],
+        })
+
+    a, b = N.normalize_batch([row("CRM 1"), row("CRM 2")])
+    for name in ("source_registry", "city", "state_region"):
+        assert getattr(a, name) is getattr(b, name)
+    assert a.specialties[0] is b.specialties[0]
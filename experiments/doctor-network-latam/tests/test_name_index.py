@@ -0,0 +1,72 @@
+"""Tests for the trigram name index."""
+
+import numpy as np
+import pytest
+
+from src.collectors.compact import CompactRecord
+from src.normalizers import name_index
+from src.normalizers.name_index import (
+    NameTrigramIndex,
+    build_name_index,
+    search_key,
+    similarity,
+)
+
+NAMES = [
+    "Maria Jose da Silva", "Silva, María José", "Dra. M. José Silva", "João Pedro Souza",
+    "Joao Souza", "Ana Paula Costa", "Pedro Gómez", "Maria Silva", "Mariana Silveira",
+]
+
+
+def records(names):
+    return [
+        CompactRecord(source_country="BR", source_registry="CFM", license_number=str(i),
+                      full_name=name)
+        for i, name in enumerate(names)
+    ]
+
+
+def brute_force(index, name, limit, threshold):
+    key = search_key(name)
+    scored = [(round(similarity(key, k), 4), -i) for i, k in enumerate(index.keys)]
+    ranked = sorted((s for s in scored if s[0] >= threshold), reverse=True)[:limit]
+    return [(index.record_ids[-i], s) for s, i in ranked]
+
+
+def test_search_keys_fold_accents_titles_and_punctuation():
+    assert search_key("Dra. María José") == "maria jose"
+    assert search_key("SILVA, João") == "silva joao"
+    assert similarity("maria jose silva", "silva maria jose") == 1.0
+
+
+@pytest.mark.parametrize("query", ["maria jose silva", "Joao Souza", "Pedro", "Zé", "xyz"])
+@pytest.mark.parametrize("threshold", [0.1, 0.3, 0.6])
+@pytest.mark.parametrize("dense_ratio", [0, 1 << 30])  # sparse / dense counting
+def test_search_matches_brute_force_scoring(query, threshold, dense_ratio, monkeypatch):
+    monkeypatch.setattr(name_index, "DENSE_COUNT_RATIO", dense_ratio)
+    index = build_name_index(records(NAMES))
+    found = [(m.record_id, m.score) for m in index.search(query, 5, threshold)]
+    assert found == brute_force(index, query, 5, threshold)
+
+
+def test_search_work_is_sized_by_the_postings_read(monkeypatch):
+    # The only match sits at a high position: no pass over an array as long
+    # as the index is made
+    names = [f"Nome {i:05d} Qualquer" for i in range(20_000)] + ["Wolfgang Amadeus"]
+    index = build_name_index(records(names))
+
+    def dense(*args, **kwargs):
+        raise AssertionError("dense pass over the index")
+
+    monkeypatch.setattr(np, "bincount", dense)
+    monkeypatch.setattr(np, "flatnonzero", dense)
+    (match,) = index.search("Wolfgang Amadeus")
+    assert match.record_id == records(names)[-1].id and match.score == 1.0
+
+
+def test_save_and_load(tmp_path):
+    index = build_name_index(records(NAMES))
+    index.save(tmp_path / "names.db")
+    loaded = NameTrigramIndex.load(tmp_path / "names.db")
+    assert loaded.keys == index.keys
+    assert loaded.search("maria silva") == index.search("maria silva")
@@ -0,0 +1,43 @@
+"""Tests for loading and normalizing raw collector output."""
+
+import json
+
+import pytest
+
+from src.normalizers import normalize as _normalize
+from src.normalizers.normalize import iter_raw_records
+
+
+def raw(license, name="Maria Silva", status="Ativo", **fields):
+    return {
+        "source_country": "BR", "source_registry": "CFM", "license_number": license,
+        "full_name": name, "status": status, **fields,
+    }
+
+
+@pytest.fixture
+def raw_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_normalize, "DATA_DIR", tmp_path)
+    directory = tmp_path / "raw" / "BR"
+    directory.mkdir(parents=True)
+    return directory
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize("compact", [False, True])
+def test_file_truncated_mid_array_is_skipped_whole(raw_dir, trusted, compact):
+    (raw_dir / "BR_1.json").write_text(json.dumps([raw("1"), raw("2")]))
+    text = json.dumps([raw(str(i)) for i in range(10, 40)], indent=2)
+    (raw_dir / "BR_2.json").write_text(text[:len(text) // 2])
+    (raw_dir / "BR_3.json").write_text(json.dumps([raw("3")]))
+
+    records = list(iter_raw_records("BR", trusted=trusted, batch_size=4, compact=compact))
+    assert [r.license_number for r in records] == ["1", "2", "3"]
+
+
+def test_file_invalid_partway_is_skipped_whole(raw_dir):
+    rows = [raw(str(i)) for i in range(10)] + [{"full_name": "no license"}]
+    (raw_dir / "BR_1.json").write_text(json.dumps(rows))
+    (raw_dir / "BR_2.json").write_text(json.dumps([raw("3")]))
+    records = list(iter_raw_records("BR", batch_size=4))
+    assert [r.license_number for r in records] == ["3"]
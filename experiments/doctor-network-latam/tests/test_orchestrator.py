@@ -0,0 +1,33 @@
+"""Tests for the command-line options of the orchestrator."""
+
+import sys
+
+import pytest
+
+import orchestrator
+
+
+@pytest.mark.parametrize("flags", [
+    ["--memory-budget", "64", "--workers", "2"],
+    ["--memory-budget", "64", "--columnar"],
+    ["--incremental", "--memory-budget", "64"],
+    ["--incremental", "--workers", "2"],
+    ["--incremental", "--columnar"],
+])
+def test_conflicting_normalizer_options_are_rejected(flags, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["orchestrator.py", "--normalize-only", *flags])
+    monkeypatch.setattr(orchestrator, "run_normalization", pytest.fail)
+    monkeypatch.setattr(orchestrator, "run_incremental_normalization", pytest.fail)
+    with pytest.raises(SystemExit) as exit:
+        orchestrator.main()
+    assert exit.value.code == 2
+    assert "can't be combined" in capsys.readouterr().err
+
+
+def test_unknown_export_format_is_rejected(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["orchestrator.py", "--normalize-only", "--export", "json,xml"])
+    monkeypatch.setattr(orchestrator, "run_normalization", pytest.fail)
+    with pytest.raises(SystemExit) as exit:
+        orchestrator.main()
+    assert exit.value.code == 2
+    assert "unknown --export format(s): xml" in capsys.readouterr().err
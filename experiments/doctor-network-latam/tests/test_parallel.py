@@ -0,0 +1,35 @@
+"""Tests for the sharded multi-process normalizer against `normalize_batch()`."""
+
+import multiprocessing as mp
+
+import pytest
+
+from src.collectors.compact import to_compact
+from src.normalizers import parallel
+from src.normalizers.parallel import normalize_batch_parallel, shard_of
+
+from .test_columnar import expected, records
+
+
+@pytest.mark.parametrize("kind", ["compact", "model"])
+@pytest.mark.parametrize("workers", [1, 2, 3])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_matches_normalize_batch(kind, workers, columnar):
+    rows = records(kind)
+    out = normalize_batch_parallel(rows, workers=workers, columnar=columnar)
+    assert [to_compact(r) for r in out] == expected(rows)
+
+
+def test_shards_are_pickled_without_fork(monkeypatch):
+    monkeypatch.setattr(parallel, "_mp_context", lambda: mp.get_context("spawn"))
+    rows = records("compact")
+    assert normalize_batch_parallel(rows, workers=2) == expected(rows)
+
+
+def test_empty_input():
+    assert normalize_batch_parallel([], workers=2) == []
+
+
+def test_shard_of_is_stable():
+    assert shard_of("BR:CRM 1", 8) == shard_of("BR:CRM 1", 8)
+    assert {shard_of(f"BR:CRM {i}", 8) for i in range(100)} == set(range(8))
@@ -0,0 +1,67 @@
+"""Tests for the partitioned Parquet export."""
+
+from datetime import datetime
+
+import pytest
+
+from src.collectors.compact import CompactRecord
+from src.exporters import export, parquet
+from src.exporters.parquet import ParquetSink, export_parquet
+
+RECORDS = [
+    CompactRecord(
+        source_country=country, source_registry="CFM" if country == "BR" else "REFEPS",
+        license_number=f"{country} {i}", full_name=f"Doctor {i}",
+        status="ACTIVE" if i % 3 else "SUSPENDED/REVIEW",
+        specialties=["Cardiologia", "Pediatria"][: i % 3], state_region="SP" if i % 2 else None,
+        contact={"phone": str(i)} if i % 4 == 0 else {},
+        collected_at="2026-01-01T12:00:00+00:00",
+    )
+    for country in ("BR", "AR")
+    for i in range(12)
+]
+
+
+@pytest.fixture(autouse=True)
+def exports_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORTS_DIR", tmp_path)
+
+
+def test_dataset_round_trips_by_partition():
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = export_parquet(RECORDS, "doctors.parquet")
+    parts = sorted(str(p.relative_to(path)) for p in path.rglob("*.parquet"))
+    assert parts == [
+        "source_country=AR/status=ACTIVE/part-00000.parquet",
+        "source_country=AR/status=SUSPENDED%2FREVIEW/part-00000.parquet",
+        "source_country=BR/status=ACTIVE/part-00000.parquet",
+        "source_country=BR/status=SUSPENDED%2FREVIEW/part-00000.parquet",
+    ]
+
+    rows = {}
+    for part in path.rglob("*.parquet"):
+        for row in pq.read_table(part).to_pylist():
+            rows[row["id"]] = row
+    assert len(rows) == len(RECORDS)
+    for record in RECORDS:
+        row = rows[record.id]
+        assert row["specialties"] == list(record.specialties)
+        assert row["state_region"] == record.state_region
+        assert row["contact"] == (f'{{"phone": "{record.contact["phone"]}"}}'
+                                  if record.contact else None)
+        assert row["collected_at"] == datetime.fromisoformat(record.collected_at)
+
+
+def test_partitions_are_written_in_row_groups():
+    pq = pytest.importorskip("pyarrow.parquet")
+    sink = ParquetSink(export.EXPORTS_DIR / "doctors.parquet", row_group_size=5)
+    path = export.run_sink(sink, RECORDS * 3)
+    part = pq.ParquetFile(path / "source_country=BR" / "status=ACTIVE" / "part-00000.parquet")
+    assert (part.metadata.num_rows, part.metadata.num_row_groups) == (24, 5)
+
+
+def test_needs_pyarrow(monkeypatch):
+    monkeypatch.setattr(parquet, "pa", None)
+    assert not parquet.parquet_available()
+    with pytest.raises(ValueError, match="pyarrow"):
+        export_parquet(RECORDS)
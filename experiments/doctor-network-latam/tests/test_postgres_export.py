@@ -0,0 +1,94 @@
+"""Tests for the Postgres COPY export and its offline verifier."""
+
+import hashlib
+import json
+
+import pytest
+
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+from src.exporters.postgres import (
+    array_literal,
+    copy_escape,
+    copy_unescape,
+    export_postgres,
+    parse_array_literal,
+    verify_copy_export,
+)
+
+AWKWARD = ["plain", "tab\there", "new\nline", "cr\rhere", "back\\slash", 'quo"te',
+           "comma, brace}", "{braced}", "NULL", "\\N", "ümlaut ñ", ""]
+
+
+def records(n=25):
+    return [
+        CompactRecord(
+            source_country="BR", source_registry="CFM", license_number=f"CRM {i}",
+            full_name=AWKWARD[i % len(AWKWARD)] or "Sem Nome",
+            specialties=tuple(AWKWARD[i % 4:i % 4 + 3]),
+            city=None if i % 3 else AWKWARD[i % len(AWKWARD)],
+            contact={"phone": "+55\t11"} if i % 5 == 0 else {},
+            collected_at="2026-01-01T00:00:00+00:00",
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def exports_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORTS_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("value", AWKWARD)
+def test_escapes_round_trip(value):
+    assert copy_unescape(copy_escape(value)) == value
+    assert "\t" not in copy_escape(value) and "\n" not in copy_escape(value)
+    assert parse_array_literal(array_literal((value, value))) == [value, value]
+
+
+def test_null_is_distinct_from_the_string():
+    assert copy_unescape(copy_escape(None)) is None
+    assert copy_unescape(copy_escape("\\N")) == "\\N"
+    assert parse_array_literal(array_literal(())) == []
+
+
+@pytest.mark.parametrize("text", ["", "{", '{"a"', '{"a",}x', "{a}", '{"a" "b"}'])
+def test_malformed_array_literals_are_rejected(text):
+    with pytest.raises(ValueError):
+        parse_array_literal(text)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 100])
+def test_export_verifies_against_its_records(exports_dir, chunk_rows):
+    out = export_postgres(records(), "pg", chunk_rows=chunk_rows)
+    manifest = json.loads((out / "manifest.json").read_text())
+    assert len(manifest["chunks"]) == -(-25 // chunk_rows)
+    assert verify_copy_export(out, records()) == 25
+    assert (out / "load.sql").read_text().count("\\copy doctors FROM") == len(manifest["chunks"])
+
+
+def test_verifier_catches_corruption(exports_dir):
+    out = export_postgres(records(), "pg", chunk_rows=10)
+    chunk = out / "doctors_00000.copy"
+    data = chunk.read_bytes()
+
+    chunk.write_bytes(data.replace(b"CRM 1\t", b"CRM 9\t", 1))
+    with pytest.raises(ValueError, match="checksum"):
+        verify_copy_export(out)
+
+    # A consistent manifest still doesn't make a row match its record
+    manifest = json.loads((out / "manifest.json").read_text())
+    manifest["chunks"][0]["sha256"] = hashlib.sha256(chunk.read_bytes()).hexdigest()
+    (out / "manifest.json").write_text(json.dumps(manifest))
+    assert verify_copy_export(out) == 25
+    with pytest.raises(ValueError, match="license_number differs"):
+        verify_copy_export(out, records())
+
+
+def test_verifier_catches_missing_records(exports_dir):
+    out = export_postgres(records(), "pg")
+    with pytest.raises(ValueError, match="unexpected id|records given"):
+        verify_copy_export(out, records()[:-1])
+    with pytest.raises(ValueError, match="records given"):
+        verify_copy_export(out, records(26))
@@ -0,0 +1,26 @@
+"""Tests for the raw payload side store."""
+
+from src.utils.raw_store import RawStore
+
+
+def test_payloads_are_read_back_by_id(tmp_path):
+    store = RawStore(tmp_path / "BR")
+    assert store.put_many([("a", {"crm": "1"}), ("b", {}), ("c", {"nome": "José"})]) == 2
+    assert store.get("a") == {"crm": "1"}
+    assert store.get("b") is None  # empty payloads aren't stored
+    assert "c" in store and len(store) == 2
+
+    reopened = RawStore(tmp_path / "BR")
+    found = dict(reopened.get_many(["c", "a", "missing"]))
+    assert found == {"a": {"crm": "1"}, "c": {"nome": "José"}}
+
+
+def test_latest_write_wins_and_torn_index_lines_are_skipped(tmp_path):
+    store = RawStore(tmp_path / "AR")
+    store.put_many([("a", {"v": 1})])
+    store.put_many([("a", {"v": 2})])
+    with open(store.index_path, "a", encoding="utf-8") as idx:
+        idx.write("b\t123")  # interrupted append
+    reopened = RawStore(tmp_path / "AR")
+    assert reopened.get("a") == {"v": 2}
+    assert "b" not in reopened
@@ -0,0 +1,46 @@
+"""Tests for parsing RETHUS consultation results."""
+
+import hashlib
+
+from benchmarks.bench_rethus_sessions import PAGE, PERSON
+from src.collectors.colombia_rethus import ColombiaRETHUSCollector
+
+
+def result_page(programs):
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{c}</td>" for c in program) + "</tr>" for program in programs
+    )
+    return PAGE.format(viewstate="v", validation="e", results=PERSON.format(
+        doc_type="CC", number="1020304050", first="Ana María", last="Gómez Ruiz",
+        status="Registrado", programs=rows,
+    ))
+
+
+def parse(page):
+    collector = ColombiaRETHUSCollector({})
+    return collector._parse_results(page, "CC", "1020304050")
+
+
+def test_license_is_the_registration_act_and_the_id_is_hashed():
+    (record,) = parse(result_page([
+        ["UNIVERSITARIO", "LOCAL", "Medicina", "01/02/2010", "12345 DE 2010", "SDS"],
+        ["ESPECIALIZACION", "LOCAL", "Pediatría", "03/04/2015", "6789 DE 2015", "SDS"],
+    ]))
+    assert record.license_number == "12345 DE 2010"
+    assert record.full_name == "Ana María Gómez Ruiz"
+    assert record.specialties == ["Medicina", "Pediatría"]
+    assert record.status == "Registrado"
+    assert record.raw_data["identificacion_sha256"] == hashlib.sha256(
+        b"CC:1020304050"
+    ).hexdigest()
+    assert "1020304050" not in str(record.model_dump())
+
+
+def test_without_an_act_the_record_is_keyed_by_the_id_hash():
+    (record,) = parse(result_page([["UNIVERSITARIO", "LOCAL", "Medicina"]]))
+    assert record.license_number.startswith("ID-")
+    assert "1020304050" not in str(record.model_dump())
+
+
+def test_unregistered_identification():
+    assert parse(PAGE.format(viewstate="v", validation="e", results="<p>Sin resultados</p>")) == []
@@ -0,0 +1,81 @@
+"""Tests for streaming record serialization and its encoder backends."""
+
+import io
+import json
+
+import pytest
+
+from src.collectors.base import DoctorRecord
+from src.collectors.compact import CompactRecord
+from src.utils.serialize import (
+    JsonArrayWriter,
+    available_encoders,
+    get_encoder,
+    write_encoded,
+    write_records,
+)
+
+from .test_compact import FULL, MINIMAL
+
+needs_orjson = pytest.mark.skipif(
+    "orjson" not in available_encoders(), reason="orjson is not installed"
+)
+BACKENDS = ["json", pytest.param("orjson", marks=needs_orjson)]
+
+
+def dumped(records):
+    return [DoctorRecord(**r).model_dump() for r in records]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("pretty", [False, True])
+def test_records_round_trip(tmp_path, backend, pretty):
+    records = [CompactRecord.from_dict(FULL), DoctorRecord(**MINIMAL)] * 3
+    target = tmp_path / "out.json"
+    assert write_records(records, target, pretty, backend, chunk_size=2) == 6
+    assert json.loads(target.read_text(encoding="utf-8")) == dumped([FULL, MINIMAL] * 3)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_pretty_matches_json_dumps_indent(backend):
+    records = [CompactRecord.from_dict(FULL), CompactRecord.from_dict(MINIMAL)]
+    out = io.BytesIO()
+    write_records(records, out, pretty=True, backend=backend)
+    expected = json.dumps(dumped([FULL, MINIMAL]), indent=2, ensure_ascii=False)
+    assert out.getvalue().decode("utf-8") == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_exclude_and_empty(backend):
+    out = io.BytesIO()
+    write_records([CompactRecord.from_dict(FULL)], out, backend=backend, exclude=["raw_data"])
+    (obj,) = json.loads(out.getvalue())
+    assert "raw_data" not in obj and obj["full_name"] == "Maria Silva"
+
+    out = io.BytesIO()
+    assert write_records([], out, backend=backend) == 0
+    assert out.getvalue() == b"[]"
+
+
+@needs_orjson
+def test_backends_write_the_same_bytes():
+    obj = CompactRecord.from_dict(FULL).as_json_obj()
+    assert get_encoder("orjson")(obj, False) == get_encoder("json")(obj, False)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown serialization backend"):
+        get_encoder("yaml")
+
+
+def test_incremental_writer_matches_write_encoded():
+    items = [b'{"a":1}', b'{"b":2}', b'{"c":3}']
+    whole = io.BytesIO()
+    write_encoded(items, whole)
+    out = io.BytesIO()
+    writer = JsonArrayWriter(out, chunk_size=1)
+    writer.write_many(items[:1])
+    writer.write_many(items[1:])
+    assert writer.close() == 3
+    assert out.getvalue() == whole.getvalue()
+    assert json.loads(out.getvalue()) == [{"a": 1}, {"b": 2}, {"c": 3}]
@@ -0,0 +1,99 @@
+"""Tests for refreshing a long-lived SQLite export in place."""
+
+import sqlite3
+
+import pytest
+
+from src.collectors.compact import CompactRecord
+from src.exporters import export
+
+
+def record(license, name, status="ACTIVE", country="BR", collected_at="2026-01-01T00:00:00"):
+    return CompactRecord(
+        source_country=country, source_registry="CFM" if country == "BR" else "REFEPS",
+        license_number=license, full_name=name, status=status,
+        specialties=("Cardiologia",), collected_at=collected_at,
+    )
+
+
+@pytest.fixture
+def exports_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORTS_DIR", tmp_path)
+    return tmp_path
+
+
+def last_run(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(
+            "SELECT inserted, updated, unchanged, deleted FROM export_runs "
+            "ORDER BY run_id DESC LIMIT 1"
+        ).fetchone()
+
+
+def rows(path):
+    with sqlite3.connect(path) as conn:
+        return {
+            license: (status, collected_at, deleted_at)
+            for license, status, collected_at, deleted_at in conn.execute(
+                "SELECT license_number, status, collected_at, deleted_at FROM doctors"
+            )
+        }
+
+
+def test_refresh_counts_inserted_updated_unchanged(exports_dir):
+    path = export.export_sqlite([record("1", "Ana"), record("2", "Bia")], "doctors.db")
+    assert last_run(path) == (2, 0, 0, 0)
+
+    export.export_sqlite(
+        [record("1", "Ana"), record("2", "Bia", "SUSPENDED"), record("3", "Caio")], "doctors.db"
+    )
+    assert last_run(path) == (1, 1, 1, 0)
+
+
+def test_new_collected_at_alone_is_not_a_change(exports_dir):
+    path = export.export_sqlite([record("1", "Ana"), record("2", "Bia")], "doctors.db")
+    later = "2026-02-01T00:00:00"
+    export.export_sqlite(
+        [record("1", "Ana", collected_at=later),
+         record("2", "Bia", "SUSPENDED", collected_at=later)],
+        "doctors.db",
+    )
+    assert last_run(path) == (0, 1, 1, 0)
+    current = rows(path)
+    assert current["1"] == ("ACTIVE", "2026-01-01T00:00:00", None)  # untouched
+    assert current["2"] == ("SUSPENDED", later, None)  # updated with the change
+
+
+def test_missing_rows_are_soft_deleted_and_revived(exports_dir):
+    path = export.export_sqlite(
+        [record("1", "Ana"), record("2", "Bia"), record("9", "Juan", country="AR")], "doctors.db"
+    )
+    export.export_sqlite([record("1", "Ana")], "doctors.db")
+    assert last_run(path) == (0, 0, 1, 1)
+    current = rows(path)
+    assert current["2"][2] is not None
+    assert current["9"][2] is None  # AR was not part of this export
+
+    export.export_sqlite([record("1", "Ana"), record("2", "Bia")], "doctors.db")
+    assert last_run(path) == (0, 1, 1, 0)
+    assert rows(path)["2"][2] is None
+
+
+def test_scope_soft_deletes_countries_absent_from_the_export(exports_dir):
+    path = export.export_sqlite(
+        [record("1", "Ana"), record("9", "Juan", country="AR")], "doctors.db"
+    )
+    export.export_sqlite([record("1", "Ana")], "doctors.db", scope=["BR", "AR"])
+    assert rows(path)["9"][2] is not None
+
+
+def test_search_tables_follow_the_refresh(exports_dir):
+    path = export.export_sqlite([record("1", "José Silva"), record("2", "Bia")], "doctors.db")
+    export.export_sqlite([record("2", "Bia")], "doctors.db")
+    with sqlite3.connect(path) as conn:
+        found = conn.execute(
+            f"SELECT doctor_id FROM {export.SQLITE_FTS_TABLE} WHERE full_name MATCH 'jose'"
+        ).fetchall()
+        specialties = conn.execute("SELECT COUNT(*) FROM doctor_specialties").fetchone()[0]
+    assert found == []
+    assert specialties == 1
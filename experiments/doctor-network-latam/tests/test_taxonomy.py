@@ -0,0 +1,70 @@
+"""Tests for specialty taxonomy reconciliation."""
+
+import pytest
+
+from src.normalizers import taxonomy
+from src.normalizers.taxonomy import (
+    SpecialtyMatcher,
+    SpecialtyTaxonomy,
+    fold,
+    reconcile_specialty_codes,
+    specialty_codes_for,
+)
+
+
+def test_fold_drops_accents_case_and_punctuation():
+    assert fold("  CARDIOLOGÍA - Clínica_Médica ") == "cardiologia clinica medica"
+
+
+@pytest.mark.parametrize("country, specialty, codes", [
+    ("BR", "Cardiologia", ("CARDIOLOGY",)),
+    ("BR", "CARDIOLOGÍA ", ("CARDIOLOGY",)),
+    ("BR", "Cirurgia Cardiovascular", ("CARDIOVASCULAR_SURGERY",)),
+    ("BR", "Pediatria e Cardiologia", ("PEDIATRICS", "CARDIOLOGY")),
+    ("BR", "Cardiologiaa", ()),
+    ("BR", "", ()),
+    # Portuguese synonyms are not used for a Spanish-speaking country...
+    ("AR", "Cirurgia Cardiovascular", ()),
+    ("AR", "Cirugía Cardíaca", ("CARDIOVASCULAR_SURGERY",)),
+    # ...but every synonym is for an unknown one
+    ("MX", "Cirurgia Cardiovascular", ("CARDIOVASCULAR_SURGERY",)),
+])
+def test_specialty_codes(country, specialty, codes):
+    assert specialty_codes_for(country, specialty) == codes
+
+
+def test_matches_on_word_boundaries_leftmost_longest():
+    matcher = SpecialtyMatcher(
+        {"cirugia": "SURGERY", "cirugia cardiaca": "CARDIAC", "cardiaca": "X"}
+    )
+    assert matcher.match("Cirugía Cardíaca") == ["CARDIAC"]
+    assert matcher.match("cirugia general cardiaca") == ["SURGERY", "X"]
+    assert matcher.match("microcirugia") == []
+
+
+def test_reconcile_keeps_order_without_repeats():
+    codes = reconcile_specialty_codes("BR", ["Pediatra", "pediatria", "Clínica Médica"])
+    assert codes == ["PEDIATRICS", "INTERNAL_MEDICINE"]
+
+
+def test_synonym_collision_keeps_first_code(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(taxonomy.logger, "warning", warnings.append)
+    matcher = SpecialtyMatcher(
+        {"Clínica Médica": "INTERNAL_MEDICINE", "clinica medica": "FAMILY_MEDICINE"}
+    )
+    assert matcher.match("CLINICA MEDICA") == ["INTERNAL_MEDICINE"]
+    assert len(warnings) == 1 and "keeping INTERNAL_MEDICINE" in warnings[0]
+
+
+def test_synonym_collision_agrees_with_synonyms_for():
+    table = {
+        "specialties": {
+            "A": {"name": "A", "synonyms": {"es": ["medicina general"]}},
+            "B": {"name": "B", "synonyms": {"es": ["Medicina General", "medicina general"]}},
+        },
+        "country_languages": {"AR": "es"},
+    }
+    tax = SpecialtyTaxonomy(table)
+    assert tax.synonyms_for("AR")["medicina general"] == "A"
+    assert tax.codes("AR", ["Medicina General"]) == ["A"]
@@ -0,0 +1,132 @@
+"""Tests for the SISA WS020 client: envelopes, paging and response parsing."""
+
+import asyncio
+
+import httpx
+import pytest
+from lxml import etree
+
+from benchmarks.bench_refeps_ws020 import ENVELOPE, FAULT, NS, WS_URL, WSDL
+from src.collectors import sisa_ws020
+from src.collectors.sisa_ws020 import Ws020Client, Ws020Error
+from src.utils.http_client import RateLimitedClient
+
+ENDPOINT = "https://sisa.msal.gov.ar/sisa/services/rest/profesional"  # the WSDL's address
+
+
+def profesional(i, especialidades=("Cardiología",)):
+    items = "".join(f"<especialidad>{e}</especialidad>" for e in especialidades)
+    return (
+        f"<profesional><apellido>Pérez</apellido><nombre>Juan {i}</nombre>"
+        f"<matricula>MN {i}</matricula><profesion>Médico</profesion>"
+        f"<especialidades>{items}</especialidades>"
+        f"<jurisdiccion>Córdoba</jurisdiccion><estado>Habilitado</estado></profesional>"
+    )
+
+
+def response(total, rows):
+    body = (f'<ns:buscarProfesionalesResponse xmlns:ns="{NS}"><total>{total}</total>'
+            f"{''.join(rows)}</ns:buscarProfesionalesResponse>")
+    return ENVELOPE.format(body).encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def wsdl_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sisa_ws020, "WSDL_CACHE_DIR", tmp_path)
+
+
+def run(total, requests, page_size=4, wsdl=WSDL, **query):
+    """Search a mock of ``total`` professionals; ``requests`` collects what was sent."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            requests.append(("GET", str(request.url), None))
+            return httpx.Response(200, content=wsdl)
+        envelope = etree.fromstring(request.content)
+        fields = {etree.QName(e).localname: e.text for e in envelope.iter()}
+        requests.append(("POST", str(request.url), dict(request.headers), fields))
+        size, page = int(fields["registros"]), int(fields["pagina"])
+        start = (page - 1) * size
+        rows = [profesional(i) for i in range(start, min(start + size, total))]
+        return httpx.Response(200, content=response(total, rows))
+
+    async def search():
+        http = RateLimitedClient(requests_per_minute=60_000)
+        await http.client.aclose()
+        http.client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        client = Ws020Client(http, WS_URL, "user", "secret", page_size=page_size)
+        try:
+            return await client.search(**query)
+        finally:
+            await http.close()
+
+    return asyncio.run(search())
+
+
+def test_search_builds_envelopes_from_the_wsdl_and_pages():
+    requests = []
+    records = run(10, requests, jurisdiccion="Córdoba")
+    assert [r.license_number for r in records] == [f"MN {i}" for i in range(10)]
+    assert requests[0] == ("GET", f"{WS_URL}?wsdl", None)
+
+    posts = requests[1:]
+    assert sorted(int(p[3]["pagina"]) for p in posts) == [1, 2, 3]
+    method, url, headers, fields = posts[0]
+    assert url == ENDPOINT
+    assert headers["soapaction"] == f'"{NS}#buscarProfesionales"'
+    assert headers["content-type"] == "text/xml; charset=utf-8"
+    assert fields["buscarProfesionales"] is None  # the operation's wrapper element
+    assert (fields["usuario"], fields["clave"], fields["registros"]) == ("user", "secret", "4")
+    assert fields["jurisdiccion"] == "Córdoba"
+
+
+def test_limit_stops_paging():
+    requests = []
+    records = run(10, requests, limit=3)
+    assert len(records) == 3
+    assert [int(p[3]["registros"]) for p in requests[1:]] == [3]
+
+
+def test_cached_wsdl_is_reused():
+    requests = []
+    run(2, requests)
+    run(2, requests)
+    assert [r[0] for r in requests].count("GET") == 1
+
+
+def test_parse_response_maps_profesionales():
+    client = Ws020Client(None, WS_URL, "user", "secret", source_url="https://sisa")
+    total, records = client.parse_response(response(25, [
+        profesional(1, ("Pediatría", "Neonatología")),
+        profesional(2, ()),
+        "<profesional><nombre>Sin</nombre><apellido>Matricula</apellido></profesional>",
+    ]))
+    assert total == 25
+    first, second = records
+    assert (first.license_number, first.full_name) == ("MN 1", "Juan 1 Pérez")
+    assert first.specialties == ["Pediatría", "Neonatología"]
+    assert (first.state_region, first.status, first.source_url) == (
+        "Córdoba", "Habilitado", "https://sisa"
+    )
+    assert first.raw_data["source"] == "ws020"
+    assert second.specialties == ["Médico"]  # falls back to the profession
+
+
+@pytest.mark.parametrize("body, message", [
+    (FAULT.format("Usuario o clave incorrectos").encode(), "Usuario o clave incorrectos"),
+    (ENVELOPE.format("<nada/>").encode(), "no <total>"),
+    (b"<html>Service Unavailable", "Malformed"),
+])
+def test_parse_response_errors(body, message):
+    client = Ws020Client(None, WS_URL, "user", "secret")
+    with pytest.raises(Ws020Error, match=message):
+        client.parse_response(body)
+
+
+def test_wsdl_without_the_assumed_names_is_rejected():
+    wsdl = WSDL.replace(b'"apellido" type="xsd:string" minOccurs="0"', b'"surname"')
+    wsdl = wsdl.replace(b'name="matricula"', b'name="licencia"')
+    requests = []
+    with pytest.raises(Ws020Error, match="missing: request apellido, profesional matricula"):
+        run(2, requests, wsdl=wsdl)
+    assert [r[0] for r in requests] == ["GET"]  # nothing sent to the service